@@ -1,33 +1,174 @@
+import math
 import random
-from board import check_winner, check_draw
+import time
+from board import check_winner, LineTracker
+from transposition import (
+    DEFAULT_CAPACITY,
+    EXACT,
+    LOWER,
+    UPPER,
+    TranspositionTable,
+    get_zobrist_table,
+)
+from symmetry import (
+    get_symmetric_keys,
+    symmetric_hashes,
+    canonical_key,
+    to_canonical_move,
+    from_canonical_move,
+    unique_moves,
+)
+from move_ordering import MoveOrdering
+from evaluation import evaluate_position
+from rollouts import simulate
+from retrograde import WIN, LOSS, load_database
+from candidates import CandidateMoves, get_candidate_moves, uses_candidates
 
-def get_strategic_move(board, player, size):
-    """Gets a strategic move for the computer to block opponent or win."""
+
+DEFAULT_MCTS_PLAYOUTS = 1000
+
+
+class SearchTimeout(Exception):
+    """Raised inside a search when its deadline has passed or it was told to stop."""
+
+
+class SearchContext:
+    """
+    Holds the incremental state shared by every node of one search.
+
+    Besides the line counters it keeps the Zobrist hash of all 8 rotations and
+    reflections of the position, so the transposition table can be keyed by the
+    symmetry-canonical hash and store each equivalent position only once. The
+    move ordering (killer and history tables) can be handed from one context to
+    the next so later searches start with what earlier ones learned. The tracker
+    is built for `win_length` in a row (default: the board size). An optional
+    `SearchStats` collects node, cutoff and depth counts while the search runs, and
+    an optional `EndgameDatabase` answers solved positions without searching them.
+    On large boards it also keeps the `CandidateMoves` near the stones, which are
+    the only moves searched there, and an optional `stop` event cancels the search.
+    """
+
+    __slots__ = (
+        "size",
+        "tracker",
+        "zobrist",
+        "cell_keys",
+        "hashes",
+        "table",
+        "deadline",
+        "ordering",
+        "stats",
+        "database",
+        "candidates",
+        "stop",
+    )
+
+    def __init__(
+        self,
+        board,
+        size,
+        table=None,
+        deadline=None,
+        ordering=None,
+        stats=None,
+        database=None,
+        win_length=None,
+        stop=None,
+    ):
+        self.size = size
+        self.tracker = LineTracker(board, size, win_length)
+        self.zobrist = get_zobrist_table(size)
+        self.cell_keys = get_symmetric_keys(size)
+        self.hashes = symmetric_hashes(board, size)
+        self.table = table
+        self.deadline = deadline
+        self.ordering = ordering if ordering is not None else MoveOrdering(size)
+        self.stats = stats
+        self.database = database
+        self.candidates = CandidateMoves(board, size) if uses_candidates(size) else None
+        self.stop = stop
+
+    def place(self, cell, player):
+        """Applies a stone to the tracked position and returns True if it completes a line."""
+        hashes = self.hashes
+        cell_keys = self.cell_keys[player][cell]
+        for index in range(8):
+            hashes[index] ^= cell_keys[index]
+        if self.candidates is not None:
+            self.candidates.place(cell)
+        return self.tracker.place(cell, player)
+
+    def remove(self, cell, player):
+        """Undoes a stone applied with place()."""
+        hashes = self.hashes
+        cell_keys = self.cell_keys[player][cell]
+        for index in range(8):
+            hashes[index] ^= cell_keys[index]
+        if self.candidates is not None:
+            self.candidates.remove(cell)
+        self.tracker.remove(cell, player)
+
+
+class SearchSession:
+    """
+    Minimax search state carried from one move of a game to the next.
+
+    It keeps the transposition table of the last search. Before each search,
+    reroot() starts a new table generation, so the subtree values, bounds and best
+    moves found last time are reused while fresh results can overwrite stale ones;
+    get_minimax_move tries the best move stored for its root first. Fewer stones
+    than last time means a new game, which starts from an empty table. A move
+    searched with a session depends on what its table has seen, so such searches
+    bypass the move cache.
+    """
+
+    __slots__ = ("capacity", "table", "stones")
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.table = TranspositionTable(capacity)
+        self.stones = None
+
+    def reroot(self, board):
+        """Re-roots the kept state on `board` before searching it."""
+        stones = len(board) - board.count(" ")
+        if self.stones is not None and stones < self.stones:
+            self.table = TranspositionTable(self.capacity)
+        elif self.stones is not None:
+            self.table.new_search()
+        self.stones = stones
+
+
+def get_strategic_move(board, player, size, win_length=None):
+    """
+    Gets a strategic move for the computer to block opponent or win.
+
+    Winning and blocking cells come from one pass over the tracker's line counts. Otherwise,
+    on large boards only the candidate cells near the stones are considered.
+    """
     opponent = "O" if player == "X" else "X"
+    tracker = LineTracker(board, size, win_length)
 
     # Check for winning moves
-    for i in range(size * size):
-        if board[i] == " ":
-            board_copy = board[:]
-            board_copy[i] = player
-            if check_winner(board_copy, player, size):
-                return i
+    winning = tracker.winning_cells(player)
+    if winning:
+        return min(winning)
 
     # Block opponent's winning move
-    for i in range(size * size):
-        if board[i] == " ":
-            board_copy = board[:]
-            board_copy[i] = opponent
-            if check_winner(board_copy, opponent, size):
-                return i
+    blocking = tracker.winning_cells(opponent)
+    if blocking:
+        return min(blocking)
+
+    moves = get_candidate_moves(board, size)
+    candidates = set(moves)
 
     # Choose a random corner or center if available
     corners = [0, size - 1, (size - 1) * size, size * size - 1]
     for corner in corners:
-        if board[corner] == " ":
+        if corner in candidates:
             return corner
 
-    if board[size // 2 * size + size // 2] == " " and size % 2 == 1:
+    if size // 2 * size + size // 2 in candidates and size % 2 == 1:
         return size // 2 * size + size // 2
 
     # Choose any remaining edge
@@ -39,136 +180,507 @@ def get_strategic_move(board, player, size):
         edges.append(i * size + (size - 1))  # Right column
 
     for edge in edges:
-        if board[edge] == " ":
+        if edge in candidates:
             return edge
 
+    # Inner cells of boards larger than 3x3
+    if moves:
+        return moves[0]
 
-def evaluate(board, player, opponent, size):
+
+def evaluate(board, player, opponent, size, win_length=None):
     """Evaluates the board state."""
-    if check_winner(board, player, size):
+    if check_winner(board, player, size, win_length):
         return 10
-    elif check_winner(board, opponent, size):
+    elif check_winner(board, opponent, size, win_length):
         return -10
     else:
         return 0
 
 
 def minimax(
-    board, depth, is_maximizing, player, opponent, size, alpha, beta, max_depth
+    board,
+    depth,
+    is_maximizing,
+    player,
+    opponent,
+    size,
+    alpha,
+    beta,
+    max_depth,
+    context=None,
+    win_length=None,
 ):
     """
     Implements the minimax algorithm with alpha-beta pruning and depth limiting.
 
-    This function recursively evaluates all possible moves to determine the best move for the current player.
-    It uses alpha-beta pruning to reduce the number of nodes evaluated in the game tree, improving efficiency.
-    The `max_depth` parameter limits the search depth to prevent excessive computation time on larger boards.
+    Moves are applied to the context's single board and undone after their subtree, and
+    positions cut off at `max_depth` are scored by open-line counting, which stays below a win.
+
+    - `context`: the `SearchContext` of the search (line counters, Zobrist keys, transposition
+      table, stats and retrograde database); a fresh one is built when it is None.
+    - `win_length`: the number in a row that wins, used only when no context is given.
     """
-    if check_winner(board, player, size):
-        return 10
-    if check_winner(board, opponent, size):
-        return -10
-    if check_draw(board) or depth == max_depth:
-        return evaluate(board, player, opponent, size)
+    if context is None:
+        context = SearchContext(board, size, win_length=win_length)
+    board = context.tracker.cells
+    candidates = context.candidates
+    if context.deadline is not None and time.perf_counter() >= context.deadline:
+        raise SearchTimeout
+    if context.stop is not None and context.stop.is_set():
+        raise SearchTimeout
+    tracker = context.tracker
+    stats = context.stats
+    if stats is not None:
+        stats.record_node(depth + 1)
+    if tracker.has_won(player):
+        score = 10
+    elif tracker.has_won(opponent):
+        score = -10
+    elif tracker.is_full():
+        score = 0
+    else:
+        score = None
+    if score is not None:
+        if stats is not None:
+            stats.terminal_hits += 1
+        return score
+    mover = player if is_maximizing else opponent
+    if context.database is not None:
+        value = context.database.probe(board, mover)
+        if value is not None:
+            if stats is not None:
+                stats.database_hits += 1
+            if value == WIN:
+                return 10 if is_maximizing else -10
+            if value == LOSS:
+                return -10 if is_maximizing else 10
+            return 0
+    if depth == max_depth:
+        if stats is not None:
+            stats.evaluations += 1
+        return evaluate_position(board, player, size, tracker)
+
+    table = context.table
+    remaining = max_depth - depth
+    cached_move = None
+    if table is not None:
+        key, symmetry = canonical_key(context.hashes)
+        key ^= context.zobrist["turn"][mover, player]
+        entry = table.probe(key)
+        if entry is not None:
+            if entry[1] >= remaining:
+                if stats is not None:
+                    stats.cache_hits += 1
+                score, flag = entry[2], entry[3]
+                if flag == EXACT:
+                    return score
+                if flag == LOWER:
+                    alpha = max(alpha, score)
+                else:
+                    beta = min(beta, score)
+                if beta <= alpha:
+                    return score
+            if entry[4] is not None:
+                cached_move = from_canonical_move(entry[4], symmetry, size)
+    window_alpha, window_beta = alpha, beta
+    best_move = None
+    ply = depth + 1
+    ordering = context.ordering
+    moves = ordering.order(
+        board, mover, ply, tracker, cached_move, None if candidates is None else candidates.moves()
+    )
 
     if is_maximizing:
         best_score = -float("inf")
-        for i in range(size * size):
-            if board[i] == " ":
-                board_copy = board[:]
-                board_copy[i] = player
-                score = minimax(
-                    board_copy,
-                    depth + 1,
-                    False,
-                    player,
-                    opponent,
-                    size,
-                    alpha,
-                    beta,
-                    max_depth,
-                )
-                board_copy[i] = " "
-                best_score = max(score, best_score)
-                alpha = max(alpha, score)
-                if beta <= alpha:
-                    break
-        return best_score
+        for i in moves:
+            context.place(i, player)
+            score = minimax(
+                board,
+                depth + 1,
+                False,
+                player,
+                opponent,
+                size,
+                alpha,
+                beta,
+                max_depth,
+                context,
+            )
+            context.remove(i, player)
+            if score > best_score:
+                best_score = score
+                best_move = i
+            alpha = max(alpha, score)
+            if beta <= alpha:
+                ordering.record_cutoff(i, mover, ply, remaining)
+                break
     else:
         best_score = float("inf")
-        for i in range(size * size):
-            if board[i] == " ":
-                board_copy = board[:]
-                board_copy[i] = opponent
-                score = minimax(
-                    board_copy,
-                    depth + 1,
-                    True,
-                    player,
-                    opponent,
-                    size,
-                    alpha,
-                    beta,
-                    max_depth,
-                )
-                board_copy[i] = " "
-                best_score = min(score, best_score)
-                beta = min(beta, score)
-                if beta <= alpha:
-                    break
-        return best_score
+        for i in moves:
+            context.place(i, opponent)
+            score = minimax(
+                board,
+                depth + 1,
+                True,
+                player,
+                opponent,
+                size,
+                alpha,
+                beta,
+                max_depth,
+                context,
+            )
+            context.remove(i, opponent)
+            if score < best_score:
+                best_score = score
+                best_move = i
+            beta = min(beta, score)
+            if beta <= alpha:
+                ordering.record_cutoff(i, mover, ply, remaining)
+                break
 
+    if stats is not None:
+        stats.record_expansion(ply, moves.index(i) + 1, beta <= alpha)
+    if table is not None:
+        if best_score <= window_alpha:
+            flag = UPPER
+        elif best_score >= window_beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        if best_move is not None:
+            best_move = to_canonical_move(best_move, symmetry, size)
+        table.store(key, remaining, best_score, flag, best_move)
+    return best_score
 
-def get_minimax_move(board, player, size):
-    """Gets the move for the computer using the minimax algorithm with alpha-beta pruning and depth limiting."""
+
+def search_root(board, player, size, moves, max_depth, context):
+    """
+    Searches the root moves in the given order to `max_depth` and returns the best move with its score.
+
+    The window is narrowed after every root move, so later siblings only have to prove they are better.
+    Moves are applied to and undone on the context's board, so `board` itself is never modified.
+    """
     opponent = "O" if player == "X" else "X"
+    board = context.tracker.cells
     best_score = -float("inf")
     best_move = None
     alpha = -float("inf")
     beta = float("inf")
-    max_depth = 3  # Set a reasonable maximum depth for larger boards
-    for i in range(size * size):
-        if board[i] == " ":
-            board_copy = board[:]
-            board_copy[i] = player
-            score = minimax(
-                board_copy, 0, False, player, opponent, size, alpha, beta, max_depth
-            )
-            board_copy[i] = " "
-            if score > best_score:
-                best_score = score
-                best_move = i
+    for i in moves:
+        context.place(i, player)
+        score = minimax(
+            board,
+            0,
+            False,
+            player,
+            opponent,
+            size,
+            alpha,
+            beta,
+            max_depth,
+            context,
+        )
+        context.remove(i, player)
+        if score > best_score:
+            best_score = score
+            best_move = i
+        alpha = max(alpha, score)
+    if context.stats is not None:
+        context.stats.record_node(0)
+        context.stats.record_expansion(0, len(moves), False)
+    return best_move, best_score
+
+
+def get_minimax_move(
+    board,
+    player,
+    size,
+    table=None,
+    time_limit=None,
+    max_depth=3,
+    stats=None,
+    win_length=None,
+    store=None,
+    stop=None,
+):
+    """
+    Gets the move for the computer using the minimax algorithm with alpha-beta pruning and depth limiting.
+
+    Root moves that are rotations or reflections of one another are searched only once, and
+    positions a retrograde database has solved (see `retrograde`) are looked up instead.
+
+    - `table`: a `TranspositionTable` to share between calls; its stored root move is tried first.
+    - `time_limit`: seconds to deepen iteratively for; without it the search stops at `max_depth`.
+    - `stats`: a `SearchStats` to count nodes, cutoffs and depth into.
+    - `win_length`: the number in a row that wins (default: the board size).
+    - `store`: a `PositionStore` of earlier results to reuse and extend.
+    - `stop`: an event that cancels the search (see pondering.Ponderer).
+    """
+    start = time.perf_counter()
+    full_depth = board.count(" ") - 1  # Plies left after the root move
+    stored = store.lookup(board, player, size, win_length) if store is not None else None
+    if stored is not None and (
+        stored[1] > full_depth or (time_limit is None and stored[1] >= min(max_depth, full_depth) + 1)
+    ):
+        if stats is not None:
+            stats.completed_depth = stored[1]
+            stats.elapsed += time.perf_counter() - start
+        return stored[0]
+    if table is None:
+        table = TranspositionTable()
+    database = load_database(size) if (win_length or size) == size else None
+    context = SearchContext(
+        board, size, table, stats=stats, database=database, win_length=win_length, stop=stop
+    )
+    ordering = context.ordering
+    moves = unique_moves(board, size)
+    if context.candidates is not None:
+        # The candidates are symmetric too, so each kept move still stands for its whole class
+        nearby = set(context.candidates.moves())
+        moves = [move for move in moves if move in nearby]
+    # An earlier search that passed through this position may have stored its best move
+    key, symmetry = canonical_key(context.hashes)
+    entry = table.probe(key ^ context.zobrist["turn"][player, player])
+    first_move = None
+    if entry is not None and entry[4] is not None:
+        first_move = from_canonical_move(entry[4], symmetry, size)
+    moves = ordering.order(board, player, 0, context.tracker, first_move, moves)
+    if time_limit is None:
+        best_move, score = search_root(board, player, size, moves, max_depth, context)
+        completed = full_depth + 1 if abs(score) == 10 else min(max_depth, full_depth) + 1
+        if store is not None and best_move is not None:  # A full board has no move to store
+            store.record(board, player, size, best_move, completed, win_length)
+        if stats is not None:
+            stats.completed_depth = max_depth + 1
+            stats.elapsed += time.perf_counter() - start
+        return best_move
+
+    deadline = start + time_limit
+    best_move = None
+    completed = 0
+    for depth in range(full_depth + 1):
+        # An aborted iteration leaves its context mid-search, so each one starts fresh
+        context = SearchContext(
+            board,
+            size,
+            table,
+            deadline if depth else None,
+            ordering,
+            stats,
+            database,
+            win_length,
+            stop,
+        )
+        try:
+            move, score = search_root(board, player, size, moves, depth, context)
+        except SearchTimeout:
+            if stop is not None and stop.is_set():
+                raise
+            break
+        best_move = move
+        completed = depth + 1
+        if stats is not None:
+            stats.completed_depth = depth + 1
+        # Search the best move first next time so it wins ties at the deeper level
+        moves.remove(move)
+        moves.insert(0, move)
+        if abs(score) == 10:
+            completed = full_depth + 1
+            break  # The result is already forced, searching deeper cannot change it
+    if store is not None:
+        if stored is not None and stored[1] > completed:
+            best_move = stored[0]
+        elif best_move is not None:
+            store.record(board, player, size, best_move, completed, win_length)
+    if stats is not None:
+        stats.elapsed += time.perf_counter() - start
     return best_move
 
 
-def get_worst_move(board, player, size):
-    """Gets the worst move for the computer to ensure a loss."""
+class MCTSNode:
+    """A node of the Monte Carlo search tree, reached by `player` playing `move`."""
+
+    __slots__ = ("move", "player", "parent", "children", "untried", "visits", "wins", "won")
+
+    def __init__(self, move, player, parent, untried, won):
+        self.move = move
+        self.player = player
+        self.parent = parent
+        self.children = []
+        self.untried = untried
+        self.visits = 0
+        self.wins = 0.0
+        self.won = won
+
+
+def get_mcts_move(
+    board,
+    player,
+    size,
+    playouts=None,
+    time_limit=None,
+    exploration=1.4,
+    rollout_batch=None,
+    stats=None,
+    win_length=None,
+):
+    """
+    Gets the move for the computer using Monte Carlo Tree Search with UCT selection.
+
+    The search runs until `playouts` random games have been played or `time_limit` seconds have passed,
+    whichever comes first; with neither given it plays DEFAULT_MCTS_PLAYOUTS games. Each playout walks
+    down the tree by the UCT formula, expands one new move, and finishes the game with random moves on
+    a single line tracker, so a win check only costs the lines through the cell just played. All moves
+    of the playout are undone afterwards. The most visited root move is returned.
+
+    With `rollout_batch` set, each new leaf is instead scored by that many random games played at once
+    by the NumPy engine in `rollouts`, and every game counts towards the playout budget.
+
+    Immediate wins and blocks are played without searching. On large boards the tree only expands the
+    candidate cells near the stones, kept up to date as tree moves are applied and undone; the random
+    games still play anywhere. Pass a `SearchStats` as `stats` to count the tree nodes walked, playouts
+    and tree depth into it.
+    """
+    opponent = "O" if player == "X" else "X"
+    tracker = LineTracker(board, size, win_length)
+    cells = tracker.cells
+    for mover in (player, opponent):
+        winning = tracker.winning_cells(mover)
+        if winning:
+            return min(winning)
+    candidates = CandidateMoves(board, size) if uses_candidates(size) else None
+    if candidates is not None:
+        available_moves = candidates.moves()
+    else:
+        available_moves = [i for i in range(size * size) if cells[i] == " "]
+    if len(available_moves) <= 1:
+        return available_moves[0] if available_moves else None
+
+    if playouts is None and time_limit is None:
+        playouts = DEFAULT_MCTS_PLAYOUTS
+    start = time.perf_counter()
+    deadline = start + time_limit if time_limit is not None else None
+    root = MCTSNode(None, opponent, None, available_moves[:], False)
+    played = 0
+    while playouts is None or played < playouts:
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+        node = root
+        path = []
+
+        # Selection: follow the best UCT child while the node is fully expanded
+        while not node.untried and node.children and not node.won:
+            log_visits = math.log(node.visits)
+            node = max(
+                node.children,
+                key=lambda child: child.wins / child.visits
+                + exploration * math.sqrt(log_visits / child.visits),
+            )
+            tracker.place(node.move, node.player)
+            if candidates is not None:
+                candidates.place(node.move)
+            path.append(node)
+
+        # Expansion: add one untried move as a new child
+        if node.untried and not node.won:
+            move = node.untried.pop(random.randrange(len(node.untried)))
+            mover = "O" if node.player == "X" else "X"
+            won = tracker.place(move, mover)
+            if candidates is not None:
+                candidates.place(move)
+                untried = [] if won else candidates.moves()
+            else:
+                untried = [] if won else [i for i in range(size * size) if cells[i] == " "]
+            child = MCTSNode(move, mover, node, untried, won)
+            node.children.append(child)
+            if stats is not None:
+                stats.children += 1
+                if len(node.children) == 1:
+                    stats.expanded += 1
+            node = child
+            path.append(node)
+
+        # Simulation: random moves until someone wins or the board is full
+        if stats is not None and (node.won or not tracker.empty_count):
+            stats.terminal_hits += 1
+        leaf_player = node.player
+        to_move = "O" if leaf_player == "X" else "X"
+        if rollout_batch and not node.won and tracker.empty_count:
+            losses, draws, wins = simulate(
+                cells, to_move, size, rollout_batch, win_length=win_length
+            )
+            games = rollout_batch
+        else:
+            winner = leaf_player if node.won else None
+            rollout = []
+            if winner is None:
+                empty_cells = [i for i in range(size * size) if cells[i] == " "]
+                random.shuffle(empty_cells)
+                mover = leaf_player
+                for move in empty_cells:
+                    mover = "O" if mover == "X" else "X"
+                    rollout.append((move, mover))
+                    if tracker.place(move, mover):
+                        winner = mover
+                        break
+            for move, mover in reversed(rollout):
+                tracker.remove(move, mover)
+            wins = 1 if winner == leaf_player else 0
+            losses = 1 if winner == to_move else 0
+            draws = 1 if winner is None else 0
+            games = 1
+        for step in reversed(path):
+            tracker.remove(step.move, step.player)
+            if candidates is not None:
+                candidates.remove(step.move)
+        if stats is not None:
+            stats.nodes += len(path) + 1  # The root is walked by every playout
+            stats.max_depth = max(stats.max_depth, len(path))
+            stats.playouts += games
+
+        # Backpropagation: every node scores the results for the player who moved into it
+        while node is not None:
+            node.visits += games
+            node.wins += (wins if node.player == leaf_player else losses) + draws / 2
+            node = node.parent
+        played += games
+
+    if stats is not None:
+        stats.elapsed += time.perf_counter() - start
+    if not root.children:
+        return random.choice(available_moves)
+    return max(root.children, key=lambda child: child.visits).move
+
+
+def get_worst_move(board, player, size, win_length=None):
+    """
+    Gets the worst move for the computer to ensure a loss.
+
+    On large boards only the candidate cells near the stones are considered, unless all of them win.
+    The cells where either player wins at once are computed in one pass over the line counts each,
+    so the whole choice takes linear time.
+    """
     opponent = "O" if player == "X" else "X"
-    available_moves = [i for i, x in enumerate(board) if x == " "]
+    available_moves = get_candidate_moves(board, size)
+    tracker = LineTracker(board, size, win_length)
+    winning = tracker.winning_cells(player)
     
     # First, avoid any moves that would result in an immediate win
-    non_winning_moves = []
-    for move in available_moves:
-        board_copy = board[:]
-        board_copy[move] = player
-        if not check_winner(board_copy, player, size):
-            non_winning_moves.append(move)
+    non_winning_moves = [move for move in available_moves if move not in winning]
+    if not non_winning_moves and uses_candidates(size):
+        available_moves = [i for i, x in enumerate(board) if x == " "]
+        non_winning_moves = [move for move in available_moves if move not in winning]
     
     if not non_winning_moves:
         return random.choice(available_moves)
     
-    # Among non-winning moves, prefer moves that allow opponent to win next turn
-    worst_moves = []
-    for move in non_winning_moves:
-        board_copy = board[:]
-        board_copy[move] = player
-        # Check if opponent can win in their next move
-        for opp_move in range(size * size):
-            if board_copy[opp_move] == " ":
-                board_copy_2 = board_copy[:]
-                board_copy_2[opp_move] = opponent
-                if check_winner(board_copy_2, opponent, size):
-                    worst_moves.append(move)
-                    break
+    # Among non-winning moves, prefer moves that allow opponent to win next turn.
+    # A stone can only block the opponent's lines, so after our move the opponent
+    # still wins on every cell it wins on now, except the one we just played.
+    opponent_winning = tracker.winning_cells(opponent)
+    worst_moves = [move for move in non_winning_moves if opponent_winning - {move}]
     
     if worst_moves:
         return random.choice(worst_moves)
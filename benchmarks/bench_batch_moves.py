@@ -0,0 +1,78 @@
+"""
+Measures the throughput of get_computer_moves against one get_computer_move call per board.
+
+Usage: python benchmarks/bench_batch_moves.py [--count N] [--loop-count N] [--processes N]
+
+For each case, `--count` positions with X to move are drawn at random (an even
+number of stones, nobody has won yet), mixing openings and midgames; 4x4
+minimax, which searches every position, uses 5000. The per-call loop is timed
+on the first `--loop-count` of them to keep the run short. The batch API is
+timed on all of them, in this process and, with --processes, on a process pool.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from bench_primitives import make_positions
+from moves import get_computer_move, get_computer_moves
+
+# (size, strategy, positions); None uses --count. 4x4 minimax searches every unique position.
+CASES = [(3, "minimax", None), (4, "strategic", None), (4, "minimax", 5_000)]
+
+
+def make_boards(size, count, seed=0):
+    """Returns `count` boards with X to move, spread evenly over 2, 4, ... stones, in random order."""
+    cells = size * size
+    stone_counts = list(range(2, cells - 1, 2))
+    boards = []
+    for index, stones in enumerate(stone_counts):
+        share = count // len(stone_counts) + (index < count % len(stone_counts))
+        fill = (stones + 0.5) / cells
+        boards.extend(board for board, _ in make_positions(size, fill, share, seed))
+    random.Random(seed).shuffle(boards)
+    return boards
+
+
+def rate(count, function):
+    """Runs the function and returns the positions per second it managed."""
+    start = time.perf_counter()
+    function()
+    return count / (time.perf_counter() - start)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare batched and per-call computer moves.")
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--loop-count", type=int, default=5_000, help="positions timed one call each")
+    parser.add_argument("--processes", type=int, default=None, help="also time a pool of this many workers")
+    args = parser.parse_args(argv)
+
+    header = f"{'size':>4} {'strategy':>10} {'distinct':>8} {'loop/s':>9} {'batch/s':>9}"
+    if args.processes:
+        header += f" {'pool/s':>9}"
+    print(header)
+    for size, strategy, count in CASES:
+        boards = make_boards(size, count or args.count)
+        unique = len({tuple(board) for board in boards})
+        loop_boards = boards[: args.loop_count]
+        loop = rate(
+            len(loop_boards),
+            lambda: [get_computer_move(board, strategy, "X", size) for board in loop_boards],
+        )
+        batch = rate(len(boards), lambda: get_computer_moves(boards, strategy, "X", size))
+        line = f"{size:>4} {strategy:>10} {unique:>8} {loop:>9.0f} {batch:>9.0f}"
+        if args.processes:
+            pool = rate(
+                len(boards),
+                lambda: get_computer_moves(boards, strategy, "X", size, processes=args.processes),
+            )
+            line += f" {pool:>9.0f}"
+        print(line, flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Micro-benchmarks for the board and search primitives.
+
+Usage: python benchmarks/bench_primitives.py [--sizes N ...] [--output PATH]
+                                             [--compare BASELINE] [--threshold FRACTION]
+
+Times check_winner, check_draw, get_strategic_move, get_worst_move, minimax and
+get_minimax_move on board sizes 3 to 8 over three fixed position sets
+(openings, midgames and near-full boards) and writes the seconds per call as
+JSON. With --compare, the results are checked against a saved baseline and
+every case slower by more than --threshold is reported as a regression; the
+exit status is then 1.
+
+A typical workflow: save a baseline on the main branch with
+`--output baseline.json`, then run `--compare baseline.json` on a change.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from board import check_winner, check_draw
+from ai_strategies import (
+    get_strategic_move,
+    get_worst_move,
+    minimax,
+    get_minimax_move,
+)
+
+SIZES = [3, 4, 5, 6, 7, 8]
+POSITIONS_PER_SET = 4
+# Fraction of the cells filled in each position set
+POSITION_SETS = {"openings": 0.1, "midgames": 0.4, "near_full": 0.85}
+
+
+def search_depth(size):
+    """Returns the fixed search depth used for the search benchmarks on a board size."""
+    return 3 if size <= 5 else 2
+
+
+def make_positions(size, fill, count, seed):
+    """
+    Returns `count` (board, player to move) pairs with about `fill` of the cells occupied.
+
+    Stones are played alternately at random, starting with X, and positions where
+    someone has already won are discarded, so every position is still in play.
+    """
+    rng = random.Random(f"{size}:{fill}:{seed}")
+    stones = max(1, min(int(size * size * fill), size * size - 2))
+    positions = []
+    while len(positions) < count:
+        board = [" "] * (size * size)
+        player = "X"
+        for move in rng.sample(range(size * size), stones):
+            board[move] = player
+            player = "O" if player == "X" else "X"
+        if not check_winner(board, "X", size) and not check_winner(board, "O", size):
+            positions.append((board, player))
+    return positions
+
+
+def get_cases(size):
+    """Returns (name, function) pairs; each function runs one primitive on one position."""
+    depth = search_depth(size)
+    return [
+        ("check_winner", lambda board, player: check_winner(board, player, size)),
+        ("check_draw", lambda board, player: check_draw(board)),
+        ("get_strategic_move", lambda board, player: get_strategic_move(board, player, size)),
+        ("get_worst_move", lambda board, player: get_worst_move(board, player, size)),
+        (
+            "minimax",
+            lambda board, player: minimax(
+                board,
+                0,
+                True,
+                player,
+                "O" if player == "X" else "X",
+                size,
+                -float("inf"),
+                float("inf"),
+                depth,
+            ),
+        ),
+        (
+            "get_minimax_move",
+            lambda board, player: get_minimax_move(board, player, size, max_depth=depth),
+        ),
+    ]
+
+
+def time_call(function, repeat=5, budget=0.02):
+    """Returns the best seconds per call of `function`, measured in batches of about `budget` seconds."""
+    timer = timeit.Timer(function)
+    number = 1
+    while timer.timeit(number) < budget and number < 1 << 20:
+        number *= 4
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run_benchmarks(sizes):
+    """Runs every case and returns a dict mapping "name/size/position set" to seconds per call."""
+    results = {}
+    for size in sizes:
+        for set_name, fill in POSITION_SETS.items():
+            positions = make_positions(size, fill, POSITIONS_PER_SET, 0)
+            for name, function in get_cases(size):
+                key = f"{name}/{size}/{set_name}"
+                results[key] = time_call(
+                    lambda: [function(board, player) for board, player in positions]
+                ) / len(positions)
+                print(f"{key:<40} {results[key] * 1e6:>12.1f} us", flush=True)
+    return results
+
+
+def compare(results, baseline, threshold, noise_floor=1e-6):
+    """
+    Compares results against a baseline and returns the regressions.
+
+    Returns a list of (key, baseline seconds, current seconds) for every case present
+    in both that got slower by more than `threshold` (a fraction, 0.25 = 25%) and by
+    more than `noise_floor` seconds, so sub-microsecond jitter is not reported.
+    """
+    regressions = []
+    for key, seconds in sorted(results.items()):
+        before = baseline.get(key)
+        if before and seconds > before * (1 + threshold) and seconds - before > noise_floor:
+            regressions.append((key, before, seconds))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark board and search primitives.")
+    parser.add_argument("--sizes", nargs="+", type=int, default=SIZES)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown (default 0.25)")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.sizes)
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump(
+                {"python": platform.python_version(), "machine": platform.machine(), "results": results},
+                handle,
+                indent=2,
+                sort_keys=True,
+            )
+
+    if args.compare:
+        with open(args.compare) as handle:
+            baseline = json.load(handle)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for key, before, after in regressions:
+            print(f"REGRESSION {key}: {before * 1e6:.1f} us -> {after * 1e6:.1f} us ({after / before - 1:+.0%})")
+        if regressions:
+            return 1
+        print(f"No regressions above {args.threshold:.0%} against {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""
+Measures random-game throughput (games per second) by board size.
+
+Usage: python benchmarks/bench_rollouts.py [games]
+
+Three engines play complete random games from an empty board:
+- scan:    one game at a time, random.choice over the empty cells and a full
+           check_winner after every move (how the strategies used to do it);
+- tracker: one game at a time on a LineTracker, checking only the lines
+           through the cell just played (the MCTS rollout);
+- numpy:   every game at once in lock-step with rollouts.play_random_games.
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+from board import check_winner, LineTracker
+from rollouts import play_random_games, X
+
+SIZES = [3, 4, 5, 6, 8, 10]
+
+
+def scan_game(size):
+    """Plays one random game with full-board win checks and returns the winner or None."""
+    board = [" "] * (size * size)
+    player = "X"
+    while True:
+        move = random.choice([i for i, cell in enumerate(board) if cell == " "])
+        board[move] = player
+        if check_winner(board, player, size):
+            return player
+        if " " not in board:
+            return None
+        player = "O" if player == "X" else "X"
+
+
+def tracker_game(size):
+    """Plays one random game on a LineTracker and returns the winner or None."""
+    tracker = LineTracker([" "] * (size * size), size)
+    cells = list(range(size * size))
+    random.shuffle(cells)
+    player = "X"
+    for move in cells:
+        if tracker.place(move, player):
+            return player
+        player = "O" if player == "X" else "X"
+    return None
+
+
+def games_per_second(play, games):
+    """Returns how many games per second `play(games)` managed."""
+    start = time.perf_counter()
+    play(games)
+    return games / (time.perf_counter() - start)
+
+
+def main():
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    rng = np.random.default_rng(0)
+    print(f"{'size':>4} {'scan':>10} {'tracker':>10} {'numpy':>10}")
+    for size in SIZES:
+        scan = games_per_second(
+            lambda n: [scan_game(size) for _ in range(n)], max(games // 10, 1)
+        )
+        tracker = games_per_second(lambda n: [tracker_game(size) for _ in range(n)], games)
+        batch = games_per_second(
+            lambda n: play_random_games(np.zeros((n, size * size), dtype=np.int8), X, size, rng),
+            games,
+        )
+        print(f"{size:>4} {scan:>10.0f} {tracker:>10.0f} {batch:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
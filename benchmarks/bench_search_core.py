@@ -0,0 +1,66 @@
+"""
+Measures the time and allocations of get_minimax_move.
+
+Usage: python benchmarks/bench_search_core.py
+
+For each board size and depth it reports the best time per call (timeit) and
+the peak memory the search held at once, traced with tracemalloc. The
+transposition table is allocated before tracing starts, so the peak covers the
+search itself: board copies, move lists and cache entries.
+"""
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from ai_strategies import get_minimax_move
+from transposition import TranspositionTable
+
+CASES = [(3, 8), (4, 4), (5, 3), (6, 3), (8, 2)]
+
+
+def opening(size):
+    """Returns a board with one X stone in the corner and one O stone next to the center."""
+    board = [" "] * (size * size)
+    board[0] = "X"
+    board[size // 2 * size + size // 2 - 1] = "O"
+    return board
+
+
+def peak_bytes(function):
+    """Runs the function under tracemalloc and returns the peak number of bytes it held."""
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def measure(size, depth, repeat=10):
+    """Returns (seconds per call, peak KiB) for one case."""
+    board = opening(size)
+    seconds = min(
+        timeit.repeat(
+            lambda: get_minimax_move(board, "X", size, max_depth=depth),
+            number=1,
+            repeat=repeat,
+        )
+    )
+    table = TranspositionTable()
+    peak = peak_bytes(
+        lambda: get_minimax_move(board, "X", size, table=table, max_depth=depth)
+    )
+    return seconds, peak / 1024
+
+
+def main():
+    print(f"{'size':>4} {'depth':>5} {'ms/call':>9} {'peak KiB':>9}")
+    for size, depth in CASES:
+        seconds, peak = measure(size, depth)
+        print(f"{size:>4} {depth:>5} {seconds * 1000:>9.1f} {peak:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Measures how many nodes minimax saves by reusing its search state between moves.
+
+Usage: python benchmarks/bench_tree_reuse.py [--depth N]
+
+For each case, one game of minimax (O) against the strategic strategy (X) is
+played with fresh searches and recorded. Every position where O was to move is
+then searched twice to --depth, in game order: once from scratch, and once
+through one `SearchSession` carried along the game. Both runs see the same
+positions, so the node counts compare directly. Timed searches are left out on
+purpose: how deep they get varies from run to run.
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from ai_strategies import SearchSession, get_minimax_move, get_strategic_move
+from board import LineTracker
+from search_stats import SearchStats
+
+CASES = [(4, None), (5, None), (6, 4), (7, 4)]
+
+
+def record_game(size, win_length, depth):
+    """Plays strategic X against minimax O and returns the boards where O was to move."""
+    board = [" "] * (size * size)
+    tracker = LineTracker(board, size, win_length)
+    positions = []
+    player = "X"
+    while True:
+        if player == "X":
+            move = get_strategic_move(board, "X", size, win_length)
+        else:
+            positions.append(list(board))
+            move = get_minimax_move(board, "O", size, max_depth=depth, win_length=win_length)
+        board[move] = player
+        if tracker.place(move, player) or tracker.is_full():
+            return positions
+        player = "O" if player == "X" else "X"
+
+
+def count_nodes(positions, size, win_length, depth, session):
+    """Searches every position in order and returns the nodes searched per move."""
+    results = []
+    for board in positions:
+        stats = SearchStats()
+        table = None
+        if session is not None:
+            session.reroot(board)
+            table = session.table
+        get_minimax_move(
+            board, "O", size, table=table, max_depth=depth, stats=stats, win_length=win_length
+        )
+        results.append(stats.nodes)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare minimax nodes with and without tree reuse.")
+    parser.add_argument("--depth", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    for size, win_length in CASES:
+        positions = record_game(size, win_length, args.depth)
+        fresh = count_nodes(positions, size, win_length, args.depth, None)
+        reused = count_nodes(positions, size, win_length, args.depth, SearchSession())
+        print(f"{size}x{size}, {win_length or size} in a row:")
+        print(f"{'move':>6} {'fresh':>9} {'reused':>9} {'saved':>7}")
+        for index, (before, after) in enumerate(zip(fresh, reused), 1):
+            saved = 1 - after / before if before else 0.0
+            print(f"{index:>6} {before:>9} {after:>9} {saved:>7.1%}")
+        total_before = sum(fresh)
+        total_after = sum(reused)
+        print(
+            f"{'total':>6} {total_before:>9} {total_after:>9} "
+            f"{1 - total_after / total_before if total_before else 0.0:>7.1%}"
+        )
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Load generator for the game server.
+
+Usage: python benchmarks/load_server.py [--clients N] [--games N] [--strategy NAME]
+                                        [--size N] [--win-length K]
+                                        [--host HOST] [--port PORT | --unix PATH]
+
+Opens `--clients` connections that each play `--games` games back to back,
+choosing random legal moves for X, and reports the moves per second over the
+whole run and the latency percentiles of the move requests. One untimed game is
+played first to start the server's workers. Without --port or
+--unix, a server is started in this process on a free port with its default
+process pool, so the numbers include the round trip through the executor.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from server import GameServer
+from tournament import percentile
+
+
+async def request(reader, writer, message):
+    """Sends one request and returns the decoded reply."""
+    writer.write(json.dumps(message).encode() + b"\n")
+    await writer.drain()
+    reply = json.loads(await reader.readline())
+    if not reply["ok"]:
+        raise RuntimeError(reply["error"])
+    return reply
+
+
+async def run_client(connect, games, strategy, size, win_length, rng, latencies):
+    """Plays `games` games over one connection, recording the seconds of every move request."""
+    reader, writer = await connect()
+    try:
+        for _ in range(games):
+            state = await request(
+                reader,
+                writer,
+                {"op": "new", "strategy": strategy, "size": size, "win_length": win_length},
+            )
+            while not state["finished"]:
+                cell = rng.choice([i for i, stone in enumerate(state["board"]) if stone == " "])
+                start = time.perf_counter()
+                state = await request(
+                    reader, writer, {"op": "move", "session": state["session"], "cell": cell}
+                )
+                latencies.append(time.perf_counter() - start)
+            await request(reader, writer, {"op": "close", "session": state["session"]})
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def run_load(args):
+    """Runs the load and returns (moves, elapsed seconds, sorted latencies)."""
+    server = None
+    if args.unix:
+        connect = lambda: asyncio.open_unix_connection(args.unix)
+    else:
+        port = args.port
+        if port is None:
+            server = GameServer(max_sessions=args.clients * 2)
+            listener = await server.start(args.host, 0)
+            port = listener.sockets[0].getsockname()[1]
+        connect = lambda: asyncio.open_connection(args.host, port)
+
+    latencies = []
+    start = time.perf_counter()
+    try:
+        # One untimed game first, so starting the worker processes is not measured
+        await run_client(
+            connect, 1, args.strategy, args.size, args.win_length, random.Random(-1), []
+        )
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(
+                run_client(
+                    connect,
+                    args.games,
+                    args.strategy,
+                    args.size,
+                    args.win_length,
+                    random.Random(index),
+                    latencies,
+                )
+                for index in range(args.clients)
+            )
+        )
+    finally:
+        elapsed = time.perf_counter() - start
+        if server is not None:
+            await server.close()
+    latencies.sort()
+    return len(latencies), elapsed, latencies
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure game server throughput and latency.")
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--games", type=int, default=4, help="games per client")
+    parser.add_argument("--strategy", default="minimax")
+    parser.add_argument("--size", type=int, default=3)
+    parser.add_argument("--win-length", type=int, default=None)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=None, help="server port (default: start one in-process)")
+    parser.add_argument("--unix", help="connect to the server's Unix socket instead")
+    args = parser.parse_args(argv)
+
+    moves, elapsed, latencies = asyncio.run(run_load(args))
+    print(f"{args.clients} clients x {args.games} games: {moves} moves in {elapsed:.2f}s "
+          f"({moves / elapsed:.0f} moves/s)")
+    print(
+        f"move latency ms: p50 {percentile(latencies, 0.50) * 1000:.2f}  "
+        f"p90 {percentile(latencies, 0.90) * 1000:.2f}  "
+        f"p99 {percentile(latencies, 0.99) * 1000:.2f}  "
+        f"max {latencies[-1] * 1000 if latencies else 0.0:.2f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,8 @@
+_LINES = {}
+_WIN_MASKS = {}
+_CELL_LINES = {}
+
+
 def print_board(board, size):
     """Prints the current state of the board."""
     for i in range(size):
@@ -6,20 +11,208 @@ def print_board(board, size):
         if i < size - 1:
             print("-" * (size * 4 - 3))  # Pastikan separator konsisten
 
-def check_winner(board, player, size):
-    """Checks if the given player has won."""
-    return (
-        any(
-            all(board[i * size + j] == player for j in range(size)) for i in range(size)
-        )
-        or any(
-            all(board[i * size + j] == player for i in range(size)) for j in range(size)
-        )
-        or all(board[i * size + i] == player for i in range(size))
-        or all(board[i * size + (size - 1 - i)] == player for i in range(size))
-    )
+
+def get_lines(size, win_length=None):
+    """
+    Returns every winning line as a tuple of cell indices.
+
+    A line is any `win_length` consecutive cells in a row, a column or a diagonal in either
+    direction. `win_length` defaults to the board size, which leaves the rows, the columns
+    and the two main diagonals.
+    """
+    win_length = win_length or size
+    lines = _LINES.get((size, win_length))
+    if lines is None:
+        span = size - win_length + 1  # Starting positions of a window along one line
+        lines = [
+            tuple(i * size + j + step for step in range(win_length))
+            for i in range(size)
+            for j in range(span)
+        ]
+        lines += [
+            tuple((i + step) * size + j for step in range(win_length))
+            for j in range(size)
+            for i in range(span)
+        ]
+        lines += [
+            tuple((i + step) * size + j + step for step in range(win_length))
+            for i in range(span)
+            for j in range(span)
+        ]
+        lines += [
+            tuple((i + step) * size + (size - 1 - j) - step for step in range(win_length))
+            for i in range(span)
+            for j in range(span)
+        ]
+        lines = tuple(lines)
+        _LINES[size, win_length] = lines
+    return lines
+
+
+def get_win_masks(size, win_length=None):
+    """Returns the precomputed bitmask of every winning line for the given board size and win length."""
+    win_length = win_length or size
+    masks = _WIN_MASKS.get((size, win_length))
+    if masks is None:
+        masks = tuple(sum(1 << cell for cell in line) for line in get_lines(size, win_length))
+        _WIN_MASKS[size, win_length] = masks
+    return masks
+
+
+def get_cell_lines(size, win_length=None):
+    """Returns, for every cell, the indices of the winning lines passing through it."""
+    win_length = win_length or size
+    cell_lines = _CELL_LINES.get((size, win_length))
+    if cell_lines is None:
+        cell_lines = [[] for _ in range(size * size)]
+        for index, line in enumerate(get_lines(size, win_length)):
+            for cell in line:
+                cell_lines[cell].append(index)
+        cell_lines = tuple(tuple(indices) for indices in cell_lines)
+        _CELL_LINES[size, win_length] = cell_lines
+    return cell_lines
+
+
+def board_to_bitboard(board, player):
+    """Converts a list board into an integer with one bit set per cell owned by the player."""
+    return sum(1 << i for i, cell in enumerate(board) if cell == player)
+
+
+def board_to_bitboards(board):
+    """Converts a list board into a pair of bitboards for X and O."""
+    return board_to_bitboard(board, "X"), board_to_bitboard(board, "O")
+
+
+def bitboards_to_board(x_bits, o_bits, size):
+    """Converts a pair of X and O bitboards back into a list board."""
+    board = [" "] * (size * size)
+    for i in range(size * size):
+        if x_bits >> i & 1:
+            board[i] = "X"
+        elif o_bits >> i & 1:
+            board[i] = "O"
+    return board
+
+
+def is_winning_bitboard(bits, size, win_length=None):
+    """Checks if a player's bitboard covers any complete winning line."""
+    for mask in get_win_masks(size, win_length):
+        if bits & mask == mask:
+            return True
+    return False
+
+
+def check_winner(board, player, size, win_length=None):
+    """Checks if the given player has won, i.e. owns `win_length` (default: size) cells in a row."""
+    return is_winning_bitboard(board_to_bitboard(board, player), size, win_length)
 
 
 def check_draw(board):
     """Checks if the game is a draw."""
     return " " not in board
+
+
+class LineTracker:
+    """
+    Keeps per-line stone counts so wins and draws can be checked incrementally.
+
+    Placing or removing a stone only touches the lines through that cell, so
+    "did this move win?" costs O(lines through the cell) and "is the board
+    full?" is a constant-time check of the empty-cell counter. With a
+    `win_length` below the board size the lines are the sliding windows of that
+    length, and at most 4 * win_length of them pass through any cell.
+
+    The same counts answer "where can this player win right now?" in one pass
+    over the lines (see winning_cells), without trying every empty cell.
+    """
+
+    __slots__ = (
+        "size",
+        "win_length",
+        "cells",
+        "lines",
+        "cell_lines",
+        "counts",
+        "completed",
+        "empty_count",
+    )
+
+    def __init__(self, board, size, win_length=None):
+        self.size = size
+        self.win_length = win_length or size
+        self.cells = [" "] * (size * size)
+        self.lines = get_lines(size, self.win_length)
+        self.cell_lines = get_cell_lines(size, self.win_length)
+        line_count = len(self.lines)
+        self.counts = {"X": [0] * line_count, "O": [0] * line_count}
+        self.completed = {"X": 0, "O": 0}
+        self.empty_count = size * size
+        for cell, player in enumerate(board):
+            if player != " ":
+                self.place(cell, player)
+
+    def place(self, cell, player):
+        """Records the player's stone on the cell and returns True if it completes a line."""
+        previous = self.cells[cell]
+        if previous == player:
+            return False
+        if previous != " ":
+            self.remove(cell, previous)
+        counts = self.counts[player]
+        won = False
+        for line in self.cell_lines[cell]:
+            counts[line] += 1
+            if counts[line] == self.win_length:
+                self.completed[player] += 1
+                won = True
+        self.cells[cell] = player
+        self.empty_count -= 1
+        return won
+
+    def remove(self, cell, player):
+        """Takes the player's stone back off the cell."""
+        counts = self.counts[player]
+        for line in self.cell_lines[cell]:
+            if counts[line] == self.win_length:
+                self.completed[player] -= 1
+            counts[line] -= 1
+        self.cells[cell] = " "
+        self.empty_count += 1
+
+    def is_winning_move(self, cell, player):
+        """Checks if the player would complete a line by playing on the empty cell."""
+        counts = self.counts[player]
+        target = self.win_length - 1
+        for line in self.cell_lines[cell]:
+            if counts[line] == target:
+                return True
+        return False
+
+    def winning_cells(self, player):
+        """
+        Returns the set of empty cells on which the player would complete a line.
+
+        A line is one move from winning when it holds win_length - 1 of the player's
+        stones and none of the opponent's; its one empty cell is the winning cell.
+        """
+        opponent = "O" if player == "X" else "X"
+        own_counts = self.counts[player]
+        opponent_counts = self.counts[opponent]
+        target = self.win_length - 1
+        cells = self.cells
+        winning = set()
+        for index, count in enumerate(own_counts):
+            if count == target and not opponent_counts[index]:
+                for cell in self.lines[index]:
+                    if cells[cell] == " ":
+                        winning.add(cell)
+                        break
+        return winning
+
+    def has_won(self, player):
+        """Checks if the player already owns a complete line."""
+        return self.completed[player] > 0
+
+    def is_full(self):
+        """Checks if no empty cells are left."""
+        return self.empty_count == 0
@@ -0,0 +1,104 @@
+DEFAULT_DISTANCE = 2
+CANDIDATE_MIN_SIZE = 7  # Smaller boards are searched in full; every cell there can matter
+
+_NEIGHBORHOODS = {}
+
+
+def get_neighborhoods(size, distance=DEFAULT_DISTANCE):
+    """Returns, for every cell, the other cells at most `distance` rows and columns away."""
+    neighborhoods = _NEIGHBORHOODS.get((size, distance))
+    if neighborhoods is None:
+        neighborhoods = []
+        for cell in range(size * size):
+            row, col = divmod(cell, size)
+            neighborhoods.append(
+                tuple(
+                    other_row * size + other_col
+                    for other_row in range(max(row - distance, 0), min(row + distance + 1, size))
+                    for other_col in range(max(col - distance, 0), min(col + distance + 1, size))
+                    if (other_row, other_col) != (row, col)
+                )
+            )
+        neighborhoods = tuple(neighborhoods)
+        _NEIGHBORHOODS[size, distance] = neighborhoods
+    return neighborhoods
+
+
+def get_center_cells(size):
+    """Returns the center cell of the board, or the four center cells of an even-sized board."""
+    middle = [size // 2] if size % 2 == 1 else [size // 2 - 1, size // 2]
+    return [row * size + col for row in middle for col in middle]
+
+
+class CandidateMoves:
+    """
+    Keeps the set of empty cells within `distance` of any stone.
+
+    Every cell counts the stones in its neighborhood, so placing or removing a
+    stone only updates the (2 * distance + 1)² cells around it. Searches apply and
+    undo moves on it alongside their `LineTracker` and only consider the cells it
+    returns, which keeps the branching factor small on large, sparse boards.
+    """
+
+    __slots__ = ("size", "neighborhoods", "occupied", "nearby", "frontier", "stones")
+
+    def __init__(self, board, size, distance=DEFAULT_DISTANCE):
+        self.size = size
+        self.neighborhoods = get_neighborhoods(size, distance)
+        self.occupied = [False] * (size * size)
+        self.nearby = [0] * (size * size)  # Stones in each cell's neighborhood
+        self.frontier = set()
+        self.stones = 0
+        for cell, player in enumerate(board):
+            if player != " ":
+                self.place(cell)
+
+    def place(self, cell):
+        """Records a stone on the empty cell."""
+        nearby = self.nearby
+        occupied = self.occupied
+        frontier = self.frontier
+        for neighbor in self.neighborhoods[cell]:
+            nearby[neighbor] += 1
+            if not occupied[neighbor]:
+                frontier.add(neighbor)
+        occupied[cell] = True
+        frontier.discard(cell)
+        self.stones += 1
+
+    def remove(self, cell):
+        """Takes the stone back off the cell."""
+        nearby = self.nearby
+        occupied = self.occupied
+        frontier = self.frontier
+        for neighbor in self.neighborhoods[cell]:
+            nearby[neighbor] -= 1
+            if not nearby[neighbor]:
+                frontier.discard(neighbor)
+        occupied[cell] = False
+        if nearby[cell]:
+            frontier.add(cell)
+        self.stones -= 1
+
+    def moves(self):
+        """Returns the candidate cells in ascending order; the center on an empty board."""
+        if not self.stones:
+            return get_center_cells(self.size)
+        return sorted(self.frontier)
+
+
+def uses_candidates(size):
+    """Checks if moves on a board of this size are restricted to candidate cells."""
+    return size >= CANDIDATE_MIN_SIZE
+
+
+def get_candidate_moves(board, size, distance=DEFAULT_DISTANCE):
+    """
+    Returns the moves worth considering on a list board.
+
+    On boards of CANDIDATE_MIN_SIZE and up these are the empty cells within `distance`
+    of a stone (the center on an empty board); on smaller boards, every empty cell.
+    """
+    if not uses_candidates(size):
+        return [cell for cell in range(size * size) if board[cell] == " "]
+    return CandidateMoves(board, size, distance).moves()
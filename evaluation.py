@@ -0,0 +1,84 @@
+from board import get_lines
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure Python path is always available
+    np = None
+
+POSITIONAL_LIMIT = 9  # Stays below the win score of 10 so a real win always ranks higher
+NUMPY_MIN_LINES = 14  # Below this many lines recounting in Python beats NumPy's call overhead
+
+_LINE_WEIGHTS = {}
+_LINE_INDEX_ARRAYS = {}
+_WEIGHT_ARRAYS = {}
+
+
+def get_line_weights(size, win_length=None):
+    """Returns the weight of an open line holding 0..line length stones of one player."""
+    length = win_length or size
+    weights = _LINE_WEIGHTS.get(length)
+    if weights is None:
+        weights = tuple((stones / length) ** 2 for stones in range(length + 1))
+        _LINE_WEIGHTS[length] = weights
+    return weights
+
+
+def get_line_index_array(size, win_length=None):
+    """Returns the winning lines as a 2-D NumPy array of cell indices, one row per line."""
+    win_length = win_length or size
+    index = _LINE_INDEX_ARRAYS.get((size, win_length))
+    if index is None:
+        index = np.array(get_lines(size, win_length), dtype=np.intp)
+        _LINE_INDEX_ARRAYS[size, win_length] = index
+        _WEIGHT_ARRAYS[win_length] = np.array(get_line_weights(size, win_length))
+    return index
+
+
+def score_line_counts(own_counts, opponent_counts, size, win_length=None):
+    """
+    Scores a position from per-line stone counts.
+
+    A line still winnable by one side (no opposing stones on it) adds or subtracts
+    its weight; lines blocked for both sides count for nothing. The total is scaled
+    into [-POSITIONAL_LIMIT, POSITIONAL_LIMIT].
+    """
+    weights = get_line_weights(size, win_length)
+    total = 0.0
+    for own, opponent in zip(own_counts, opponent_counts):
+        if opponent == 0:
+            total += weights[own]
+        elif own == 0:
+            total -= weights[opponent]
+    return total * POSITIONAL_LIMIT / len(own_counts)
+
+
+def score_lines_numpy(board, player, size, win_length=None):
+    """Scores a list board like score_line_counts, counting the stones of every line at once with NumPy."""
+    index = get_line_index_array(size, win_length)
+    weights = _WEIGHT_ARRAYS[win_length or size]
+    cells = np.frombuffer("".join(board).encode("ascii"), dtype=np.uint8)[index]
+    own = np.count_nonzero(cells == ord(player), axis=1)
+    opponent = np.count_nonzero(cells == ord("O" if player == "X" else "X"), axis=1)
+    total = weights[own][opponent == 0].sum() - weights[opponent][own == 0].sum()
+    return float(total) * POSITIONAL_LIMIT / len(index)
+
+
+def evaluate_position(board, player, size, tracker=None, win_length=None):
+    """
+    Returns a positional score of the board for the player, based on open-line counting.
+
+    The counts of the given `LineTracker` are used directly since they are already up to date,
+    and so is its win length. Without one, large boards are recounted by the vectorized NumPy
+    path when NumPy is installed, and small boards in plain Python.
+    """
+    opponent = "O" if player == "X" else "X"
+    if tracker is not None:
+        return score_line_counts(
+            tracker.counts[player], tracker.counts[opponent], size, tracker.win_length
+        )
+    lines = get_lines(size, win_length)
+    if np is not None and len(lines) >= NUMPY_MIN_LINES:
+        return score_lines_numpy(board, player, size, win_length)
+    own_counts = [sum(1 for cell in line if board[cell] == player) for line in lines]
+    opponent_counts = [sum(1 for cell in line if board[cell] == opponent) for line in lines]
+    return score_line_counts(own_counts, opponent_counts, size, win_length)
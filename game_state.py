@@ -0,0 +1,123 @@
+import random
+from array import array
+
+SYMBOLS = " XO"
+CODES = {" ": 0, "X": 1, "O": 2}
+
+
+class GameState:
+    """
+    A board stored as one signed byte per cell, with the side to move and the empty cells.
+
+    The empty cells are kept in the `free` list, and `positions[cell]` is the index of
+    an empty cell in it, so a cell is taken or freed in constant time by swapping it
+    with the last entry. That makes the empty count, the "is the board full?" check
+    and picking a random move O(1).
+
+    For reading and writing it behaves like the list board the other modules take:
+    `state[cell]` is " ", "X" or "O", assigning a stone or " " to a cell keeps the
+    empty cells current, and len(), iteration, slicing, `in` and count() work as on
+    a list. Any function written for the list form accepts a GameState unchanged;
+    from_board() and to_list() convert between the two.
+    """
+
+    __slots__ = ("size", "cells", "to_move", "free", "positions")
+
+    def __init__(self, size, to_move="X"):
+        self.size = size
+        self.cells = array("b", bytes(size * size))
+        self.to_move = to_move
+        self.free = list(range(size * size))
+        self.positions = list(range(size * size))
+
+    @classmethod
+    def from_board(cls, board, size, to_move="X"):
+        """Returns a GameState holding the stones of a list board."""
+        state = cls(size, to_move)
+        for cell, player in enumerate(board):
+            if player != " ":
+                state[cell] = player
+        return state
+
+    def to_list(self):
+        """Returns the board as a list of " ", "X" and "O"."""
+        return list(self)
+
+    def copy(self):
+        """Returns an independent copy of the state."""
+        state = GameState.__new__(GameState)
+        state.size = self.size
+        state.cells = array("b", self.cells)
+        state.to_move = self.to_move
+        state.free = list(self.free)
+        state.positions = list(self.positions)
+        return state
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __iter__(self):
+        return map(SYMBOLS.__getitem__, self.cells)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [SYMBOLS[code] for code in self.cells[index]]
+        return SYMBOLS[self.cells[index]]
+
+    def __setitem__(self, cell, player):
+        code = CODES[player]
+        previous = self.cells[cell]
+        if code == previous:
+            return
+        self.cells[cell] = code
+        if code == 0:
+            self.positions[cell] = len(self.free)
+            self.free.append(cell)
+        elif previous == 0:
+            # Move the last free cell into the taken cell's slot
+            position = self.positions[cell]
+            last = self.free.pop()
+            if last != cell:
+                self.free[position] = last
+                self.positions[last] = position
+
+    def __contains__(self, player):
+        if player == " ":
+            return bool(self.free)
+        return player in CODES and CODES[player] in self.cells
+
+    def __eq__(self, other):
+        if isinstance(other, GameState):
+            return self.cells == other.cells and self.to_move == other.to_move
+        if isinstance(other, list):
+            return self.to_list() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"GameState({self.to_list()!r}, to_move={self.to_move!r})"
+
+    def count(self, player):
+        """Returns the number of cells holding the player's stones, or " " for the empty cells."""
+        if player == " ":
+            return len(self.free)
+        return self.cells.count(CODES[player]) if player in CODES else 0
+
+    @property
+    def empty_count(self):
+        """The number of empty cells."""
+        return len(self.free)
+
+    def is_full(self):
+        """Checks if no empty cell is left."""
+        return not self.free
+
+    def random_move(self, rng=random):
+        """Returns a random empty cell in constant time."""
+        return self.free[rng.randrange(len(self.free))]
+
+    def play(self, cell):
+        """Places the stone of the side to move on the cell and passes the turn."""
+        self[cell] = self.to_move
+        self.to_move = "O" if self.to_move == "X" else "X"
@@ -9,23 +9,29 @@ from moves import (
 )
 
 
+def print_usage():
+    """Prints the command line usage."""
+    print("Usage: python main.py [strategy] [size] [--time-limit SECONDS] [--win-length K] [--stats] [--ponder] [--reuse-tree]")
+    print("Strategy options: random, strategic, minimax, mcts, worst")
+
+
 def get_strategy_and_size():
     """
     Gets the strategy and board size from command line arguments.
 
-    Validates that exactly two arguments are provided:
-    - The first argument is the strategy (random, strategic, minimax, worst).
+    Validates that the first two arguments are provided:
+    - The first argument is the strategy (random, strategic, minimax, mcts, worst).
     - The second argument is the board size (an integer >= 3).
 
+    Any further arguments are options, read by get_options().
     If validation fails, prints an error message and exits the program.
     """
-    if len(sys.argv) != 3:
-        print("Usage: python main.py [strategy] [size]")
-        print("Strategy options: random, strategic, minimax, worst")
+    if len(sys.argv) < 3:
+        print_usage()
         sys.exit(1)
     
     strategy = sys.argv[1]
-    valid_strategies = ['random', 'strategic', 'minimax', 'worst']
+    valid_strategies = ['random', 'strategic', 'minimax', 'mcts', 'worst']
     if strategy not in valid_strategies:
         print(f"Invalid strategy. Please choose from: {', '.join(valid_strategies)}")
         sys.exit(1)
@@ -40,10 +46,71 @@ def get_strategy_and_size():
     return strategy, size
 
 
+def get_options(size=None):
+    """
+    Gets the optional settings that follow the strategy and size on the command line.
+
+    Supported options:
+    - `--time-limit SECONDS`: per-move time budget for the computer (a number > 0).
+    - `--win-length K`: number of stones in a row, column or any diagonal that wins
+      (an integer >= 3, and at most the board `size` when it is given). Defaults to the board size.
+    - `--stats`: print the search statistics of every computer move.
+    - `--ponder`: let the minimax strategy search its replies while the player is thinking.
+    - `--reuse-tree`: let the minimax strategy keep its search results from move to move.
+
+    Returns a dict with every option, set to None (or False for flags) when it was not given.
+    If an option is unknown or its value is invalid, prints an error message and exits the program.
+    """
+    options = {
+        "time_limit": None,
+        "win_length": None,
+        "stats": False,
+        "ponder": False,
+        "reuse_tree": False,
+    }
+    args = sys.argv[3:]
+    while args:
+        name = args.pop(0)
+        if name in ("--stats", "--ponder", "--reuse-tree"):
+            options[name[2:].replace("-", "_")] = True
+            continue
+        if name not in ("--time-limit", "--win-length") or not args:
+            print_usage()
+            sys.exit(1)
+        if name == "--win-length":
+            try:
+                options["win_length"] = int(args.pop(0))
+                if options["win_length"] < 3 or (size is not None and options["win_length"] > size):
+                    raise ValueError
+            except ValueError:
+                print("Invalid win length. Please enter an integer from 3 up to the board size.")
+                sys.exit(1)
+            continue
+        try:
+            options["time_limit"] = float(args.pop(0))
+            if options["time_limit"] <= 0:
+                raise ValueError
+        except ValueError:
+            print("Invalid time limit. Please enter a number of seconds greater than 0.")
+            sys.exit(1)
+    return options
+
+
 def main():
     strategy, size = get_strategy_and_size()
+    options = get_options(size)
     board, current_player = initialize_game(size)
-    play_game(board, current_player, strategy, size)
+    play_game(
+        board,
+        current_player,
+        strategy,
+        size,
+        time_limit=options["time_limit"],
+        log_stats=options["stats"],
+        win_length=options["win_length"],
+        ponder=options["ponder"],
+        reuse_tree=options["reuse_tree"],
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,75 @@
+from collections import OrderedDict
+
+from symmetry import canonical_board, from_canonical_move, to_canonical_move
+
+DEFAULT_CAPACITY = 1 << 14
+
+
+class MoveCache:
+    """
+    Bounded cache of computer moves that evicts the least recently used entry.
+
+    Entries are keyed by (strategy, size, win length, time limit, player, position),
+    where the position is the board joined into a string. With `symmetric` the
+    position is the canonical board from symmetry.canonical_board and the move is
+    stored on it, so every rotation or reflection of a cached position hits too, at
+    the cost of transforming the board 8 times per lookup. `hits`, `misses` and
+    `evictions` count lookups and dropped entries since the last clear().
+    """
+
+    __slots__ = ("capacity", "symmetric", "entries", "hits", "misses", "evictions")
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, symmetric=False):
+        if capacity < 1:
+            raise ValueError("Move cache capacity must be at least 1.")
+        self.capacity = capacity
+        self.symmetric = symmetric
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def key(self, board, strategy, player, size, win_length=None, time_limit=None):
+        """Returns the cache key of a position and the index of the symmetry it was read through."""
+        if self.symmetric:
+            position, index = canonical_board(board, size)
+        else:
+            position, index = board, 0
+        return (strategy, size, win_length or size, time_limit, player, "".join(position)), index
+
+    def get(self, key, index, size):
+        """Returns the cached move for the key on the real board, or None if it is not cached."""
+        move = self.entries.get(key)
+        if move is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return from_canonical_move(move, index, size) if self.symmetric else move
+
+    def put(self, key, index, size, move):
+        """Stores the move played on the real board, evicting the oldest entry when full."""
+        if move is None:
+            return  # A full board has no move, and get() would read it as a miss anyway
+        if self.symmetric:
+            move = to_canonical_move(move, index, size)
+        self.entries[key] = move
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Drops every entry and resets the counters."""
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def hit_rate(self):
+        """Returns the fraction of lookups that found their position."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
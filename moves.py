@@ -1,6 +1,30 @@
+import atexit
 import random
-from ai_strategies import get_strategic_move, get_minimax_move, get_worst_move
-from board import print_board, check_winner, check_draw
+import time
+from concurrent.futures import ProcessPoolExecutor
+from ai_strategies import (
+    SearchSession,
+    get_strategic_move,
+    get_minimax_move,
+    get_mcts_move,
+    get_worst_move,
+)
+from board import print_board, LineTracker
+from game_state import GameState
+from move_cache import MoveCache
+from pondering import Ponderer
+from position_store import PositionStore, position_key
+from search_stats import SearchStats
+from solved_table import SIZE as SOLVED_SIZE, get_solved_move
+from symmetry import canonical_board, from_canonical_move
+
+LARGE_BOARD_SIZE = 10  # From this size on, searching moves get a time budget by default
+LARGE_BOARD_TIME_LIMIT = 0.08
+DETERMINISTIC_STRATEGIES = ("strategic", "minimax")
+BATCH_CHUNK_SIZE = 512
+
+move_cache = MoveCache()
+position_store = None
 
 
 def get_player_move(board, size):
@@ -22,47 +46,306 @@ def get_player_move(board, size):
             print("Please enter a valid number.")
 
 
-def get_computer_move(board, strategy, player, size):
-    """Gets a move for the computer based on the chosen strategy."""
+def get_computer_move(
+    board,
+    strategy,
+    player,
+    size,
+    time_limit=None,
+    stats=None,
+    win_length=None,
+    table=None,
+    cache=None,
+    session=None,
+):
+    """
+    Gets a move for the computer based on the chosen strategy.
+
+    Strategic and minimax moves are served from the move cache when they can be; 3x3
+    minimax plays from the solved table.
+
+    - `time_limit`: per-move seconds for the searching strategies (default on boards of
+      LARGE_BOARD_SIZE and up: LARGE_BOARD_TIME_LIMIT).
+    - `stats`: a `SearchStats` to fill in; the search then always runs.
+    - `win_length`: the number in a row that wins (default: the board size).
+    - `table`: a `TranspositionTable` to share between minimax searches.
+    - `cache`: the `MoveCache` to use instead of the module's `move_cache`.
+    - `session`: the player's `SearchSession`, to reuse its previous search.
+
+    Random, mcts and worst moves are drawn at random and never cached, and neither are
+    moves searched with a `table` or `session`, which depend on what the table has seen.
+    """
+    if time_limit is None and size >= LARGE_BOARD_SIZE:
+        time_limit = LARGE_BOARD_TIME_LIMIT
+    if session is not None and strategy == "minimax":
+        session.reroot(board)
+        if table is None:
+            table = session.table
+    if cache is None:
+        cache = move_cache
+    if (
+        cache is None
+        or stats is not None
+        or table is not None
+        or strategy not in DETERMINISTIC_STRATEGIES
+    ):
+        return choose_computer_move(
+            board, strategy, player, size, time_limit, stats, win_length, table
+        )
+    key, index = cache.key(board, strategy, player, size, win_length, time_limit)
+    move = cache.get(key, index, size)
+    if move is None:
+        move = choose_computer_move(
+            board, strategy, player, size, time_limit, None, win_length, table
+        )
+        cache.put(key, index, size, move)
+    return move
+
+
+def choose_computer_move(board, strategy, player, size, time_limit, stats, win_length, table):
+    """Runs the strategy for get_computer_move, after its defaults are applied and without the cache."""
     if strategy == "random":
+        if isinstance(board, GameState):
+            return board.random_move()
         available_moves = [i for i, x in enumerate(board) if x == " "]
         return random.choice(available_moves)
     elif strategy == "strategic":
-        return get_strategic_move(board, player, size)
+        return get_strategic_move(board, player, size, win_length)
     elif strategy == "minimax":
-        return get_minimax_move(board, player, size)
+        if (win_length or size) == size:
+            move = get_solved_move(board, player, size)
+            if move is not None:
+                return move
+        return get_minimax_move(
+            board,
+            player,
+            size,
+            table=table,
+            time_limit=time_limit,
+            stats=stats,
+            win_length=win_length,
+            store=position_store,
+        )
+    elif strategy == "mcts":
+        return get_mcts_move(
+            board, player, size, time_limit=time_limit, stats=stats, win_length=win_length
+        )
     elif strategy == "worst":
-        return get_worst_move(board, player, size)
+        return get_worst_move(board, player, size, win_length)
     else:
         raise ValueError(
-            "Invalid strategy. Choose 'random', 'strategic', 'minimax', or 'worst'."
+            "Invalid strategy. Choose 'random', 'strategic', 'minimax', 'mcts', or 'worst'."
         )
 
 
+def set_move_cache(cache):
+    """Replaces the `MoveCache` get_computer_move uses by default; None turns caching off."""
+    global move_cache
+    move_cache = cache
+
+
+def open_position_store(path, **options):
+    """
+    Opens the `PositionStore` at `path` for the minimax strategy of get_computer_move to use.
+
+    Any store opened before is closed first; the new one is flushed and closed when the
+    process exits. `options` are passed on to PositionStore.
+    """
+    global position_store
+    close_position_store()
+    position_store = PositionStore(path, **options)
+    return position_store
+
+
+@atexit.register
+def close_position_store():
+    """Flushes and closes the store from open_position_store, if one is open."""
+    global position_store
+    if position_store is not None:
+        position_store.close()
+        position_store = None
+
+
+def open_worker_store(path):
+    """Pool initializer that opens the position store file afresh in a worker process."""
+    global position_store
+    position_store = None  # A forked worker must not share the parent's connection
+    if path is not None:
+        open_position_store(path)
+
+
+def get_batch_chunk_moves(task):
+    """
+    Computes the moves for one chunk of a batch; runs in a pool worker or in this process.
+
+    `task` is a (boards, strategy, player, size, time_limit, win_length) tuple. Each
+    board is searched on its own, so its move does not depend on the rest of the batch,
+    while the line, key and solved-table caches of the modules stay loaded from one
+    board to the next. With a position store open, the chunk's minimax positions are
+    read from it in a few batched queries and its new results are written when the
+    chunk is done.
+    """
+    boards, strategy, player, size, time_limit, win_length = task
+    if position_store is not None and strategy == "minimax":
+        position_store.prefetch(
+            position_key(board, player, size, win_length)[0] for board in boards
+        )
+    moves = [
+        get_computer_move(board, strategy, player, size, time_limit, None, win_length)
+        for board in boards
+    ]
+    if position_store is not None:
+        position_store.flush()  # Pool workers exit without running atexit handlers
+    return moves
+
+
+def get_computer_moves(
+    boards,
+    strategy,
+    player,
+    size,
+    time_limit=None,
+    win_length=None,
+    processes=None,
+    chunk_size=BATCH_CHUNK_SIZE,
+    symmetric=None,
+):
+    """
+    Gets the computer's move for every board of a batch, in input order.
+
+    The strategic and minimax strategies always pick the same move for a position, so
+    each position is computed once. Identical boards share one move, and with `symmetric`
+    so do rotations and reflections of one another: the move is found on their canonical
+    form and mapped back onto each board. Finding the canonical form costs more than a
+    strategic move or a solved-table lookup, so `symmetric` defaults to on only for
+    minimax searches on boards other than 3x3. The random, mcts and worst strategies
+    draw a move for every board. With `processes` above 1 the unique positions are split
+    into chunks of `chunk_size` and spread over a process pool of that many workers;
+    otherwise they are computed in this process.
+    """
+    if symmetric is None:
+        symmetric = strategy == "minimax" and size != SOLVED_SIZE
+    if strategy in DETERMINISTIC_STRATEGIES:
+        positions = {}  # Board tuple -> index into unique
+        unique = []
+        lookups = []  # (position index, symmetry index) of every input board
+        for board in boards:
+            if symmetric:
+                key, index = canonical_board(board, size)
+            else:
+                key, index = tuple(board), 0
+            position = positions.get(key)
+            if position is None:
+                position = positions[key] = len(unique)
+                unique.append(list(key))
+            lookups.append((position, index))
+    else:
+        unique = [list(board) for board in boards]
+        lookups = None
+
+    tasks = [
+        (unique[start:start + chunk_size], strategy, player, size, time_limit, win_length)
+        for start in range(0, len(unique), chunk_size)
+    ]
+    if processes is not None and processes > 1 and len(tasks) > 1:
+        store_path = None
+        if position_store is not None:
+            position_store.flush()  # So the workers see this process's results
+            store_path = position_store.path
+        with ProcessPoolExecutor(
+            max_workers=processes, initializer=open_worker_store, initargs=(store_path,)
+        ) as executor:
+            chunks = list(executor.map(get_batch_chunk_moves, tasks))
+    else:
+        chunks = [get_batch_chunk_moves(task) for task in tasks]
+    moves = [move for chunk in chunks for move in chunk]
+
+    if lookups is None:
+        return moves
+    if not symmetric:
+        return [moves[position] for position, _ in lookups]
+    # A full board has no move, so there is nothing to map back
+    return [
+        None if moves[position] is None else from_canonical_move(moves[position], index, size)
+        for position, index in lookups
+    ]
+
+
 def switch_player(current_player):
     """Switches the current player."""
     return "O" if current_player == "X" else "X"
 
 
 def initialize_game(size):
-    """Initializes the game by setting up the board and choosing a starting player."""
-    board = [" "] * (size * size)
+    """
+    Initializes the game by setting up the board and choosing a starting player.
+
+    The board is an empty `GameState` with the starting player to move.
+    """
     current_player = random.choice(["X", "O"])  # Randomly choose starting player
-    return board, current_player
+    return GameState(size, current_player), current_player
+
 
+def play_game(
+    board,
+    current_player,
+    strategy,
+    size,
+    time_limit=None,
+    log_stats=False,
+    win_length=None,
+    ponder=False,
+    reuse_tree=False,
+):
+    """
+    Plays the game loop.
 
-def play_game(board, current_player, strategy, size):
-    """Plays the game loop."""
+    With `log_stats`, the search statistics of every computer move are printed after it.
+    `win_length` is the number in a row that wins (default: the board size).
+
+    With `ponder`, the minimax strategy searches its replies while the player is
+    choosing a move (see pondering.Ponderer). A reply already found for the move
+    played is made at once; otherwise the search starts from the pondering
+    transposition table. 3x3 minimax plays from the solved table and never ponders.
+
+    With `reuse_tree` or `ponder`, the computer's minimax searches share one
+    `SearchSession` for the game, and bypass the move cache.
+    """
+    tracker = LineTracker(board, size, win_length)
+    stats = SearchStats() if log_stats else None
+    if time_limit is None and size >= LARGE_BOARD_SIZE:
+        time_limit = LARGE_BOARD_TIME_LIMIT
+    ponder = ponder and strategy == "minimax" and size != SOLVED_SIZE
+    session = SearchSession() if strategy == "minimax" and (reuse_tree or ponder) else None
+    ponderer = None
+    reply = None
     while True:
         print_board(board, size)
-        move = get_move(current_player, board, strategy, size)
+        if stats is not None:
+            stats.reset()
+        if ponder and current_player == "X":
+            ponderer = Ponderer(
+                board, "O", size, time_limit, win_length=win_length, table=session.table
+            ).start()
+        if reply is not None:
+            move = reply
+            reply = None
+        else:
+            move = get_move(
+                current_player, board, strategy, size, time_limit, stats, win_length, session
+            )
+        if ponderer is not None and current_player == "X":
+            reply = ponderer.finish(move)
+            ponderer = None
         update_board(board, move, current_player)
+        if stats is not None and stats.nodes:
+            print(f"Search: {stats}")
 
-        if check_winner(board, current_player, size):
+        if tracker.place(move, current_player):
             print_board(board, size)
             print(f"Player {current_player} wins!")
             break
-        elif check_draw(board):
+        elif tracker.is_full():
             print_board(board, size)
             print("It's a draw!")
             break
@@ -70,15 +353,60 @@ def play_game(board, current_player, strategy, size):
         current_player = switch_player(current_player)
 
 
-def get_move(player, board, strategy, size):
-    """Gets the move for the current player."""
+def play_headless_game(
+    strategies, size, current_player="X", time_limit=None, win_length=None, reuse_tree=False
+):
+    """
+    Plays one computer-vs-computer game without any input or output.
+
+    `strategies` maps "X" and "O" to the strategy each side plays. Returns the winner
+    ("X", "O", or None for a draw) and a list of (player, seconds) for every move.
+    With `reuse_tree`, each minimax side keeps a `SearchSession` for the game.
+    """
+    board = GameState(size, current_player)
+    tracker = LineTracker(board, size, win_length)
+    sessions = {
+        player: SearchSession() if reuse_tree and strategy == "minimax" else None
+        for player, strategy in strategies.items()
+    }
+    move_times = []
+    while True:
+        start = time.perf_counter()
+        move = get_computer_move(
+            board,
+            strategies[current_player],
+            current_player,
+            size,
+            time_limit,
+            win_length=win_length,
+            session=sessions[current_player],
+        )
+        move_times.append((current_player, time.perf_counter() - start))
+        board.play(move)
+
+        if tracker.place(move, current_player):
+            return current_player, move_times
+        elif tracker.is_full():
+            return None, move_times
+
+        current_player = switch_player(current_player)
+
+
+def get_move(
+    player, board, strategy, size, time_limit=None, stats=None, win_length=None, session=None
+):
+    """Gets the move for the current player; the computer searches with its `SearchSession`, if given."""
     if player == "X":
         return get_player_move(board, size)
     else:
-        return get_computer_move(board, strategy, player, size)
+        return get_computer_move(
+            board, strategy, player, size, time_limit, stats, win_length, session=session
+        )
 
 
 def update_board(board, move, player):
-    """Updates the board with the player's move."""
+    """Updates the board with the player's move, and passes the turn on a `GameState`."""
     board[move] = player
+    if isinstance(board, GameState):
+        board.to_move = switch_player(player)
     print(f"Move made by {player} at position {move + 1}")
@@ -0,0 +1,120 @@
+import threading
+
+from ai_strategies import SearchTimeout, get_minimax_move
+from board import LineTracker
+from candidates import get_candidate_moves
+from move_ordering import MoveOrdering
+from transposition import TranspositionTable
+
+
+class Ponderer:
+    """
+    Searches the computer's replies on the opponent's time.
+
+    While the opponent thinks about a move on `board`, a background thread takes
+    the opponent's moves in order of promise (move_ordering's static order over
+    the candidate cells) and runs the same minimax search the computer's turn
+    would run after each of them. The searches share one transposition table,
+    which the computer's real search can reuse through `table`.
+
+    Call finish() with the move actually played. If its reply has been searched
+    it is returned; if it is being searched, finish() waits for it; otherwise the
+    background search is cancelled and None is returned. Cancelling sets the
+    `stop` event passed to get_minimax_move, which then raises SearchTimeout at
+    its next node, timed or not.
+    """
+
+    __slots__ = (
+        "board",
+        "player",
+        "size",
+        "time_limit",
+        "max_depth",
+        "win_length",
+        "table",
+        "results",
+        "current",
+        "finishing",
+        "stop",
+        "condition",
+        "thread",
+    )
+
+    def __init__(
+        self, board, player, size, time_limit=None, max_depth=3, win_length=None, table=None
+    ):
+        self.board = list(board)
+        self.player = player
+        self.size = size
+        self.time_limit = time_limit
+        self.max_depth = max_depth
+        self.win_length = win_length
+        self.table = table if table is not None else TranspositionTable()
+        self.results = {}  # Opponent move -> computer reply
+        self.current = None  # Opponent move whose reply is being searched
+        self.finishing = False
+        self.stop = threading.Event()
+        self.condition = threading.Condition()
+        self.thread = threading.Thread(target=self.run, name="ponder", daemon=True)
+
+    def start(self):
+        """Starts searching in the background and returns self."""
+        self.thread.start()
+        return self
+
+    def likely_moves(self):
+        """Returns the opponent's candidate moves, most promising first."""
+        opponent = "O" if self.player == "X" else "X"
+        tracker = LineTracker(self.board, self.size, self.win_length)
+        moves = get_candidate_moves(self.board, self.size)
+        return MoveOrdering(self.size).order(self.board, opponent, 0, tracker, moves=moves)
+
+    def search_reply(self, tracker, move, opponent):
+        """Returns the computer's reply after the opponent's move, or None if that ends the game."""
+        try:
+            if tracker.place(move, opponent) or tracker.is_full():
+                return None
+            return get_minimax_move(
+                tracker.cells,
+                self.player,
+                self.size,
+                table=self.table,
+                time_limit=self.time_limit,
+                max_depth=self.max_depth,
+                win_length=self.win_length,
+                stop=self.stop,
+            )
+        finally:
+            tracker.remove(move, opponent)
+
+    def run(self):
+        opponent = "O" if self.player == "X" else "X"
+        tracker = LineTracker(self.board, self.size, self.win_length)
+        try:
+            for move in self.likely_moves():
+                with self.condition:
+                    if self.finishing:
+                        return
+                    self.current = move
+                reply = self.search_reply(tracker, move, opponent)
+                with self.condition:
+                    self.results[move] = reply
+                    self.current = None
+                    self.condition.notify_all()
+        except SearchTimeout:
+            pass  # Cancelled by finish()
+        finally:
+            with self.condition:
+                self.current = None
+                self.condition.notify_all()
+
+    def finish(self, move):
+        """Stops pondering and returns the reply found for the opponent's `move`, or None."""
+        with self.condition:
+            self.finishing = True
+            while self.current == move:
+                self.condition.wait()
+            reply = self.results.get(move)
+        self.stop.set()
+        self.thread.join()
+        return reply
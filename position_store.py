@@ -0,0 +1,216 @@
+"""
+Persistent cache of searched positions in a local SQLite file.
+
+A `PositionStore` keeps the best move found for a position together with the
+depth it was searched to, in plies, so a later search can reuse it instead of
+starting cold, in this process, a later run or another process sharing the file.
+get_minimax_move takes one as `store`. Positions are keyed by board size, win
+length, player to move and canonical board, so all rotations and reflections of
+a position share an entry.
+
+Opening a store warm-loads its most recently used entries into memory; entries
+that are not in memory are read on a miss, or for many keys at once with
+prefetch(). Writes are kept in memory and written behind in one transaction once
+`flush_size` of them are pending or `flush_interval` seconds have passed, and on
+flush() or close(). Each flush drops entries not used for `max_age` seconds and
+then the least recently used ones beyond `capacity`.
+"""
+import itertools
+import sqlite3
+import time
+
+from symmetry import canonical_board, from_canonical_move, to_canonical_move
+
+DEFAULT_CAPACITY = 1 << 18
+FLUSH_SIZE = 256
+FLUSH_INTERVAL = 5.0
+READ_BATCH = 500  # Keys per SELECT, below SQLite's limit on bound parameters
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS positions (
+    key TEXT PRIMARY KEY,
+    move INTEGER NOT NULL,
+    depth INTEGER NOT NULL,
+    used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS positions_used ON positions (used);
+"""
+
+
+def position_key(board, player, size, win_length=None):
+    """Returns the store key of a position and the index of the symmetry that makes it canonical."""
+    canonical, index = canonical_board(board, size)
+    return f"{size}:{win_length or size}:{player}:{''.join(canonical)}", index
+
+
+class PositionStore:
+    """
+    SQLite-backed map from position keys to (move, depth), with moves on the canonical board.
+
+    Use lookup() and record() to work with real boards; get(), put() and prefetch()
+    take keys from position_key(). `hits` and `misses` count get() calls, and
+    `writes` the entries flushed to the file.
+
+    get_minimax_move returns a stored move without searching when it comes from a
+    search at least as deep as the one asked for, or from a solved position, whose
+    depth is its number of empty cells. A timed search that cannot get deeper
+    returns it too. Deeper results replace the stored ones.
+    """
+
+    __slots__ = (
+        "path",
+        "connection",
+        "capacity",
+        "max_age",
+        "flush_size",
+        "flush_interval",
+        "entries",
+        "pending",
+        "touched",
+        "last_flush",
+        "hits",
+        "misses",
+        "writes",
+    )
+
+    def __init__(
+        self,
+        path,
+        capacity=DEFAULT_CAPACITY,
+        max_age=None,
+        flush_size=FLUSH_SIZE,
+        flush_interval=FLUSH_INTERVAL,
+        warm=None,
+    ):
+        if capacity < 1:
+            raise ValueError("Position store capacity must be at least 1.")
+        self.path = path
+        self.capacity = capacity
+        self.max_age = max_age
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.entries = {}
+        self.pending = {}  # key -> (move, depth, used), not yet written
+        self.touched = {}  # key -> used, for entries read since the last flush
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        # WAL lets other processes read the file while this one writes
+        self.connection = sqlite3.connect(path, timeout=30)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(SCHEMA)
+        self.evict()
+        self.connection.commit()
+        self.last_flush = time.monotonic()
+        self.warm_load(capacity if warm is None else warm)
+
+    def warm_load(self, limit):
+        """Loads up to `limit` of the most recently used entries into memory."""
+        rows = self.connection.execute(
+            "SELECT key, move, depth FROM positions ORDER BY used DESC LIMIT ?", (limit,)
+        )
+        for key, move, depth in rows:
+            self.entries[key] = (move, depth)
+
+    def get(self, key):
+        """Returns the (move, depth) stored for a key, or None."""
+        entry = self.entries.get(key)
+        if entry is None:
+            row = self.connection.execute(
+                "SELECT move, depth FROM positions WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            entry = self.entries[key] = row
+        self.hits += 1
+        self.touched[key] = time.time()
+        return entry
+
+    def prefetch(self, keys):
+        """Reads the entries of many keys into memory with a few batched queries."""
+        missing = [key for key in set(keys) if key not in self.entries]
+        for start in range(0, len(missing), READ_BATCH):
+            batch = missing[start:start + READ_BATCH]
+            rows = self.connection.execute(
+                "SELECT key, move, depth FROM positions WHERE key IN (%s)"
+                % ", ".join("?" * len(batch)),
+                batch,
+            )
+            for key, move, depth in rows:
+                self.entries[key] = (move, depth)
+
+    def put(self, key, move, depth):
+        """Stores a move unless the key already holds a deeper result; written behind."""
+        entry = self.entries.get(key)
+        if entry is not None and entry[1] > depth:
+            return
+        self.entries[key] = (move, depth)
+        self.pending[key] = (move, depth, time.time())
+        if (
+            len(self.pending) >= self.flush_size
+            or time.monotonic() - self.last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def lookup(self, board, player, size, win_length=None):
+        """Returns the stored (move, depth) of a position with the move on this board, or None."""
+        key, index = position_key(board, player, size, win_length)
+        entry = self.get(key)
+        if entry is None:
+            return None
+        return from_canonical_move(entry[0], index, size), entry[1]
+
+    def record(self, board, player, size, move, depth, win_length=None):
+        """Stores the move played on this board and the depth it was searched to."""
+        key, index = position_key(board, player, size, win_length)
+        self.put(key, to_canonical_move(move, index, size), depth)
+
+    def evict(self):
+        """Drops entries older than `max_age`, then the least recently used beyond `capacity`."""
+        if self.max_age is not None:
+            self.connection.execute(
+                "DELETE FROM positions WHERE used < ?", (time.time() - self.max_age,)
+            )
+        count = self.connection.execute("SELECT COUNT(*) FROM positions").fetchone()[0]
+        if count > self.capacity:
+            self.connection.execute(
+                "DELETE FROM positions WHERE key IN "
+                "(SELECT key FROM positions ORDER BY used LIMIT ?)",
+                (count - self.capacity,),
+            )
+
+    def flush(self):
+        """Writes the pending entries and access times in one transaction, then evicts."""
+        if not self.pending and not self.touched:
+            self.last_flush = time.monotonic()
+            return
+        with self.connection:
+            # Another process may have stored a deeper result in the meantime
+            self.connection.executemany(
+                "INSERT INTO positions (key, move, depth, used) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET move = excluded.move, depth = excluded.depth, "
+                "used = excluded.used WHERE excluded.depth >= positions.depth",
+                [(key, move, depth, used) for key, (move, depth, used) in self.pending.items()],
+            )
+            self.connection.executemany(
+                "UPDATE positions SET used = MAX(used, ?) WHERE key = ?",
+                [(used, key) for key, used in self.touched.items()],
+            )
+            self.evict()
+        self.writes += len(self.pending)
+        self.pending.clear()
+        self.touched.clear()
+        self.last_flush = time.monotonic()
+        # Forget the oldest loaded entries beyond the capacity; they are reread on demand
+        excess = len(self.entries) - self.capacity
+        if excess > 0:
+            for key in list(itertools.islice(self.entries, excess)):
+                del self.entries[key]
+
+    def close(self):
+        """Flushes the pending writes and closes the file."""
+        if self.connection is not None:
+            self.flush()
+            self.connection.close()
+            self.connection = None
@@ -0,0 +1,264 @@
+"""
+Retrograde win/draw/loss database for small boards.
+
+Usage: python retrograde.py [--size N] [--output PATH] [--processes N]
+
+Run as a script, this module works backwards from the full board and records
+the game-theoretic value of every legal position on an N x N board (4 by
+default) in `data/retrograde_NxN.bin`. A position is indexed by its base-3
+number (cell i is digit i: 0 empty, 1 X, 2 O) and its value takes 2 bits, four
+positions to a byte, so the 4x4 file is 3^16 / 4 bytes (about 10 MB):
+
+    UNSOLVED (0), WIN (1), DRAW (2) or LOSS (3) for the player to move
+
+Only positions of a game X started are stored: X is to move when both players
+have the same number of stones, O when X has one more. A position from a game O
+started is looked up with the colors swapped, which leaves the value for the
+player to move unchanged.
+
+The positions are solved one layer (number of stones) at a time, from the full
+board down to the empty one, since every move leads into the next layer. Each
+layer is split into byte ranges that a process pool solves in parallel, reading
+the finished layer below straight from the memory-mapped output file. Finished
+ranges are recorded in a `.progress` file next to the output, so an interrupted
+run picks up where it stopped; the progress file is removed once the database is
+complete. Generation needs NumPy; reading the database does not.
+"""
+import argparse
+import json
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from board import get_lines
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only the generator needs it
+    np = None
+
+UNSOLVED = 0
+WIN = 1
+DRAW = 2
+LOSS = 3
+
+CHUNK_BYTES = 1 << 17
+
+_DIGITS = {" ": 0, "X": 1, "O": 2}
+_SWAPPED_DIGITS = {" ": 0, "X": 2, "O": 1}
+_DATABASES = {}
+
+
+def default_path(size):
+    """Returns the default database file of a board size."""
+    return os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "data", f"retrograde_{size}x{size}.bin"
+    )
+
+
+def database_bytes(size):
+    """Returns the size in bytes of the database of a board size."""
+    return (3 ** (size * size) + 3) // 4
+
+
+def position_index(board, player):
+    """
+    Returns the database index of a list board with `player` to move, or None if it cannot arise in a game.
+
+    Positions from a game O started are mapped to their color-swapped equivalent.
+    """
+    x_count = board.count("X")
+    o_count = board.count("O")
+    if x_count - o_count == (0 if player == "X" else 1):
+        digits = _DIGITS
+    elif o_count - x_count == (0 if player == "O" else 1):
+        digits = _SWAPPED_DIGITS
+    else:
+        return None
+    index = 0
+    for stone in reversed(board):
+        index = index * 3 + digits[stone]
+    return index
+
+
+class EndgameDatabase:
+    """Read-only view of a memory-mapped retrograde database."""
+
+    __slots__ = ("size", "data")
+
+    def __init__(self, size, data):
+        self.size = size
+        self.data = data
+
+    def probe(self, board, player):
+        """Returns WIN, DRAW or LOSS for `player` to move on `board`, or None if the position is not solved."""
+        index = position_index(board, player)
+        if index is None:
+            return None
+        value = self.data[index >> 2] >> ((index & 3) << 1) & 3
+        return value or None
+
+
+def load_database(size, path=None):
+    """
+    Returns the database of a board size memory-mapped read-only, or None if its file is missing.
+
+    A file still being generated can be loaded too: positions it has not solved yet
+    probe as None. Each path is mapped once and kept for the life of the process.
+    """
+    if path is None:
+        path = default_path(size)
+    if path not in _DATABASES:
+        database = None
+        try:
+            with open(path, "rb") as handle:
+                data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            data = None
+        if data is not None:
+            if len(data) == database_bytes(size):
+                database = EndgameDatabase(size, data)
+            else:
+                data.close()
+        _DATABASES[path] = database
+    return _DATABASES[path]
+
+
+def solve_chunk(task):
+    """
+    Solves the positions of one layer whose indices fall in one byte range of the database.
+
+    `task` is a (path, size, stones, first byte, end byte) tuple. Reads the values of the
+    next layer from the file and ORs the new values into the byte range, which no other
+    task writes, so chunks of one layer can be solved in parallel.
+    """
+    path, size, stones, first, end = task
+    cells = size * size
+    data = np.memmap(path, dtype=np.uint8, mode="r+")
+    indices = np.arange(first * 4, min(end * 4, 3**cells), dtype=np.int64)
+
+    digits = np.empty((len(indices), cells), dtype=np.uint8)
+    rest = indices.copy()
+    for cell in range(cells):
+        digits[:, cell] = rest % 3
+        rest //= 3
+    x_counts = (digits == 1).sum(axis=1)
+    o_counts = (digits == 2).sum(axis=1)
+    selected = (x_counts == (stones + 1) // 2) & (o_counts == stones // 2)
+    indices = indices[selected]
+    digits = digits[selected]
+
+    mover = 1 if stones % 2 == 0 else 2
+    values = np.full(len(indices), LOSS, dtype=np.uint8)
+    if stones:
+        lines = np.array(get_lines(size), dtype=np.intp)
+        lost = (digits[:, lines] == 3 - mover).all(axis=2).any(axis=1)
+    else:
+        lost = np.zeros(len(indices), dtype=bool)
+    if stones == cells:
+        values[~lost] = DRAW
+    else:
+        open_positions = np.flatnonzero(~lost)
+        best = np.full(len(open_positions), LOSS, dtype=np.uint8)
+        for cell in range(cells):
+            empty = open_positions[digits[open_positions, cell] == 0]
+            children = indices[empty] + mover * 3**cell
+            child_values = data[children >> 2] >> ((children & 3) << 1).astype(np.uint8) & 3
+            # A child lost for the opponent is a win; otherwise a drawn child saves the draw
+            rows = np.searchsorted(open_positions, empty)
+            best[rows[child_values == LOSS]] = WIN
+            drawn = rows[child_values == DRAW]
+            best[drawn[best[drawn] == LOSS]] = DRAW
+        values[open_positions] = best
+
+    codes = np.zeros((end - first) * 4, dtype=np.uint8)
+    codes[indices - first * 4] = values
+    codes = codes.reshape(-1, 4)
+    data[first:end] |= codes[:, 0] | codes[:, 1] << 2 | codes[:, 2] << 4 | codes[:, 3] << 6
+    data.flush()
+    return first
+
+
+def read_progress(progress_path, size):
+    """Returns the saved (layer, finished chunk starts) of an interrupted run, or None to start over."""
+    try:
+        with open(progress_path) as handle:
+            progress = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    if progress.get("size") != size:
+        return None
+    return progress["stones"], set(progress["done"])
+
+
+def write_progress(progress_path, size, stones, done):
+    """Atomically saves the current layer and its finished chunks."""
+    temporary = progress_path + ".tmp"
+    with open(temporary, "w") as handle:
+        json.dump({"size": size, "stones": stones, "done": sorted(done)}, handle)
+    os.replace(temporary, progress_path)
+
+
+def build_database(size, path=None, processes=None, chunk_bytes=CHUNK_BYTES):
+    """
+    Generates the database of a board size, resuming an interrupted run if one left a progress file.
+
+    With `processes` set to 1 the chunks are solved in this process; otherwise they are
+    spread over a process pool of that many workers (all cores when None).
+    """
+    if np is None:
+        raise ImportError("Generating the retrograde database requires NumPy.")
+    if path is None:
+        path = default_path(size)
+    progress_path = path + ".progress"
+    cells = size * size
+    total = database_bytes(size)
+
+    progress = read_progress(progress_path, size)
+    if progress is None or not os.path.exists(path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "wb") as handle:
+            handle.truncate(total)
+        progress = (cells, set())
+        write_progress(progress_path, size, *progress)
+    _DATABASES.pop(path, None)
+
+    stones, done = progress
+    workers = processes or os.cpu_count() or 1
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        while stones >= 0:
+            tasks = [
+                (path, size, stones, first, min(first + chunk_bytes, total))
+                for first in range(0, total, chunk_bytes)
+                if first not in done
+            ]
+            results = executor.map(solve_chunk, tasks) if executor else map(solve_chunk, tasks)
+            for first in results:
+                done.add(first)
+                write_progress(progress_path, size, stones, done)
+            stones -= 1
+            done = set()
+            write_progress(progress_path, size, stones, done)
+    finally:
+        if executor:
+            executor.shutdown()
+    os.remove(progress_path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the retrograde win/draw/loss database.")
+    parser.add_argument("--size", type=int, default=4)
+    parser.add_argument("--output", help="database file (default data/retrograde_NxN.bin)")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: all cores)")
+    args = parser.parse_args(argv)
+    if not 3 <= args.size <= 4:
+        parser.error("only 3x3 and 4x4 databases are supported")
+    build_database(args.size, args.output, args.processes)
+    print(f"Wrote {database_bytes(args.size)} bytes to {args.output or default_path(args.size)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+from board import get_lines, get_cell_lines
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only this engine needs it
+    np = None
+
+EMPTY = 0
+X = 1
+O = 2
+CELL_CODES = {" ": EMPTY, "X": X, "O": O}
+
+_ROLLOUT_TABLES = {}
+
+
+def get_rollout_tables(size, win_length=None):
+    """
+    Returns the NumPy line tables used to detect wins in a batch of boards.
+
+    `lines` holds the cell indices of every winning line, one row per line.
+    `cell_lines` holds, for every cell, the indices of the lines through it,
+    padded to a common width; `cell_lines_valid` marks which entries are real.
+    """
+    win_length = win_length or size
+    tables = _ROLLOUT_TABLES.get((size, win_length))
+    if tables is None:
+        if np is None:
+            raise ImportError("The batched rollout engine requires NumPy.")
+        per_cell = get_cell_lines(size, win_length)
+        width = max(len(indices) for indices in per_cell)
+        cell_lines = np.zeros((size * size, width), dtype=np.intp)
+        cell_lines_valid = np.zeros((size * size, width), dtype=bool)
+        for cell, indices in enumerate(per_cell):
+            cell_lines[cell, : len(indices)] = indices
+            cell_lines_valid[cell, : len(indices)] = True
+        tables = {
+            "lines": np.array(get_lines(size, win_length), dtype=np.intp),
+            "cell_lines": cell_lines,
+            "cell_lines_valid": cell_lines_valid,
+        }
+        _ROLLOUT_TABLES[size, win_length] = tables
+    return tables
+
+
+def encode_boards(boards):
+    """Converts list boards into a 2-D int8 array of EMPTY, X and O codes, one row per board."""
+    return np.array([[CELL_CODES[cell] for cell in board] for board in boards], dtype=np.int8)
+
+
+def find_winners(boards, size, win_length=None):
+    """Returns, for every encoded board, X or O if that player owns a complete line and 0 otherwise."""
+    lines = get_rollout_tables(size, win_length)["lines"]
+    winners = np.zeros(len(boards), dtype=np.int8)
+    cells = boards[:, lines]
+    for code in (X, O):
+        winners[(cells == code).all(axis=2).any(axis=1)] = code
+    return winners
+
+
+def play_random_games(boards, to_move, size, rng=None, win_length=None):
+    """
+    Finishes every encoded board with uniformly random moves, all boards in lock-step.
+
+    `boards` is an (N, size * size) int8 array that is filled in place, and `to_move`
+    gives the code of the player to move on each board (a scalar or an array of N).
+    Each board gets a random order of its empty cells up front; every step then plays
+    the next cell of that order on all unfinished boards at once and checks only the
+    lines through the cells just played.
+
+    Returns an int8 array with the winner of every game: X, O, or 0 for a draw.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    tables = get_rollout_tables(size, win_length)
+    lines = tables["lines"]
+    cell_lines = tables["cell_lines"]
+    cell_lines_valid = tables["cell_lines_valid"]
+
+    count = len(boards)
+    movers = np.broadcast_to(np.asarray(to_move, dtype=np.int8), (count,)).copy()
+    winners = find_winners(boards, size, win_length)
+    empty_counts = (boards == EMPTY).sum(axis=1)
+
+    # Random keys sort every board's empty cells to the front in a random order
+    keys = rng.random(boards.shape)
+    keys[boards != EMPTY] = 2.0
+    orders = np.argsort(keys, axis=1)
+
+    active = np.flatnonzero(winners == 0)
+    step = 0
+    while active.size:
+        active = active[empty_counts[active] > step]
+        if not active.size:
+            break
+        moves = orders[active, step]
+        players = movers[active]
+        boards[active, moves] = players
+
+        through = cell_lines[moves]
+        cells = boards[active[:, None, None], lines[through]]
+        complete = (cells == players[:, None, None]).all(axis=2) & cell_lines_valid[moves]
+        won = complete.any(axis=1)
+        winners[active[won]] = players[won]
+
+        movers[active] = 3 - players
+        active = active[~won]
+        step += 1
+    return winners
+
+
+def simulate(board, player, size, games, rng=None, win_length=None):
+    """
+    Plays `games` random games from a list board with `player` to move.
+
+    Returns a (wins, draws, losses) tuple of counts from the point of view of `player`.
+    """
+    get_rollout_tables(size, win_length)  # Fails early with a clear error when NumPy is missing
+    boards = np.repeat(encode_boards([board]), games, axis=0)
+    code = CELL_CODES[player]
+    winners = play_random_games(boards, code, size, rng, win_length)
+    wins = int(np.count_nonzero(winners == code))
+    draws = int(np.count_nonzero(winners == 0))
+    return wins, draws, games - wins - draws
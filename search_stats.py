@@ -0,0 +1,88 @@
+class SearchStats:
+    """
+    Counters that a search fills in while it runs.
+
+    Pass an instance as `stats` to get_minimax_move or get_mcts_move; searches
+    called without one skip all counting. The counters are cumulative, so one
+    object can also total several searches, and reset() clears them.
+
+    - nodes: positions visited (minimax calls, or tree nodes walked by MCTS)
+    - cutoffs: alpha-beta cutoffs, with `cutoffs_by_depth[ply]` counting them per ply
+    - terminal_hits: positions that were already won or full
+    - evaluations: depth cut-offs scored by the heuristic evaluation
+    - cache_hits: transposition table entries deep enough to be used
+    - database_hits: positions answered by a retrograde database
+    - max_depth: deepest ply reached below the root
+    - completed_depth: depth of the last finished iterative-deepening iteration
+    - playouts: random games played by MCTS
+    - elapsed: seconds spent inside the search calls
+    """
+
+    __slots__ = (
+        "nodes",
+        "cutoffs",
+        "cutoffs_by_depth",
+        "terminal_hits",
+        "evaluations",
+        "cache_hits",
+        "database_hits",
+        "children",
+        "expanded",
+        "max_depth",
+        "completed_depth",
+        "playouts",
+        "elapsed",
+    )
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Clears every counter."""
+        self.nodes = 0
+        self.cutoffs = 0
+        self.cutoffs_by_depth = {}
+        self.terminal_hits = 0
+        self.evaluations = 0
+        self.cache_hits = 0
+        self.database_hits = 0
+        self.children = 0  # Moves searched below expanded nodes
+        self.expanded = 0  # Nodes whose moves were searched
+        self.max_depth = 0
+        self.completed_depth = None
+        self.playouts = 0
+        self.elapsed = 0.0
+
+    def record_node(self, ply):
+        """Counts a node visited `ply` moves below the root."""
+        self.nodes += 1
+        if ply > self.max_depth:
+            self.max_depth = ply
+
+    def record_expansion(self, ply, searched, cutoff):
+        """Counts a node at `ply` whose first `searched` moves were searched, ending in a cutoff or not."""
+        self.expanded += 1
+        self.children += searched
+        if cutoff:
+            self.cutoffs += 1
+            self.cutoffs_by_depth[ply] = self.cutoffs_by_depth.get(ply, 0) + 1
+
+    def branching_factor(self):
+        """Returns the average number of moves searched per expanded node."""
+        return self.children / self.expanded if self.expanded else 0.0
+
+    def as_dict(self):
+        """Returns the counters as a plain dict, including the branching factor."""
+        counters = {name: getattr(self, name) for name in self.__slots__}
+        counters["branching_factor"] = self.branching_factor()
+        return counters
+
+    def __str__(self):
+        text = (
+            f"{self.nodes} nodes, {self.cutoffs} cutoffs, {self.terminal_hits} terminal, "
+            f"{self.cache_hits} cache hits, depth {self.max_depth}, "
+            f"branching {self.branching_factor():.2f}"
+        )
+        if self.playouts:
+            text += f", {self.playouts} playouts"
+        return text + f", {self.elapsed * 1000:.1f} ms"
@@ -0,0 +1,318 @@
+"""
+Asyncio game server hosting many concurrent games in one process.
+
+Usage: python server.py [--host HOST] [--port PORT | --unix PATH] [--workers N]
+                        [--max-sessions N] [--max-pending N] [--store PATH]
+
+Clients talk to the server over TCP (or a Unix socket) with one JSON object per
+line, and every request gets exactly one JSON line back. As in main.py, the
+client plays X and the computer plays O:
+
+    {"op": "new", "strategy": "minimax", "size": 3}
+        Optional: "win_length", "time_limit", "first" ("X" or "O", default random).
+        Starts a game; if the computer moves first, its move is already made.
+    {"op": "move", "session": ID, "cell": N}
+        Plays the client's move on the zero-based cell and, unless that ended the
+        game, the computer's reply.
+    {"op": "state", "session": ID}
+    {"op": "close", "session": ID}
+
+Successful replies carry "ok": true and the game state (session, board, to_move,
+winner, finished, and after a move the "computer_move"); failures carry "ok": false
+and an "error" message. Sessions belong to the connection that created them and
+are closed when it disconnects.
+
+Computer moves run in a bounded process pool so the event loop never blocks on a
+search. At most `--max-pending` moves wait for the pool at once; beyond that,
+requests wait before being read further, so busy clients are slowed down by TCP
+flow control instead of growing an unbounded queue. Replies are drained before
+the next request is read, and `--max-sessions` caps the open games. With
+`--store`, every worker opens that SQLite position store (see position_store), so
+minimax results are shared between the workers and kept across restarts.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import multiprocessing
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from board import LineTracker
+from moves import get_computer_move, open_worker_store
+
+STRATEGIES = ["random", "strategic", "minimax", "mcts", "worst"]
+MAX_SIZE = 19
+MAX_LINE = 1 << 16  # Longest request line accepted, in bytes
+
+
+class ProtocolError(Exception):
+    """Raised for a request the server cannot carry out; its message is sent to the client."""
+
+
+class GameSession:
+    """The state of one game: the board, whose turn it is, and how it ended."""
+
+    __slots__ = ("id", "strategy", "size", "win_length", "time_limit", "tracker", "to_move", "winner")
+
+    def __init__(self, session_id, strategy, size, win_length, time_limit, first):
+        self.id = session_id
+        self.strategy = strategy
+        self.size = size
+        self.win_length = win_length
+        self.time_limit = time_limit
+        self.tracker = LineTracker([" "] * (size * size), size, win_length)
+        self.to_move = first
+        self.winner = None
+
+    @property
+    def board(self):
+        """The list board, kept by the session's line tracker."""
+        return self.tracker.cells
+
+    def finished(self):
+        """Checks if the game has been won or drawn."""
+        return self.winner is not None or self.tracker.is_full()
+
+    def play(self, cell, player):
+        """Plays a validated move and passes the turn."""
+        if self.tracker.place(cell, player):
+            self.winner = player
+        self.to_move = "O" if player == "X" else "X"
+
+    def undo(self, cell, player):
+        """Takes back a move that did not end the game."""
+        self.tracker.remove(cell, player)
+        self.to_move = player
+
+    def state(self):
+        """Returns the game state as sent to the client."""
+        return {
+            "ok": True,
+            "session": self.id,
+            "board": list(self.board),
+            "to_move": None if self.finished() else self.to_move,
+            "winner": self.winner,
+            "finished": self.finished(),
+        }
+
+
+class GameServer:
+    """
+    Serves the line-based JSON protocol described in the module docstring.
+
+    Pass an `executor` to run computer moves somewhere other than a fresh process
+    pool of `workers` processes (for example a thread pool in tests). The pool's
+    workers open the position store at `store_path`, if given.
+    """
+
+    def __init__(
+        self, max_sessions=1000, workers=None, max_pending=64, executor=None, store_path=None
+    ):
+        self.max_sessions = max_sessions
+        if executor is None:
+            # Forked workers would inherit the open client sockets and keep them from closing
+            executor = ProcessPoolExecutor(
+                workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=open_worker_store,
+                initargs=(store_path,),
+            )
+        self.executor = executor
+        self.pending = asyncio.Semaphore(max_pending)
+        self.sessions = {}
+        self.ids = itertools.count(1)
+        self.listener = None
+        self.handlers = set()
+
+    async def computer_move(self, session):
+        """Plays the computer's move in the executor, waiting for a free slot first."""
+        async with self.pending:
+            try:
+                move = await asyncio.get_running_loop().run_in_executor(
+                    self.executor,
+                    get_computer_move,
+                    list(session.board),
+                    session.strategy,
+                    "O",
+                    session.size,
+                    session.time_limit,
+                    None,
+                    session.win_length,
+                )
+            except Exception as error:  # A broken or shut down pool, or a failed search
+                raise ProtocolError(f"The computer could not move: {error!r}") from error
+        session.play(move, "O")
+        return move
+
+    def get_session(self, request, owned):
+        """Returns the session named in a request, if it belongs to this connection."""
+        session_id = request.get("session")
+        if type(session_id) is not str or session_id not in owned:
+            raise ProtocolError(f"Unknown session: {session_id!r}")
+        return self.sessions[session_id]
+
+    async def new_game(self, request, owned):
+        strategy = request.get("strategy", "minimax")
+        size = request.get("size", 3)
+        win_length = request.get("win_length")
+        time_limit = request.get("time_limit")
+        first = request.get("first") or random.choice(["X", "O"])
+        if strategy not in STRATEGIES:
+            raise ProtocolError(f"Invalid strategy. Choose from: {', '.join(STRATEGIES)}")
+        if type(size) is not int or not 3 <= size <= MAX_SIZE:
+            raise ProtocolError(f"Invalid board size. Use an integer from 3 to {MAX_SIZE}.")
+        if win_length is not None and (type(win_length) is not int or not 3 <= win_length <= size):
+            raise ProtocolError("Invalid win length. Use an integer from 3 up to the board size.")
+        if time_limit is not None and (
+            type(time_limit) not in (int, float) or not 0 < time_limit <= 10
+        ):
+            raise ProtocolError("Invalid time limit. Use a number of seconds above 0, at most 10.")
+        if first not in ("X", "O"):
+            raise ProtocolError('Invalid first player. Use "X" or "O".')
+        if len(self.sessions) >= self.max_sessions:
+            raise ProtocolError("Session limit reached. Close a game and try again.")
+
+        session = GameSession(str(next(self.ids)), strategy, size, win_length, time_limit, first)
+        self.sessions[session.id] = session
+        owned.add(session.id)
+        reply = {}
+        if first == "O":
+            try:
+                reply["computer_move"] = await self.computer_move(session)
+            except ProtocolError:
+                owned.discard(session.id)
+                del self.sessions[session.id]
+                raise
+        return {**session.state(), **reply}
+
+    async def make_move(self, request, owned):
+        session = self.get_session(request, owned)
+        cell = request.get("cell")
+        if session.finished():
+            raise ProtocolError("The game is over.")
+        if type(cell) is not int or not 0 <= cell < session.size * session.size:
+            raise ProtocolError(f"Invalid cell. Use an integer from 0 to {session.size ** 2 - 1}.")
+        if session.board[cell] != " ":
+            raise ProtocolError(f"Cell {cell} is already taken.")
+        session.play(cell, "X")
+        reply = {}
+        if not session.finished():
+            try:
+                reply["computer_move"] = await self.computer_move(session)
+            except ProtocolError:
+                session.undo(cell, "X")  # So the client can retry the move
+                raise
+        return {**session.state(), **reply}
+
+    async def get_state(self, request, owned):
+        return self.get_session(request, owned).state()
+
+    async def close_game(self, request, owned):
+        session = self.get_session(request, owned)
+        owned.discard(session.id)
+        del self.sessions[session.id]
+        return {"ok": True, "session": session.id, "closed": True}
+
+    async def dispatch(self, line, owned):
+        """Handles one request line and returns the reply object."""
+        handlers = {
+            "new": self.new_game,
+            "move": self.make_move,
+            "state": self.get_state,
+            "close": self.close_game,
+        }
+        try:
+            request = json.loads(line)
+        except ValueError:
+            return {"ok": False, "error": "Invalid JSON."}
+        try:
+            if (
+                not isinstance(request, dict)
+                or type(request.get("op")) is not str
+                or request["op"] not in handlers
+            ):
+                raise ProtocolError('Invalid request. Send an object with "op": new, move, state or close.')
+            return await handlers[request["op"]](request, owned)
+        except ProtocolError as error:
+            return {"ok": False, "error": str(error)}
+
+    async def handle_client(self, reader, writer):
+        """Serves one connection until it closes, then closes the games it left open."""
+        owned = set()
+        self.handlers.add(asyncio.current_task())
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:  # Longer than MAX_LINE
+                    reply = {"ok": False, "error": "Request too long."}
+                    writer.write(json.dumps(reply).encode() + b"\n")
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                reply = await self.dispatch(line, owned)
+                writer.write(json.dumps(reply).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for session_id in owned:
+                self.sessions.pop(session_id, None)
+            writer.close()
+            self.handlers.discard(asyncio.current_task())
+
+    async def start(self, host="127.0.0.1", port=8765, unix_path=None):
+        """Starts listening and returns the asyncio server."""
+        if unix_path is not None:
+            self.listener = await asyncio.start_unix_server(
+                self.handle_client, unix_path, limit=MAX_LINE
+            )
+        else:
+            self.listener = await asyncio.start_server(
+                self.handle_client, host, port, limit=MAX_LINE
+            )
+        return self.listener
+
+    async def close(self, timeout=5):
+        """Stops listening, gives open connections `timeout` seconds to finish, and stops the workers."""
+        if self.listener is not None:
+            self.listener.close()
+        if self.handlers:
+            await asyncio.wait(self.handlers, timeout=timeout)
+        for handler in self.handlers:
+            handler.cancel()
+        self.executor.shutdown(cancel_futures=True)
+
+
+async def serve(args):
+    server = GameServer(args.max_sessions, args.workers, args.max_pending, store_path=args.store)
+    listener = await server.start(args.host, args.port, args.unix)
+    where = args.unix or ", ".join(str(sock.getsockname()) for sock in listener.sockets)
+    print(f"Serving games on {where}", flush=True)
+    try:
+        await listener.serve_forever()
+    finally:
+        await server.close(timeout=0)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve tic-tac-toe games over a line-based JSON protocol.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="listen on this Unix socket path instead of TCP")
+    parser.add_argument("--workers", type=int, default=None, help="AI worker processes (default: all cores)")
+    parser.add_argument("--max-sessions", type=int, default=1000)
+    parser.add_argument("--max-pending", type=int, default=64, help="computer moves queued at once")
+    parser.add_argument("--store", help="SQLite file of searched positions shared by the workers")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
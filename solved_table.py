@@ -0,0 +1,165 @@
+"""
+Perfect-play table for 3x3 tic-tac-toe.
+
+Usage: python solved_table.py [--output PATH]
+
+Run as a script, this module solves every 3x3 position reachable from the empty
+board (with either player starting) and writes the result to a binary file,
+`data/solved_3x3.bin` by default. The file holds one byte per (position, player
+to move): position p, written in base 3 with cell i as digit i (0 empty, 1 X,
+2 O), is at offset p for X to move and 3^9 + p for O to move. Each byte is
+
+    value << 4 | move
+
+where value is UNSOLVED, WIN, DRAW or LOSS for the player to move and move is
+the best cell, or NO_MOVE when the game is already over. Wins are taken by the
+shortest route and losses put off as long as possible; among equal moves the
+lowest cell wins.
+
+At runtime the file is memory-mapped on first use, so a lookup costs one index
+computation and one byte read with no parsing.
+"""
+import argparse
+import mmap
+import os
+
+from board import get_lines
+
+SIZE = 3
+POSITIONS = 3 ** (SIZE * SIZE)
+TABLE_SIZE = 2 * POSITIONS
+
+UNSOLVED = 0
+WIN = 1
+DRAW = 2
+LOSS = 3
+NO_MOVE = 15
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "solved_3x3.bin")
+
+_DIGITS = {" ": 0, "X": 1, "O": 2}
+_POWERS = tuple(3**cell for cell in range(SIZE * SIZE))
+_TABLES = {}
+
+
+def position_index(board, player):
+    """Returns the offset of a 3x3 list board with `player` to move in the solved table."""
+    index = 0
+    for cell, stone in enumerate(board):
+        index += _DIGITS[stone] * _POWERS[cell]
+    return index if player == "X" else index + POSITIONS
+
+
+def solve(board, player, lines, results):
+    """
+    Solves a position by exhaustive negamax and records it and every position below it in `results`.
+
+    `results` maps (board tuple, player to move) to (score, move), where the score is from
+    the point of view of the player to move: 10 minus the plies to a forced win, the
+    negative of that for a forced loss, and 0 for a draw. Returns the (score, move) pair.
+    """
+    key = (tuple(board), player)
+    result = results.get(key)
+    if result is not None:
+        return result
+    opponent = "O" if player == "X" else "X"
+    if any(all(board[cell] == opponent for cell in line) for line in lines):
+        result = (-10, None)  # The previous move won
+    elif " " not in board:
+        result = (0, None)
+    else:
+        result = (-float("inf"), None)
+        for move in range(len(board)):
+            if board[move] != " ":
+                continue
+            board[move] = player
+            score = -solve(board, opponent, lines, results)[0]
+            board[move] = " "
+            # Every ply makes a win a little less attractive and a loss a little less bad
+            score -= 1 if score > 0 else -1 if score < 0 else 0
+            if score > result[0]:
+                result = (score, move)
+    results[key] = result
+    return result
+
+
+def build_table():
+    """Solves every reachable 3x3 position and returns the encoded table as a bytearray."""
+    lines = get_lines(SIZE)
+    results = {}
+    for player in ("X", "O"):
+        solve([" "] * (SIZE * SIZE), player, lines, results)
+    table = bytearray(TABLE_SIZE)
+    for (board, player), (score, move) in results.items():
+        value = WIN if score > 0 else LOSS if score < 0 else DRAW
+        table[position_index(board, player)] = value << 4 | (NO_MOVE if move is None else move)
+    return table
+
+
+def write_table(path=DEFAULT_PATH):
+    """Builds the solved table and writes it to `path`."""
+    table = build_table()
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "wb") as handle:
+        handle.write(table)
+
+
+def load_table(path=DEFAULT_PATH):
+    """
+    Returns the solved table at `path` memory-mapped read-only, or None if the file is missing or malformed.
+
+    Each path is mapped once and kept for the life of the process.
+    """
+    table = _TABLES.get(path)
+    if table is None and path not in _TABLES:
+        try:
+            with open(path, "rb") as handle:
+                table = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            table = None
+        if table is not None and len(table) != TABLE_SIZE:
+            table.close()
+            table = None
+        _TABLES[path] = table
+    return table
+
+
+def probe_solved(board, player, size, path=DEFAULT_PATH):
+    """
+    Looks up a position in the solved table.
+
+    Returns (value, move) with value WIN, DRAW or LOSS for `player` and move the best cell
+    (None if the game is over), or None when the board is not 3x3, the table file is not
+    available, or the position cannot arise in a game.
+    """
+    if size != SIZE:
+        return None
+    table = load_table(path)
+    if table is None:
+        return None
+    entry = table[position_index(board, player)]
+    value = entry >> 4
+    if value == UNSOLVED:
+        return None
+    move = entry & 15
+    return value, None if move == NO_MOVE else move
+
+
+def get_solved_move(board, player, size, path=DEFAULT_PATH):
+    """Returns the perfect-play move for a 3x3 position, or None if the solved table cannot answer."""
+    result = probe_solved(board, player, size, path)
+    return None if result is None else result[1]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve 3x3 tic-tac-toe and write the perfect-play table.")
+    parser.add_argument("--output", default=DEFAULT_PATH, help=f"table file (default {DEFAULT_PATH})")
+    args = parser.parse_args(argv)
+    write_table(args.output)
+    print(f"Wrote {TABLE_SIZE} entries to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+from transposition import get_zobrist_table
+
+_SYMMETRIES = {}
+_INVERSE_SYMMETRIES = {}
+_SYMMETRIC_KEYS = {}
+
+
+def get_symmetries(size):
+    """
+    Returns the 8 rotations and reflections of a square board as permutation tuples.
+
+    For each symmetry `perm`, a stone on `cell` moves to `perm[cell]`. The first
+    permutation is always the identity.
+    """
+    symmetries = _SYMMETRIES.get(size)
+    if symmetries is None:
+        last = size - 1
+        transforms = [
+            lambda r, c: (r, c),  # Identity
+            lambda r, c: (c, last - r),  # Rotate 90 degrees
+            lambda r, c: (last - r, last - c),  # Rotate 180 degrees
+            lambda r, c: (last - c, r),  # Rotate 270 degrees
+            lambda r, c: (r, last - c),  # Mirror left-right
+            lambda r, c: (last - r, c),  # Mirror top-bottom
+            lambda r, c: (c, r),  # Main diagonal
+            lambda r, c: (last - c, last - r),  # Anti-diagonal
+        ]
+        symmetries = []
+        for transform in transforms:
+            permutation = []
+            for cell in range(size * size):
+                row, col = transform(cell // size, cell % size)
+                permutation.append(row * size + col)
+            symmetries.append(tuple(permutation))
+        symmetries = tuple(symmetries)
+        _SYMMETRIES[size] = symmetries
+    return symmetries
+
+
+def get_inverse_symmetries(size):
+    """Returns the inverse of every permutation from get_symmetries, in the same order."""
+    inverses = _INVERSE_SYMMETRIES.get(size)
+    if inverses is None:
+        inverses = []
+        for permutation in get_symmetries(size):
+            inverse = [0] * (size * size)
+            for cell, target in enumerate(permutation):
+                inverse[target] = cell
+            inverses.append(tuple(inverse))
+        inverses = tuple(inverses)
+        _INVERSE_SYMMETRIES[size] = inverses
+    return inverses
+
+
+def transform_board(board, permutation):
+    """Returns a new list board with every cell moved through the permutation."""
+    transformed = [" "] * len(board)
+    for cell, target in enumerate(permutation):
+        transformed[target] = board[cell]
+    return transformed
+
+
+def canonical_board(board, size):
+    """
+    Returns the canonical form of a board and the index of the symmetry producing it.
+
+    The canonical form is the lexicographically smallest of the 8 transformed boards,
+    so every rotation or reflection of a position maps to the same tuple.
+    """
+    # Reading the board through the inverse permutation builds each transform in one map call
+    get = board.__getitem__
+    best, best_index = None, 0
+    for index, inverse in enumerate(get_inverse_symmetries(size)):
+        candidate = tuple(map(get, inverse))
+        if best is None or candidate < best:
+            best, best_index = candidate, index
+    return best, best_index
+
+
+def get_symmetric_keys(size):
+    """
+    Returns Zobrist keys for all 8 symmetries at once.
+
+    `keys[player][cell]` is a tuple holding, for every symmetry, the key of the
+    cell that `cell` maps to, so one XOR per symmetry keeps all 8 hashes current.
+    """
+    keys = _SYMMETRIC_KEYS.get(size)
+    if keys is None:
+        zobrist = get_zobrist_table(size)
+        symmetries = get_symmetries(size)
+        keys = {
+            player: tuple(
+                tuple(zobrist[player][permutation[cell]] for permutation in symmetries)
+                for cell in range(size * size)
+            )
+            for player in ("X", "O")
+        }
+        _SYMMETRIC_KEYS[size] = keys
+    return keys
+
+
+def symmetric_hashes(board, size):
+    """Returns the Zobrist hash of each of the 8 transformed boards."""
+    keys = get_symmetric_keys(size)
+    hashes = [0] * 8
+    for cell, player in enumerate(board):
+        if player != " ":
+            cell_keys = keys[player][cell]
+            for index in range(8):
+                hashes[index] ^= cell_keys[index]
+    return hashes
+
+
+def canonical_key(hashes):
+    """Returns the smallest of the symmetric hashes and the index of its symmetry."""
+    key = min(hashes)
+    return key, hashes.index(key)
+
+
+def to_canonical_move(move, index, size):
+    """Maps a move on the real board onto the canonical board chosen by symmetry `index`."""
+    return get_symmetries(size)[index][move]
+
+
+def from_canonical_move(move, index, size):
+    """Maps a move on the canonical board back onto the real board."""
+    return get_inverse_symmetries(size)[index][move]
+
+
+def unique_moves(board, size):
+    """
+    Returns the empty cells of a board with symmetric duplicates removed.
+
+    Two moves are duplicates when a symmetry that leaves the board unchanged maps
+    one onto the other; only the lowest cell index of each group is kept.
+    """
+    stabilizer = [
+        permutation
+        for permutation in get_symmetries(size)[1:]
+        if all(board[permutation[cell]] == board[cell] for cell in range(size * size))
+    ]
+    moves = []
+    for cell in range(size * size):
+        if board[cell] == " " and all(
+            permutation[cell] >= cell for permutation in stabilizer
+        ):
+            moves.append(cell)
+    return moves
@@ -1,9 +1,20 @@
 import sys
 import os
+import time
 # Tambahkan direktori root ke path Python agar bisa import modul board
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from ai_strategies import get_strategic_move, get_minimax_move, get_worst_move
+import random
+from ai_strategies import (
+    SearchSession,
+    get_strategic_move,
+    get_minimax_move,
+    get_mcts_move,
+    get_worst_move,
+)
+from board import check_winner
+from search_stats import SearchStats
+from transposition import TranspositionTable
 
 def test_get_strategic_move_winning():
     # Test finding winning move for X
@@ -147,3 +158,127 @@ def test_minimax_move_different_board_sizes():
     board[2] = "O"
     move = get_minimax_move(board, "O", 4)
     assert move == 3  # Complete winning row
+
+def test_minimax_move_with_time_limit():
+    # With a budget the search deepens until 3x3 is solved and plays perfectly
+    board = [" "] * 9
+    board[0] = "X"
+    move = get_minimax_move(board, "O", 3, time_limit=5)
+    assert move == 4  # Only the center avoids a forced loss
+
+    board = ["X", " ", " ",
+             " ", "O", " ",
+             " ", " ", "X"]
+    move = get_minimax_move(board, "O", 3, time_limit=5)
+    assert move in [1, 3, 5, 7]
+
+def test_minimax_move_respects_time_limit():
+    board = [" "] * 36
+    board[14] = "X"
+    start = time.perf_counter()
+    move = get_minimax_move(board, "O", 6, time_limit=0.2)
+    elapsed = time.perf_counter() - start
+    assert board[move] == " "
+    assert elapsed < 1.0
+
+def test_mcts_move_winning_and_blocking():
+    board = ["X", "X", " ",
+             "O", "O", " ",
+             " ", " ", " "]
+    assert get_mcts_move(board, "X", 3) == 2  # Complete winning row
+    board = ["O", "O", " ",
+             " ", "X", " ",
+             " ", " ", "X"]
+    assert get_mcts_move(board, "X", 3) == 2  # Block O's winning move
+
+def test_mcts_move_strategic():
+    random.seed(3)
+    board = ["X", " ", " ",
+             " ", " ", " ",
+             " ", " ", " "]
+    move = get_mcts_move(board, "O", 3, playouts=3000)
+    assert move == 4  # Only the center avoids a forced loss
+
+def test_mcts_move_large_board_time_limit():
+    board = [" "] * 100
+    board[44] = "X"
+    start = time.perf_counter()
+    move = get_mcts_move(board, "O", 10, time_limit=0.2)
+    assert time.perf_counter() - start < 1.0
+    assert board[move] == " "
+
+    # A single empty cell needs no search
+    board = ["X", "O", "X",
+             "X", "O", "O",
+             "O", "X", " "]
+    assert get_mcts_move(board, "X", 3, playouts=10) == 8
+
+
+def test_strategies_with_win_length():
+    # Four in a row on 8x8: X threatens to complete cells 18-21 at either end
+    board = [" "] * 64
+    for cell in (19, 20, 21):
+        board[cell] = "X"
+    board[0] = "O"
+    board[63] = "O"
+    assert get_strategic_move(board, "X", 8, 4) in (18, 22)
+    assert get_strategic_move(board, "O", 8, 4) in (18, 22)
+    assert get_minimax_move(board, "X", 8, max_depth=1, win_length=4) in (18, 22)
+    assert get_mcts_move(board, "O", 8, playouts=50, win_length=4) in (18, 22)
+    assert get_worst_move(board, "X", 8, 4) not in (18, 22)
+
+
+def test_worst_move_matches_brute_force():
+    # The threat-table shortcut must pick from the same moves as trying every reply
+    rng = random.Random(9)
+    for _ in range(60):
+        size = rng.choice([3, 4, 5])
+        board = [rng.choice("  XO") for _ in range(size * size)]
+        if " " not in board or check_winner(board, "X", size) or check_winner(board, "O", size):
+            continue
+        empty = [i for i, cell in enumerate(board) if cell == " "]
+        non_winning = []
+        worst = []
+        for move in empty:
+            after = board[:]
+            after[move] = "X"
+            if check_winner(after, "X", size):
+                continue
+            non_winning.append(move)
+            for reply in empty:
+                if reply != move:
+                    answer = after[:]
+                    answer[reply] = "O"
+                    if check_winner(answer, "O", size):
+                        worst.append(move)
+                        break
+        move = get_worst_move(board, "X", size)
+        assert move in (worst or non_winning or empty)
+
+
+def test_search_session_reuses_table_between_moves():
+    board = ["X", " ", " ", "X",
+             " ", "O", " ", " ",
+             " ", " ", " ", " ",
+             " ", " ", " ", " "]
+    session = SearchSession()
+    session.reroot(board)
+    assert get_minimax_move(board, "O", 4, table=session.table, max_depth=3) == 12
+    table = session.table
+    board[12], board[15] = "O", "X"
+
+    session.reroot(board)
+    assert session.table is table
+    assert table.generation == 1
+    reused = SearchStats()
+    move = get_minimax_move(board, "O", 4, table=session.table, max_depth=3, stats=reused)
+    assert board[move] == " "
+    fresh = SearchStats()
+    get_minimax_move(board, "O", 4, table=TranspositionTable(), max_depth=3, stats=fresh)
+    # The second search starts from what the first one stored
+    assert reused.nodes < fresh.nodes
+
+    # Fewer stones than the last search means a new game
+    session.reroot([" "] * 25)
+    assert session.table is not table
+    assert session.table.generation == 0
@@ -0,0 +1,41 @@
+import sys
+import os
+
+# Tambahkan direktori root dan benchmarks ke path Python
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "benchmarks")))
+
+import json
+from bench_primitives import make_positions, compare, main
+from board import check_winner
+
+
+def test_make_positions_are_fixed_and_in_play():
+    positions = make_positions(4, 0.4, 3, 0)
+    assert positions == make_positions(4, 0.4, 3, 0)
+    for board, player in positions:
+        assert board.count("X") + board.count("O") == 6
+        assert player == ("X" if board.count("X") == board.count("O") else "O")
+        assert not check_winner(board, "X", 4)
+        assert not check_winner(board, "O", 4)
+
+
+def test_compare_flags_regressions():
+    baseline = {"a/3/openings": 1e-3, "b/3/openings": 1e-3, "c/3/openings": 1e-7}
+    results = {"a/3/openings": 1.1e-3, "b/3/openings": 2e-3, "c/3/openings": 3e-7, "d/3/openings": 1.0}
+    # Only b slowed down by more than 25%; c is below the noise floor and d has no baseline
+    assert compare(results, baseline, 0.25) == [("b/3/openings", 1e-3, 2e-3)]
+    assert compare(results, baseline, 1.5) == []
+
+
+def test_main_writes_and_compares(tmp_path, monkeypatch):
+    import bench_primitives
+
+    monkeypatch.setattr(bench_primitives, "run_benchmarks", lambda sizes: {"check_draw/3/openings": 1e-3})
+    output = tmp_path / "baseline.json"
+    assert main(["--sizes", "3", "--output", str(output)]) == 0
+    assert json.loads(output.read_text())["results"] == {"check_draw/3/openings": 1e-3}
+    assert main(["--sizes", "3", "--compare", str(output)]) == 0
+
+    output.write_text(json.dumps({"results": {"check_draw/3/openings": 1e-4}}))
+    assert main(["--sizes", "3", "--compare", str(output)]) == 1
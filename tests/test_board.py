@@ -1,11 +1,24 @@
 import pytest
+import random
 import sys
 import os
 
 # Tambahkan direktori root ke path Python agar bisa import modul board
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from board import print_board, check_winner, check_draw
+from board import (
+    print_board,
+    check_winner,
+    check_draw,
+    get_lines,
+    get_win_masks,
+    board_to_bitboard,
+    board_to_bitboards,
+    bitboards_to_board,
+    is_winning_bitboard,
+    get_cell_lines,
+    LineTracker,
+)
 
 def test_check_winner_horizontal():
     """Menguji kemenangan horizontal"""
@@ -83,3 +96,120 @@ def test_board_size_5x5():
     for i in range(0, 25, 5):
         board_5x5_vertical[i] = "O"
     assert check_winner(board_5x5_vertical, "O", 5) == True
+
+def test_get_win_masks():
+    """Menguji tabel mask garis kemenangan"""
+    masks = get_win_masks(3)
+    assert len(masks) == len(get_lines(3)) == 8
+    assert 0b000000111 in masks  # Baris pertama
+    assert 0b001001001 in masks  # Kolom pertama
+    assert 0b100010001 in masks  # Diagonal utama
+    assert 0b001010100 in masks  # Diagonal terbalik
+    assert len(get_win_masks(5)) == 12
+
+def test_bitboard_conversion():
+    """Menguji konversi list <-> bitboard"""
+    board = ["X", "O", " ", " ", "X", " ", "O", " ", "X"]
+    x_bits, o_bits = board_to_bitboards(board)
+    assert x_bits == board_to_bitboard(board, "X") == 0b100010001
+    assert o_bits == 0b001000010
+    assert bitboards_to_board(x_bits, o_bits, 3) == board
+
+def test_is_winning_bitboard():
+    """Menguji deteksi kemenangan pada bitboard"""
+    assert is_winning_bitboard(0b100010001, 3) == True
+    assert is_winning_bitboard(0b100010000, 3) == False
+    assert is_winning_bitboard(0, 4) == False
+    assert is_winning_bitboard(0b1000_0100_0010_0001, 4) == True
+
+def test_get_cell_lines():
+    """Menguji indeks garis yang melewati setiap sel"""
+    cell_lines = get_cell_lines(3)
+    assert len(cell_lines[4]) == 4  # Tengah: baris, kolom, dua diagonal
+    assert len(cell_lines[0]) == 3  # Sudut: baris, kolom, satu diagonal
+    assert len(cell_lines[1]) == 2  # Sisi: baris dan kolom
+    lines = get_lines(3)
+    assert all(4 in lines[index] for index in cell_lines[4])
+
+def test_line_tracker_incremental_win():
+    """Menguji deteksi kemenangan inkremental"""
+    tracker = LineTracker(["X", "X", " ", "O", "O", " ", " ", " ", " "], 3)
+    assert tracker.is_winning_move(2, "X") == True
+    assert tracker.is_winning_move(5, "O") == True
+    assert tracker.is_winning_move(8, "X") == False
+    assert tracker.place(2, "X") == True
+    assert tracker.has_won("X") == True
+    assert tracker.has_won("O") == False
+    tracker.remove(2, "X")
+    assert tracker.has_won("X") == False
+
+def test_line_tracker_draw():
+    """Menguji pencacah sel kosong untuk kondisi draw"""
+    board = ["X", "O", "X", "X", "O", "O", "O", "X", " "]
+    tracker = LineTracker(board, 3)
+    assert tracker.is_full() == False
+    assert tracker.place(8, "X") == False
+    assert tracker.is_full() == True
+    assert tracker.has_won("X") == False
+
+def test_line_tracker_replace_stone():
+    """Menguji penempatan ulang pada sel yang sudah terisi"""
+    tracker = LineTracker(["X", "X", " ", " ", " ", " ", " ", " ", " "], 3)
+    assert tracker.place(0, "X") == False
+    assert tracker.empty_count == 7
+    tracker.place(0, "O")
+    assert tracker.is_winning_move(2, "X") == False
+    assert tracker.empty_count == 7
+
+def test_get_lines_win_length():
+    """Menguji jendela geser k-berturut-turut, termasuk semua diagonal"""
+    lines = get_lines(5, 3)
+    # 5 baris x 3 + 5 kolom x 3 + 9 diagonal + 9 diagonal terbalik
+    assert len(lines) == 48
+    assert (0, 1, 2) in lines and (2, 3, 4) in lines
+    assert (2, 8, 14) in lines  # Diagonal di luar diagonal utama
+    assert (4, 8, 12) in lines and (14, 18, 22) in lines
+    assert get_lines(5, 5) == get_lines(5)
+    assert len(get_lines(19, 5)) == 1020
+
+def test_check_winner_win_length():
+    """Menguji kemenangan k-berturut-turut pada papan besar"""
+    board = [" "] * (15 * 15)
+    for step in range(5):
+        board[(3 + step) * 15 + 9 - step] = "X"  # Diagonal terbalik di tengah papan
+    assert check_winner(board, "X", 15, 5) == True
+    assert check_winner(board, "X", 15, 6) == False
+    assert check_winner(board, "X", 15) == False
+
+def test_line_tracker_win_length():
+    """Menguji deteksi kemenangan inkremental dengan panjang kemenangan k"""
+    tracker = LineTracker([" "] * 36, 6, 4)
+    assert max(len(lines) for lines in tracker.cell_lines) <= 4 * 4
+    for cell in (7, 14, 21):
+        assert tracker.place(cell, "O") == False
+    assert tracker.is_winning_move(0, "O") == True
+    assert tracker.is_winning_move(28, "O") == True
+    assert tracker.place(28, "O") == True
+    assert tracker.has_won("O") == True
+
+def test_line_tracker_winning_cells():
+    """Menguji sel kemenangan langsung yang dihitung dari tabel jumlah batu per garis"""
+    board = ["X", "X", " ",
+             "O", "O", " ",
+             "X", " ", " "]
+    tracker = LineTracker(board, 3)
+    assert tracker.winning_cells("X") == {2}
+    assert tracker.winning_cells("O") == {5}
+    tracker.place(2, "O")
+    assert tracker.winning_cells("X") == set()
+    assert tracker.winning_cells("O") == {5}
+    # Bandingkan dengan pemeriksaan sel demi sel pada papan besar
+    rng = random.Random(2)
+    board = [rng.choice("   XO") for _ in range(100)]
+    tracker = LineTracker(board, 10, 4)
+    for player in ("X", "O"):
+        expected = {
+            cell for cell in range(100)
+            if board[cell] == " " and tracker.is_winning_move(cell, player)
+        }
+        assert tracker.winning_cells(player) == expected
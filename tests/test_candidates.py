@@ -0,0 +1,86 @@
+import sys
+import os
+
+# Tambahkan direktori root ke path Python agar bisa import modul board
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import random
+from candidates import (
+    CandidateMoves,
+    get_candidate_moves,
+    get_center_cells,
+    get_neighborhoods,
+)
+from ai_strategies import SearchContext, get_minimax_move, get_mcts_move, get_strategic_move
+from search_stats import SearchStats
+
+
+def test_get_neighborhoods():
+    neighborhoods = get_neighborhoods(9, 2)
+    assert len(neighborhoods[40]) == 24  # Full 5x5 square around the center
+    assert len(neighborhoods[0]) == 8  # Clipped to 3x3 in the corner
+    assert 40 not in neighborhoods[40]
+    assert len(get_neighborhoods(9, 1)[40]) == 8
+
+
+def test_center_cells():
+    assert get_center_cells(15) == [112]
+    assert get_center_cells(8) == [27, 28, 35, 36]
+
+
+def test_candidates_empty_board_falls_back_to_center():
+    assert CandidateMoves([" "] * 225, 15).moves() == [112]
+    assert get_candidate_moves([" "] * 361, 19) == [180]
+
+
+def test_candidates_near_stones():
+    board = [" "] * 225
+    board[0] = "X"
+    assert get_candidate_moves(board, 15) == [1, 2, 15, 16, 17, 30, 31, 32]
+    assert get_candidate_moves(board, 15, distance=1) == [1, 15, 16]
+
+
+def test_candidates_small_boards_use_every_empty_cell():
+    board = ["X", " ", " ", " ", "O", " ", " ", " ", " "]
+    assert get_candidate_moves(board, 3) == [1, 2, 3, 5, 6, 7, 8]
+
+
+def test_incremental_updates_match_rebuild():
+    rng = random.Random(4)
+    board = [" "] * 121
+    candidates = CandidateMoves(board, 11)
+    placed = []
+    for _ in range(40):
+        if placed and rng.random() < 0.3:
+            cell = placed.pop(rng.randrange(len(placed)))
+            candidates.remove(cell)
+            board[cell] = " "
+        else:
+            cell = rng.choice([i for i in range(121) if board[i] == " "])
+            candidates.place(cell)
+            board[cell] = "X"
+            placed.append(cell)
+        assert candidates.moves() == CandidateMoves(board, 11).moves()
+
+
+def test_search_context_keeps_candidates():
+    board = [" "] * 225
+    board[112] = "X"
+    context = SearchContext(board, 15, win_length=5)
+    before = context.candidates.moves()
+    context.place(0, "O")
+    assert 1 in context.candidates.moves()
+    context.remove(0, "O")
+    assert context.candidates.moves() == before
+
+
+def test_strategies_play_near_stones_on_large_boards():
+    board = [" "] * 361
+    board[180] = "X"
+    board[181] = "O"
+    nearby = set(get_candidate_moves(board, 19))
+    assert get_strategic_move(board, "X", 19, 5) in nearby
+    assert get_mcts_move(board, "X", 19, playouts=50, win_length=5) in nearby
+    stats = SearchStats()
+    assert get_minimax_move(board, "X", 19, max_depth=1, stats=stats, win_length=5) in nearby
+    assert stats.branching_factor() < len(nearby) + 1
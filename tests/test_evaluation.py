@@ -0,0 +1,89 @@
+import sys
+import os
+import random
+
+# Tambahkan direktori root ke path Python agar bisa import modul board
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pytest
+import evaluation
+from evaluation import (
+    POSITIONAL_LIMIT,
+    get_line_weights,
+    score_line_counts,
+    evaluate_position,
+)
+from board import LineTracker
+
+
+def test_get_line_weights():
+    weights = get_line_weights(3)
+    assert weights[0] == 0
+    assert weights[1] < weights[2] < weights[3] == 1
+
+
+def test_evaluate_empty_and_symmetric_positions():
+    assert evaluate_position([" "] * 9, "X", 3) == 0
+    # Same stones for both sides on mirrored cells cancel out
+    board = ["X", " ", "O",
+             " ", " ", " ",
+             " ", " ", " "]
+    assert evaluate_position(board, "X", 3) == pytest.approx(0)
+
+
+def test_evaluate_prefers_open_lines():
+    board = [" ", " ", " ",
+             " ", "X", " ",
+             " ", " ", " "]
+    # The center sits on four open lines, a corner only on three
+    assert evaluate_position(board, "X", 3) > 0
+    assert evaluate_position(board, "O", 3) < 0
+    corner = ["X", " ", " ",
+              " ", " ", " ",
+              " ", " ", " "]
+    assert evaluate_position(board, "X", 3) > evaluate_position(corner, "X", 3)
+
+
+def test_evaluate_stays_below_win_score():
+    board = ["X", "X", " ",
+             "X", "X", " ",
+             " ", " ", " "]
+    score = evaluate_position(board, "X", 3)
+    assert 0 < score <= POSITIONAL_LIMIT < 10
+
+
+def test_evaluate_tracker_matches_recount():
+    board = ["X", "O", " ",
+             " ", "X", " ",
+             "O", " ", " "]
+    tracker = LineTracker(board, 3)
+    assert evaluate_position(board, "X", 3, tracker) == pytest.approx(
+        evaluate_position(board, "X", 3)
+    )
+    assert score_line_counts(tracker.counts["O"], tracker.counts["X"], 3) == pytest.approx(
+        -evaluate_position(board, "X", 3)
+    )
+
+
+def test_evaluate_numpy_matches_python(monkeypatch):
+    pytest.importorskip("numpy")
+    rng = random.Random(7)
+    for size in [3, 6, 9]:
+        board = [rng.choice(" XO") for _ in range(size * size)]
+        numpy_score = evaluation.score_lines_numpy(board, "X", size)
+        monkeypatch.setattr(evaluation, "np", None)
+        python_score = evaluate_position(board, "X", size)
+        monkeypatch.undo()
+        assert numpy_score == pytest.approx(python_score)
+
+
+def test_evaluate_win_length_paths_agree(monkeypatch):
+    pytest.importorskip("numpy")
+    rng = random.Random(11)
+    board = [rng.choice("  XO") for _ in range(15 * 15)]
+    tracker = LineTracker(board, 15, 5)
+    tracker_score = evaluate_position(board, "O", 15, tracker)
+    numpy_score = evaluate_position(board, "O", 15, win_length=5)
+    monkeypatch.setattr(evaluation, "np", None)
+    python_score = evaluate_position(board, "O", 15, win_length=5)
+    assert tracker_score == pytest.approx(numpy_score) == pytest.approx(python_score)
@@ -0,0 +1,66 @@
+import sys
+import os
+
+# Tambahkan direktori root ke path Python agar bisa import modul board
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import random
+from game_state import GameState
+from board import LineTracker, check_draw, check_winner
+
+
+def test_behaves_like_a_list_board():
+    board = ["X", " ", " ", " ", "O", " ", " ", " ", "X"]
+    state = GameState.from_board(board, 3, "O")
+    assert state == board and state.to_list() == board
+    assert len(state) == 9
+    assert list(state) == board
+    assert state[0] == "X" and state[1] == " "
+    assert state[3:6] == [" ", "O", " "]
+    assert state.count("X") == 2 and state.count(" ") == 6
+    assert "O" in state and " " in state
+    assert "".join(state) == "".join(board)
+    assert state.to_move == "O"
+
+
+def test_free_cells_stay_current():
+    rng = random.Random(3)
+    state = GameState(4)
+    board = [" "] * 16
+    for _ in range(200):
+        cell = rng.randrange(16)
+        player = rng.choice(" XO")
+        state[cell] = player
+        board[cell] = player
+        assert sorted(state.free) == [i for i, stone in enumerate(board) if stone == " "]
+        assert all(state.free[state.positions[cell]] == cell for cell in state.free)
+        assert state.empty_count == board.count(" ")
+        assert state.is_full() == (" " not in board)
+
+
+def test_random_move_and_play():
+    state = GameState(3)
+    for _ in range(9):
+        move = state.random_move()
+        assert state[move] == " "
+        player = state.to_move
+        state.play(move)
+        assert state[move] == player and state.to_move != player
+    assert state.is_full() and " " not in state
+
+
+def test_copy_is_independent():
+    state = GameState.from_board(["X"] + [" "] * 8, 3, "O")
+    copy = state.copy()
+    copy.play(4)
+    assert state[4] == " " and state.empty_count == 8
+    assert copy[4] == "O" and copy.to_move == "X"
+    assert copy != state
+
+
+def test_board_functions_accept_it():
+    state = GameState.from_board(["X", "X", "X", "O", "O", " ", " ", " ", " "], 3)
+    assert check_winner(state, "X", 3)
+    assert not check_winner(state, "O", 3)
+    assert not check_draw(state)
+    assert LineTracker(state, 3).cells == state.to_list()
@@ -5,7 +5,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 import pytest
 from unittest.mock import patch
-from main import get_strategy_and_size, main
+from main import get_strategy_and_size, get_options, main
 
 def test_get_strategy_and_size_valid():
     with patch('sys.argv', ['main.py', 'random', '3']):
@@ -13,6 +13,10 @@ def test_get_strategy_and_size_valid():
         assert strategy == 'random'
         assert size == 3
 
+def test_get_strategy_and_size_mcts():
+    with patch('sys.argv', ['main.py', 'mcts', '10']):
+        assert get_strategy_and_size() == ('mcts', 10)
+
 def test_get_strategy_and_size_invalid_strategy():
     with patch('sys.argv', ['main.py', 'invalid', '3']):
         try:
@@ -48,4 +52,56 @@ def test_main_calls_initialize_and_play(mock_play, mock_init):
         main()
         mock_init.assert_called_once_with(3)
         board, current_player = mock_init.return_value
-        mock_play.assert_called_once_with(board, current_player, 'random', 3)
+        mock_play.assert_called_once_with(board, current_player, 'random', 3, time_limit=None, log_stats=False, win_length=None, ponder=False, reuse_tree=False)
+
+def test_get_options_defaults():
+    with patch('sys.argv', ['main.py', 'minimax', '3']):
+        assert get_options() == {'time_limit': None, 'win_length': None, 'stats': False, 'ponder': False, 'reuse_tree': False}
+
+def test_get_options_time_limit():
+    with patch('sys.argv', ['main.py', 'minimax', '6', '--time-limit', '0.2']):
+        strategy, size = get_strategy_and_size()
+        assert (strategy, size) == ('minimax', 6)
+        assert get_options() == {'time_limit': 0.2, 'win_length': None, 'stats': False, 'ponder': False, 'reuse_tree': False}
+
+def test_get_options_invalid():
+    for argv in (['main.py', 'minimax', '3', '--time-limit'],
+                 ['main.py', 'minimax', '3', '--time-limit', '0'],
+                 ['main.py', 'minimax', '3', '--time-limit', 'abc'],
+                 ['main.py', 'minimax', '3', '--unknown', '1']):
+        with patch('sys.argv', argv):
+            with pytest.raises(SystemExit) as e:
+                get_options()
+            assert e.value.code == 1
+
+@patch('main.initialize_game')
+@patch('main.play_game')
+def test_main_passes_time_limit(mock_play, mock_init):
+    with patch('sys.argv', ['main.py', 'minimax', '3', '--time-limit', '0.5']):
+        mock_init.return_value = ([" "]*9, "O")
+        main()
+        board, current_player = mock_init.return_value
+        mock_play.assert_called_once_with(board, current_player, 'minimax', 3, time_limit=0.5, log_stats=False, win_length=None, ponder=False, reuse_tree=False)
+
+def test_get_options_stats():
+    with patch('sys.argv', ['main.py', 'minimax', '3', '--stats', '--time-limit', '0.2']):
+        assert get_options() == {'time_limit': 0.2, 'win_length': None, 'stats': True, 'ponder': False, 'reuse_tree': False}
+
+def test_get_options_win_length():
+    with patch('sys.argv', ['main.py', 'minimax', '15', '--win-length', '5']):
+        assert get_options(15) == {'time_limit': None, 'win_length': 5, 'stats': False, 'ponder': False, 'reuse_tree': False}
+    for argv in (['main.py', 'minimax', '4', '--win-length', '5'],
+                 ['main.py', 'minimax', '4', '--win-length', '2'],
+                 ['main.py', 'minimax', '4', '--win-length', 'x']):
+        with patch('sys.argv', argv):
+            with pytest.raises(SystemExit) as e:
+                get_options(4)
+            assert e.value.code == 1
+
+def test_get_options_ponder():
+    with patch('sys.argv', ['main.py', 'minimax', '5', '--ponder']):
+        assert get_options(5) == {'time_limit': None, 'win_length': None, 'stats': False, 'ponder': True, 'reuse_tree': False}
+
+def test_get_options_reuse_tree():
+    with patch('sys.argv', ['main.py', 'minimax', '5', '--reuse-tree', '--ponder']):
+        assert get_options(5) == {'time_limit': None, 'win_length': None, 'stats': False, 'ponder': True, 'reuse_tree': True}
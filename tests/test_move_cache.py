@@ -0,0 +1,85 @@
+import sys
+import os
+
+# Tambahkan direktori root ke path Python agar bisa import modul board
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pytest
+from move_cache import MoveCache
+from symmetry import get_symmetries, transform_board
+
+
+def lookup(cache, board, size=3):
+    key, index = cache.key(board, "strategic", "X", size)
+    return cache.get(key, index, size)
+
+
+def store(cache, board, move, size=3):
+    key, index = cache.key(board, "strategic", "X", size)
+    cache.put(key, index, size, move)
+
+
+def board_with_x(cell):
+    board = [" "] * 9
+    board[cell] = "X"
+    return board
+
+
+def test_miss_then_hit():
+    cache = MoveCache(4)
+    board = board_with_x(0)
+    assert lookup(cache, board) is None
+    store(cache, board, 4)
+    assert lookup(cache, board) == 4
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 1, 0)
+    assert cache.hit_rate() == 0.5
+
+
+def test_key_separates_strategy_player_and_rules():
+    cache = MoveCache()
+    board = board_with_x(0)
+    keys = {
+        cache.key(board, "strategic", "X", 3)[0],
+        cache.key(board, "minimax", "X", 3)[0],
+        cache.key(board, "strategic", "O", 3)[0],
+        cache.key(board, "strategic", "X", 3, time_limit=0.1)[0],
+    }
+    assert len(keys) == 4
+    assert cache.key(board, "strategic", "X", 3, 3)[0] == cache.key(board, "strategic", "X", 3)[0]
+
+
+def test_evicts_least_recently_used():
+    cache = MoveCache(2)
+    store(cache, board_with_x(0), 4)
+    store(cache, board_with_x(1), 4)
+    assert lookup(cache, board_with_x(0)) == 4  # Now the most recently used
+    store(cache, board_with_x(2), 4)
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert lookup(cache, board_with_x(1)) is None
+    assert lookup(cache, board_with_x(0)) == 4
+    assert lookup(cache, board_with_x(2)) == 4
+
+
+def test_symmetric_cache_maps_moves_onto_each_board():
+    cache = MoveCache(symmetric=True)
+    board = [" "] * 16
+    board[1], board[6] = "X", "O"
+    store(cache, board, 2, 4)
+    for permutation in get_symmetries(4):
+        assert lookup(cache, transform_board(board, permutation), 4) == permutation[2]
+    assert cache.hits == 8 and len(cache) == 1
+    # A full board has no move to store
+    store(cache, ["X", "O"] * 8, None, 4)
+    assert len(cache) == 1
+
+
+def test_clear_and_capacity():
+    cache = MoveCache(1)
+    store(cache, board_with_x(0), 4)
+    lookup(cache, board_with_x(0))
+    cache.clear()
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses, cache.evictions) == (0, 0, 0)
+    with pytest.raises(ValueError):
+        MoveCache(0)
@@ -0,0 +1,63 @@
+import sys
+import os
+
+# Tambahkan direktori root ke path Python agar bisa import modul board
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from move_ordering import MoveOrdering, get_cell_priorities
+from board import LineTracker
+
+
+def test_get_cell_priorities():
+    priorities = get_cell_priorities(3)
+    assert priorities[4] == 2  # Center
+    assert [priorities[i] for i in [0, 2, 6, 8]] == [1, 1, 1, 1]  # Corners
+    assert [priorities[i] for i in [1, 3, 5, 7]] == [0, 0, 0, 0]  # Edges
+
+    # Even boards have four center cells
+    priorities = get_cell_priorities(4)
+    assert [priorities[i] for i in [5, 6, 9, 10]] == [2, 2, 2, 2]
+
+
+def test_order_empty_board():
+    board = [" "] * 9
+    ordering = MoveOrdering(3)
+    moves = ordering.order(board, "X", 0, LineTracker(board, 3))
+    assert moves[0] == 4  # Center first
+    assert set(moves[1:5]) == {0, 2, 6, 8}  # Then the corners
+    assert sorted(moves) == list(range(9))
+
+
+def test_order_prefers_friendly_lines():
+    board = ["O", " ", " ",
+             " ", "X", " ",
+             " ", " ", " "]
+    ordering = MoveOrdering(3)
+    moves = ordering.order(board, "O", 1, LineTracker(board, 3))
+    # Corners 2 and 6 extend O's open row and column
+    assert set(moves[:2]) == {2, 6}
+    assert 0 not in moves and 4 not in moves
+
+
+def test_order_cached_and_killer_moves_first():
+    board = [" "] * 9
+    tracker = LineTracker(board, 3)
+    ordering = MoveOrdering(3)
+    ordering.record_cutoff(7, "X", 2, 3)
+    ordering.record_cutoff(5, "X", 2, 3)
+    assert ordering.killers[2] == [5, 7]
+    assert ordering.history["X"][5] == 9
+
+    moves = ordering.order(board, "X", 2, tracker)
+    assert moves[:2] == [5, 7]
+    moves = ordering.order(board, "X", 2, tracker, first_move=1)
+    assert moves[:3] == [1, 5, 7]
+    # Killers belong to their own ply
+    assert ordering.order(board, "X", 3, tracker)[0] == 4
+
+
+def test_order_restricted_moves():
+    board = [" "] * 9
+    ordering = MoveOrdering(3)
+    moves = ordering.order(board, "X", 0, LineTracker(board, 3), moves=[0, 1, 4])
+    assert moves == [4, 0, 1]
@@ -4,17 +4,28 @@ import os
 # Tambahkan direktori root ke path Python agar bisa import modul board
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+import random
+import time
 import pytest
+import moves
+from ai_strategies import SearchSession
 from moves import (
     switch_player,
     initialize_game,
     get_player_move,
     get_computer_move,
+    get_computer_moves,
     get_move,
     update_board,
     play_game,
+    play_headless_game,
 )
 from board import print_board, check_winner, check_draw
+from game_state import GameState
+from move_cache import MoveCache
+from search_stats import SearchStats
+from symmetry import get_symmetries, transform_board
+from transposition import TranspositionTable
 
 
 def test_switch_player():
@@ -27,6 +38,14 @@ def test_initialize_game():
     assert len(board) == 9
     assert all(cell == " " for cell in board)
     assert player in ["X", "O"]
+    assert isinstance(board, GameState) and board.to_move == player
+
+
+def test_update_board_passes_the_turn_on_game_state():
+    board = GameState(3, "X")
+    update_board(board, 4, "X")
+    assert board[4] == "X" and board.to_move == "O" and board.empty_count == 8
+    assert get_computer_move(board, "random", "O", 3) in board.free
 
 
 def test_get_player_move(monkeypatch):
@@ -60,6 +79,10 @@ def test_get_computer_move():
     # Similarly, minimax move logic is assumed to be correct
     assert board[move] == " "
 
+    strategy = "mcts"
+    move = get_computer_move(board, strategy, player, size)
+    assert board[move] == " "
+
     strategy = "worst"
     move = get_computer_move(board, strategy, player, size)
     # Worst move logic is assumed to be correct
@@ -104,7 +127,9 @@ def test_play_game(monkeypatch, capsys):
         "O": [3, 4]      # O's moves don't matter
     }
     
-    def mock_get_move_win(player, board, strategy, size):
+    def mock_get_move_win(
+        player, board, strategy, size, time_limit=None, stats=None, win_length=None, session=None
+    ):
         if win_moves[player]:
             return win_moves[player].pop(0)
         return 0  # Default move if list is empty
@@ -128,7 +153,9 @@ def test_play_game(monkeypatch, capsys):
         "O": [1, 4, 5, 6, 8]   # O moves
     }
     
-    def mock_get_move_draw(player, board, strategy, size):
+    def mock_get_move_draw(
+        player, board, strategy, size, time_limit=None, stats=None, win_length=None, session=None
+    ):
         if draw_moves[player]:
             return draw_moves[player].pop(0)
         return 0  # Default move if list is empty
@@ -143,3 +170,149 @@ def test_play_game(monkeypatch, capsys):
     assert "It's a draw!" in captured.out
     # Verify final board state for draw
     assert " " not in board  # All positions filled
+
+
+def test_play_headless_game(capsys):
+    winner, move_times = play_headless_game({"X": "strategic", "O": "worst"}, 3)
+    assert winner in ["X", "O", None]
+    assert move_times[0][0] == "X"  # X moves first by default
+    assert all(seconds >= 0 for _, seconds in move_times)
+    assert capsys.readouterr().out == ""  # No board printing
+
+    # Strategic never loses to the worst strategy
+    for _ in range(5):
+        winner, _ = play_headless_game({"X": "worst", "O": "strategic"}, 3, "O")
+        assert winner != "X"
+
+    # Boards larger than 3x3 play out to the end
+    winner, move_times = play_headless_game({"X": "strategic", "O": "strategic"}, 4)
+    assert len(move_times) <= 16
+
+
+def test_play_headless_game_reuse_tree_bypasses_the_cache(monkeypatch):
+    cache = MoveCache()
+    monkeypatch.setattr(moves, "move_cache", cache)
+    strategies = {"X": "minimax", "O": "minimax"}
+    first = play_headless_game(strategies, 4)
+    second = play_headless_game(strategies, 4)
+    assert first[0] == second[0]
+    # By default the second game plays every move from the cache
+    assert cache.hits == len(second[1]) == cache.misses
+    play_headless_game(strategies, 4, reuse_tree=True)
+    assert cache.hits == cache.misses == len(second[1])
+
+
+def test_play_game_logs_stats(monkeypatch, capsys):
+    # X (the human) fills cells in order; O searches with minimax on 4x4 and logs its statistics
+    human_moves = iter(str(cell) for cell in range(1, 17))
+    monkeypatch.setattr("builtins.input", lambda _: next(human_moves))
+    board = [" "] * 16
+    play_game(board, "O", "minimax", 4, log_stats=True)
+    captured = capsys.readouterr()
+    assert "Search: " in captured.out
+    assert " nodes, " in captured.out
+
+
+def test_play_headless_game_win_length():
+    # Four in a row on 6x6: the strategic player blocks and wins like on small boards
+    winner, move_times = play_headless_game({"X": "strategic", "O": "random"}, 6, win_length=4)
+    assert winner in ("X", "O", None)
+    assert len(move_times) <= 36
+
+
+def test_large_board_moves_are_fast():
+    board = [" "] * (19 * 19)
+    board[180] = "X"
+    board[181] = "O"
+    for strategy in ("minimax", "mcts"):
+        start = time.perf_counter()
+        move = get_computer_move(board, strategy, "X", 19, win_length=5)
+        assert time.perf_counter() - start < 0.5  # Budgeted at LARGE_BOARD_TIME_LIMIT
+        assert board[move] == " "
+
+
+def test_get_computer_moves_matches_single_calls_in_order():
+    boards = [
+        ["X", " ", " ", " ", "O", " ", " ", " ", " "],
+        ["X", "X", " ", "O", "O", " ", " ", " ", " "],
+        [" "] * 9,
+        ["X", "X", " ", "O", "O", " ", " ", " ", " "],
+    ]
+    for strategy in ("strategic", "minimax"):
+        expected = [get_computer_move(board, strategy, "X", 3) for board in boards]
+        assert get_computer_moves(boards, strategy, "X", 3) == expected
+    assert get_computer_moves([], "minimax", "X", 3) == []
+    for strategy in ("random", "worst"):
+        for move, board in zip(get_computer_moves(boards, strategy, "X", 3), boards):
+            assert board[move] == " "
+
+
+def test_get_computer_moves_do_not_depend_on_the_batch(monkeypatch):
+    monkeypatch.setattr(moves, "move_cache", None)
+    rng = random.Random(5)
+    boards = []
+    for _ in range(40):
+        board = [" "] * 16
+        for cell in rng.sample(range(16), rng.randrange(2, 9)):
+            board[cell] = rng.choice("XO")
+        boards.append(board)
+    expected = [get_computer_move(board, "minimax", "X", 4) for board in boards]
+    assert get_computer_moves(boards, "minimax", "X", 4, symmetric=False) == expected
+    assert get_computer_moves(boards[::-1], "minimax", "X", 4, symmetric=False) == expected[::-1]
+    # Nor on the chunks the batch is split into
+    batch = get_computer_moves(boards, "minimax", "X", 4)
+    assert get_computer_moves(boards, "minimax", "X", 4, chunk_size=7) == batch
+    assert get_computer_moves(boards[::-1], "minimax", "X", 4) == batch[::-1]
+
+
+def test_get_computer_moves_shares_symmetric_positions():
+    board = [" "] * 16
+    board[0], board[5], board[6] = "X", "O", "X"
+    board[9] = "O"
+    symmetries = get_symmetries(4)
+    boards = [transform_board(board, permutation) for permutation in symmetries]
+    moves = get_computer_moves(boards * 2, "minimax", "O", 4)
+    assert moves[:8] == moves[8:]
+    # Each rotated or reflected board gets the correspondingly transformed move
+    for permutation, move in zip(symmetries, moves):
+        assert move == permutation[moves[0]]
+    # A full board has no move, as with get_computer_move
+    full = ["X", "O"] * 8
+    assert get_computer_move(full, "minimax", "X", 4) is None
+    assert get_computer_moves([full, board], "minimax", "O", 4) == [None, moves[0]]
+
+
+def test_get_computer_moves_in_process_pool():
+    boards = [[" "] * 16 for _ in range(5)]
+    for index, board in enumerate(boards):
+        board[index] = "X"
+        board[15 - index] = "O"
+    expected = get_computer_moves(boards, "strategic", "X", 4)
+    assert get_computer_moves(boards, "strategic", "X", 4, processes=2, chunk_size=2) == expected
+
+
+def test_get_computer_move_caches_deterministic_strategies(monkeypatch):
+    cache = MoveCache(8)
+    monkeypatch.setattr(moves, "move_cache", cache)
+    board = [" "] * 16
+    board[0], board[5] = "X", "O"
+    first = get_computer_move(board, "minimax", "X", 4)
+    assert get_computer_move(board, "minimax", "X", 4) == first
+    assert get_computer_move(board, "strategic", "X", 4) == get_computer_move(board, "strategic", "X", 4)
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    # Randomized strategies and measured searches always run
+    for strategy in ("random", "mcts", "worst"):
+        get_computer_move(board, strategy, "X", 4, time_limit=0.01)
+    stats = SearchStats()
+    assert get_computer_move(board, "minimax", "X", 4, stats=stats) == first
+    assert stats.nodes > 0
+    # So do searches whose moves depend on a kept table
+    get_computer_move(board, "minimax", "X", 4, table=TranspositionTable())
+    get_computer_move(board, "minimax", "X", 4, session=SearchSession())
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    moves.set_move_cache(None)
+    assert moves.move_cache is None
+    assert get_computer_move(board, "minimax", "X", 4) == first
+    assert len(cache) == 2
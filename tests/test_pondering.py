@@ -0,0 +1,81 @@
+import sys
+import os
+
+# Tambahkan direktori root ke path Python agar bisa import modul board
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import threading
+import time
+import pytest
+import moves
+from ai_strategies import SearchTimeout, get_minimax_move
+from pondering import Ponderer
+
+
+def wait_for(ponderer, count, timeout=10):
+    deadline = time.perf_counter() + timeout
+    while len(ponderer.results) < count and time.perf_counter() < deadline:
+        time.sleep(0.005)
+
+
+def test_stop_event_aborts_search():
+    stop = threading.Event()
+    stop.set()
+    board = [" "] * 16
+    with pytest.raises(SearchTimeout):
+        get_minimax_move(board, "X", 4, stop=stop)
+    with pytest.raises(SearchTimeout):
+        get_minimax_move(board, "X", 4, time_limit=1, stop=stop)
+
+
+def test_reuses_reply_to_pondered_move():
+    board = [" "] * 16
+    board[5] = "X"
+    board[6] = "O"
+    ponderer = Ponderer(board, "O", 4).start()
+    wait_for(ponderer, 14)  # Every move the opponent has
+    likely = ponderer.likely_moves()
+    assert len(ponderer.results) == 14 and set(ponderer.results) == set(likely)
+    move = likely[-1]
+    reply = ponderer.finish(move)
+    assert reply == ponderer.results[move]
+    board[move] = "X"
+    assert board[reply] == " "
+    assert not ponderer.thread.is_alive()
+
+
+def test_finish_cancels_unpondered_move():
+    board = [" "] * 225
+    board[112] = "X"
+    board[113] = "O"
+    ponderer = Ponderer(board, "O", 15, time_limit=5, win_length=5).start()
+    start = time.perf_counter()
+    assert ponderer.finish(0) is None  # Far from the stones, so never a candidate
+    assert time.perf_counter() - start < 1
+    assert not ponderer.thread.is_alive()
+
+
+def test_no_reply_after_game_ending_move():
+    board = ["X", "X", "X", " ", "O", "O", "O", " "] + [" "] * 8
+    ponderer = Ponderer(board, "O", 4).start()
+    wait_for(ponderer, 1)
+    assert ponderer.finish(3) is None  # X completes the top row
+
+
+def test_play_game_with_pondering(monkeypatch, capsys):
+    monkeypatch.setattr(moves, "move_cache", None)
+    human_moves = iter(str(cell) for cell in range(1, 17))
+
+    def think(prompt):
+        time.sleep(0.05)
+        while True:
+            move = next(human_moves)
+            if board[int(move) - 1] == " ":
+                return move
+
+    monkeypatch.setattr("builtins.input", think)
+    board = moves.GameState(4, "X")
+    moves.play_game(board, "X", "minimax", 4, ponder=True)
+    out = capsys.readouterr().out
+    assert "wins!" in out or "draw" in out
+    assert threading.active_count() == 1
@@ -0,0 +1,165 @@
+import sys
+import os
+
+# Tambahkan direktori root ke path Python agar bisa import modul board
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import sqlite3
+import time
+import pytest
+import moves
+from ai_strategies import get_minimax_move
+from position_store import PositionStore, position_key
+from search_stats import SearchStats
+from symmetry import get_symmetries, transform_board
+
+
+def opening():
+    board = [" "] * 16
+    board[0], board[5] = "X", "O"
+    return board
+
+
+def stored_rows(path):
+    with sqlite3.connect(path) as connection:
+        return connection.execute("SELECT key, move, depth FROM positions").fetchall()
+
+
+def test_round_trip_across_reopen(tmp_path):
+    path = str(tmp_path / "positions.db")
+    store = PositionStore(path)
+    store.record(opening(), "X", 4, 10, 3)
+    assert store.lookup(opening(), "X", 4) == (10, 3)
+    store.close()
+
+    store = PositionStore(path)
+    assert len(store.entries) == 1  # Warm-loaded
+    for permutation in get_symmetries(4):
+        rotated = transform_board(opening(), permutation)
+        assert store.lookup(rotated, "X", 4) == (permutation[10], 3)
+    assert store.lookup(opening(), "O", 4) is None
+    assert store.lookup(opening(), "X", 4, win_length=3) is None
+    store.close()
+
+
+def test_writes_are_behind_and_batched(tmp_path):
+    path = str(tmp_path / "positions.db")
+    store = PositionStore(path, flush_size=3, flush_interval=60)
+    keys = [position_key([" "] * 9, player, 3)[0] for player in "XO"]
+    store.put(keys[0], 4, 9)
+    store.put(keys[1], 0, 9)
+    assert stored_rows(path) == []
+    store.put(position_key(["X"] + [" "] * 8, "O", 3)[0], 4, 8)
+    assert len(stored_rows(path)) == 3 and store.writes == 3
+    store.close()
+
+
+def test_keeps_the_deeper_result(tmp_path):
+    path = str(tmp_path / "positions.db")
+    store = PositionStore(path, flush_size=1)
+    key = position_key(opening(), "X", 4)[0]
+    store.put(key, 1, 5)
+    store.put(key, 2, 3)
+    assert store.get(key) == (1, 5)
+    # A shallower result from another process does not overwrite it either
+    other = PositionStore(path, flush_size=1, warm=0)
+    other.put(key, 2, 3)
+    assert stored_rows(path) == [(key, 1, 5)]
+    other.close()
+    store.close()
+
+
+def test_prefetch_and_miss_reads(tmp_path):
+    path = str(tmp_path / "positions.db")
+    store = PositionStore(path)
+    keys = [position_key(opening(), player, 4)[0] for player in "XO"]
+    store.put(keys[0], 1, 2)
+    store.put(keys[1], 2, 2)
+    store.close()
+    store = PositionStore(path, warm=0)
+    assert store.entries == {}
+    store.prefetch(keys + ["missing"])
+    assert store.entries == {keys[0]: (1, 2), keys[1]: (2, 2)}
+    store.entries.clear()
+    assert store.get(keys[1]) == (2, 2)  # Read from the file on a miss
+    assert store.get("missing") is None
+    assert (store.hits, store.misses) == (1, 1)
+    store.close()
+
+
+def test_evicts_least_recently_used_and_old_entries(tmp_path):
+    path = str(tmp_path / "positions.db")
+    store = PositionStore(path, capacity=2, flush_size=1)
+    keys = [f"key{index}" for index in range(3)]
+    store.put(keys[0], 0, 1)
+    store.put(keys[1], 1, 1)
+    store.get(keys[0])
+    store.put(keys[2], 2, 1)  # Flushes the access to key0, then drops key1
+    assert sorted(row[0] for row in stored_rows(path)) == ["key0", "key2"]
+    assert len(store.entries) == 2
+    store.close()
+
+    with sqlite3.connect(path) as connection:
+        connection.execute("UPDATE positions SET used = ? WHERE key = 'key0'", (time.time() - 100,))
+    store = PositionStore(path, max_age=50)
+    assert [row[0] for row in stored_rows(path)] == ["key2"]
+    store.close()
+    with pytest.raises(ValueError):
+        PositionStore(path, capacity=0)
+
+
+def test_minimax_reuses_stored_results(tmp_path):
+    path = str(tmp_path / "positions.db")
+    store = PositionStore(path)
+    move = get_minimax_move(opening(), "X", 4, max_depth=2, store=store)
+    assert store.lookup(opening(), "X", 4) == (move, 3)
+    stats = SearchStats()
+    assert get_minimax_move(opening(), "X", 4, max_depth=2, stats=stats, store=store) == move
+    assert stats.nodes == 0
+    # A deeper search than the stored one still runs, and replaces it
+    get_minimax_move(opening(), "X", 4, max_depth=3, stats=stats, store=store)
+    assert stats.nodes > 0
+    assert store.lookup(opening(), "X", 4)[1] == 4
+
+    # A timed search that completes less than the stored depth plays the stored move
+    store.record(opening(), "O", 4, 15, 10)
+    assert get_minimax_move(opening(), "O", 4, time_limit=0.001, store=store) == 15
+    # A solved position is returned even by a timed search
+    board = ["X", "X", "X", " ", "O", "O", "O", " ", " ", " ", " ", " ", " ", " ", " ", " "]
+    assert get_minimax_move(board, "X", 4, time_limit=1, store=store) == 3
+    assert store.lookup(board, "X", 4) == (3, board.count(" "))
+    store.close()
+
+
+def test_full_board_is_not_stored(tmp_path, monkeypatch):
+    path = str(tmp_path / "positions.db")
+    store = PositionStore(path)
+    full = ["X", "O", "O", "X"] * 4
+    assert get_minimax_move(full, "X", 4, store=store) is None
+    assert get_minimax_move(full, "X", 4, time_limit=0.1, store=store) is None
+    store.close()
+    assert stored_rows(path) == []
+    # Nor does the batch API crash on it with a store open
+    monkeypatch.setattr(moves, "position_store", None)
+    moves.open_position_store(path)
+    assert moves.get_computer_moves([full, opening()], "minimax", "X", 4)[0] is None
+    moves.close_position_store()
+
+
+def test_get_computer_move_uses_open_store(tmp_path, monkeypatch):
+    path = str(tmp_path / "positions.db")
+    monkeypatch.setattr(moves, "position_store", None)
+    monkeypatch.setattr(moves, "move_cache", None)
+    store = moves.open_position_store(path)
+    move = moves.get_computer_move(opening(), "minimax", "X", 4)
+    assert store.lookup(opening(), "X", 4)[0] == move
+    other = opening()
+    other[15] = "X"
+    other[10] = "O"
+    boards = [opening(), transform_board(opening(), get_symmetries(4)[1]), other]
+    batch = moves.get_computer_moves(boards, "minimax", "X", 4, processes=2, chunk_size=1)
+    assert batch[0] == move
+    moves.close_position_store()
+    assert moves.position_store is None
+    # The pool workers stored the position this process had not seen
+    assert PositionStore(path).lookup(other, "X", 4)[0] == batch[2]
@@ -0,0 +1,104 @@
+import sys
+import os
+
+# Tambahkan direktori root ke path Python agar bisa import modul board
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import itertools
+import pytest
+
+pytest.importorskip("numpy")
+
+import retrograde
+from retrograde import (
+    DRAW,
+    LOSS,
+    WIN,
+    build_database,
+    database_bytes,
+    load_database,
+    position_index,
+)
+from solved_table import probe_solved
+from search_stats import SearchStats
+import ai_strategies
+from ai_strategies import get_minimax_move
+
+
+@pytest.fixture(scope="module")
+def database_3x3(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("retrograde") / "retrograde_3x3.bin")
+    build_database(3, path, processes=1)
+    return path
+
+
+def test_position_index_swaps_colors_of_games_o_started():
+    board = ["O", " ", " ", " ", " ", " ", " ", " ", " "]
+    swapped = ["X", " ", " ", " ", " ", " ", " ", " ", " "]
+    assert position_index(board, "X") == position_index(swapped, "O") == 1
+    assert position_index([" "] * 9, "X") == position_index([" "] * 9, "O") == 0
+    assert position_index(["X", "X", " ", " ", " ", " ", " ", " ", " "], "O") is None
+
+
+def test_database_matches_solved_table(database_3x3):
+    database = load_database(3, database_3x3)
+    assert not os.path.exists(database_3x3 + ".progress")
+    assert len(database.data) == database_bytes(3)
+    checked = 0
+    for board in itertools.product(" XO", repeat=9):
+        board = list(board)
+        for player in ("X", "O"):
+            solved = probe_solved(board, player, 3)
+            if solved is not None:
+                assert database.probe(board, player) == solved[0]
+                checked += 1
+    assert checked == 2 * 5478
+
+
+def test_parallel_chunked_build_is_identical(database_3x3, tmp_path):
+    path = str(tmp_path / "parallel.bin")
+    build_database(3, path, processes=2, chunk_bytes=256)
+    with open(path, "rb") as built, open(database_3x3, "rb") as expected:
+        assert built.read() == expected.read()
+
+
+def test_interrupted_build_resumes(database_3x3, tmp_path, monkeypatch):
+    path = str(tmp_path / "resumed.bin")
+    solve_chunk = retrograde.solve_chunk
+    calls = []
+
+    def interrupted(task):
+        if len(calls) == 30:
+            raise KeyboardInterrupt
+        calls.append(task)
+        return solve_chunk(task)
+
+    monkeypatch.setattr(retrograde, "solve_chunk", interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        build_database(3, path, processes=1, chunk_bytes=256)
+    assert os.path.exists(path + ".progress")
+
+    monkeypatch.setattr(retrograde, "solve_chunk", solve_chunk)
+    build_database(3, path, processes=1, chunk_bytes=256)
+    assert not os.path.exists(path + ".progress")
+    with open(path, "rb") as built, open(database_3x3, "rb") as expected:
+        assert built.read() == expected.read()
+
+
+def test_load_database_missing_file(tmp_path):
+    assert load_database(3, str(tmp_path / "missing.bin")) is None
+
+
+def test_minimax_probes_database(database_3x3, monkeypatch):
+    database = load_database(3, database_3x3)
+    monkeypatch.setattr(ai_strategies, "load_database", lambda size: database)
+    # X wins from here, but not by any move a depth-0 search can tell apart
+    board = [" ", " ", " ", " ", " ", " ", "X", " ", "O"]
+    assert database.probe(board, "X") == WIN
+    stats = SearchStats()
+    move = get_minimax_move(board, "X", 3, max_depth=0, stats=stats)
+    board[move] = "X"
+    assert database.probe(board, "O") == LOSS
+    assert stats.database_hits > 0
+    assert stats.evaluations == 0
+    assert database.probe([" "] * 9, "O") == DRAW
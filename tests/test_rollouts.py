@@ -0,0 +1,78 @@
+import sys
+import os
+
+# Tambahkan direktori root ke path Python agar bisa import modul board
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import random
+from rollouts import X, O, encode_boards, find_winners, play_random_games, simulate
+from board import check_winner
+from ai_strategies import get_mcts_move
+
+
+def test_encode_boards_and_find_winners():
+    boards = encode_boards([
+        ["X", "X", "X", "O", "O", " ", " ", " ", " "],
+        ["O", "X", " ", "O", "X", " ", "O", " ", " "],
+        [" "] * 9,
+    ])
+    assert boards.dtype == np.int8
+    assert boards[0].tolist() == [X, X, X, O, O, 0, 0, 0, 0]
+    assert find_winners(boards, 3).tolist() == [X, O, 0]
+
+
+def test_play_random_games_finishes_consistently():
+    for size in [3, 4, 5]:
+        boards = np.zeros((500, size * size), dtype=np.int8)
+        winners = play_random_games(boards, X, size, np.random.default_rng(size))
+        for row, winner in zip(boards, winners):
+            board = [" XO"[cell] for cell in row]
+            x_won = check_winner(board, "X", size)
+            o_won = check_winner(board, "O", size)
+            assert not (x_won and o_won)
+            assert winner == (X if x_won else O if o_won else 0)
+            if winner == 0:
+                assert " " not in board  # Draws only on a full board
+            # Players alternated starting with X
+            assert board.count("X") - board.count("O") in [0, 1]
+
+
+def test_play_random_games_keeps_finished_boards():
+    boards = encode_boards([["X", "X", "X", "O", "O", " ", " ", " ", " "]])
+    winners = play_random_games(boards, O, 3)
+    assert winners.tolist() == [X]
+    assert boards[0].tolist() == [X, X, X, O, O, 0, 0, 0, 0]
+
+
+def test_simulate():
+    # X to move with two in a row and O unable to stop every random line
+    wins, draws, losses = simulate(["X", "X", " ", "O", "O", " ", " ", " ", " "], "X", 3, 400,
+                                   np.random.default_rng(1))
+    assert wins + draws + losses == 400
+    assert wins > losses
+
+    # Random 3x3 games from the empty board favour the first player
+    wins, draws, losses = simulate([" "] * 9, "X", 3, 4000, np.random.default_rng(2))
+    assert wins > losses > draws
+
+
+def test_mcts_with_batched_rollouts():
+    random.seed(5)
+    board = ["X", " ", " ",
+             " ", " ", " ",
+             " ", " ", " "]
+    assert get_mcts_move(board, "O", 3, playouts=20000, rollout_batch=64) == 4
+
+
+def test_play_random_games_win_length():
+    boards = np.zeros((50, 49), dtype=np.int8)
+    winners = play_random_games(boards, X, 7, np.random.default_rng(3), win_length=4)
+    for board, winner in zip(boards, winners):
+        decoded = [" XO"[code] for code in board]
+        # Games stop at the first win, so only the winner can own a line
+        assert check_winner(decoded, "X", 7, 4) == (winner == X)
+        assert check_winner(decoded, "O", 7, 4) == (winner == O)
@@ -0,0 +1,60 @@
+import sys
+import os
+
+# Tambahkan direktori root ke path Python agar bisa import modul board
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from search_stats import SearchStats
+from ai_strategies import get_minimax_move, get_mcts_move
+
+
+def test_record_expansion_counts_cutoffs_by_depth():
+    stats = SearchStats()
+    stats.record_expansion(2, 3, True)
+    stats.record_expansion(2, 1, True)
+    stats.record_expansion(1, 4, False)
+    assert stats.cutoffs == 2
+    assert stats.cutoffs_by_depth == {2: 2}
+    assert stats.branching_factor() == 8 / 3
+
+
+def test_minimax_fills_stats():
+    stats = SearchStats()
+    board = ["X", " ", " ", " ", "O", " ", " ", " ", " "]
+    move = get_minimax_move(board, "X", 3, stats=stats)
+    assert move == get_minimax_move(board, "X", 3)  # Counting does not change the result
+    assert stats.nodes > 1
+    assert stats.cutoffs == sum(stats.cutoffs_by_depth.values())
+    assert stats.max_depth == 4  # max_depth=3 searches 4 plies below the root
+    assert stats.completed_depth == 4
+    assert stats.evaluations > 0
+    assert stats.elapsed > 0
+    assert stats.branching_factor() > 1
+
+
+def test_minimax_stats_with_time_limit():
+    stats = SearchStats()
+    get_minimax_move([" "] * 9, "X", 3, time_limit=5, stats=stats)
+    assert stats.completed_depth is not None
+    assert stats.terminal_hits > 0
+    assert stats.cache_hits > 0
+
+
+def test_mcts_fills_stats():
+    stats = SearchStats()
+    get_mcts_move([" "] * 9, "X", 3, playouts=200, stats=stats)
+    assert stats.playouts == 200
+    assert stats.nodes >= 200
+    assert stats.max_depth >= 1
+    assert stats.children >= stats.expanded > 0
+
+
+def test_reset_and_as_dict():
+    stats = SearchStats()
+    get_minimax_move([" "] * 9, "O", 3, stats=stats)
+    counters = stats.as_dict()
+    assert counters["nodes"] == stats.nodes
+    assert "branching_factor" in counters
+    assert "nodes" in str(stats)
+    stats.reset()
+    assert stats.nodes == 0 and stats.cutoffs_by_depth == {} and stats.completed_depth is None
@@ -0,0 +1,155 @@
+import sys
+import os
+
+# Tambahkan direktori root ke path Python agar bisa import modul board
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from server import GameServer, MAX_LINE
+
+
+def run_with_server(scenario, **options):
+    """Runs `scenario(server, connect)` against a server on a free local port."""
+
+    async def main():
+        server = GameServer(executor=ThreadPoolExecutor(2), **options)
+        listener = await server.start("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+
+        async def connect():
+            reader, writer = await asyncio.open_connection("127.0.0.1", port, limit=MAX_LINE * 2)
+
+            async def send(message):
+                line = message if isinstance(message, bytes) else json.dumps(message).encode()
+                writer.write(line + b"\n")
+                await writer.drain()
+                return json.loads(await reader.readline())
+
+            return send, writer
+
+        try:
+            await scenario(server, connect)
+        finally:
+            await server.close()
+
+    asyncio.run(main())
+
+
+def test_play_full_game():
+    async def scenario(server, connect):
+        send, writer = await connect()
+        state = await send({"op": "new", "strategy": "minimax", "size": 3, "first": "O"})
+        assert state["ok"] and state["to_move"] == "X"
+        assert state["board"].count("O") == 1
+        assert state["board"][state["computer_move"]] == "O"
+        session = state["session"]
+        while not state["finished"]:
+            cell = state["board"].index(" ")
+            state = await send({"op": "move", "session": session, "cell": cell})
+            assert state["ok"]
+        # Perfect play from the solved table never loses
+        assert state["winner"] in ("O", None)
+        current = await send({"op": "state", "session": session})
+        assert current["board"] == state["board"] and current["finished"]
+        reply = await send({"op": "move", "session": session, "cell": 0})
+        assert reply == {"ok": False, "error": "The game is over."}
+        assert (await send({"op": "close", "session": session}))["closed"]
+        writer.close()
+
+    run_with_server(scenario)
+
+
+def test_invalid_requests():
+    async def scenario(server, connect):
+        send, writer = await connect()
+        assert (await send(b"not json"))["error"] == "Invalid JSON."
+        assert not (await send({"op": "jump"}))["ok"]
+        assert not (await send({"op": "new", "size": 2}))["ok"]
+        assert not (await send({"op": "new", "strategy": "cheat"}))["ok"]
+        assert not (await send({"op": "new", "size": 5, "win_length": 6}))["ok"]
+        state = await send({"op": "new", "size": 4, "first": "X"})
+        session = state["session"]
+        assert not (await send({"op": "move", "session": session, "cell": 16}))["ok"]
+        assert (await send({"op": "move", "session": session, "cell": 5}))["ok"]
+        reply = await send({"op": "move", "session": session, "cell": 5})
+        assert reply == {"ok": False, "error": "Cell 5 is already taken."}
+        assert not (await send({"op": "state", "session": "missing"}))["ok"]
+        assert not (await send({"op": "state", "session": [1]}))["ok"]
+        assert not (await send({"op": "close", "session": {"id": session}}))["ok"]
+        assert not (await send({"op": ["new"]}))["ok"]
+        assert not (await send([{"op": "new"}]))["ok"]
+        # The connection survives and still owns its game
+        assert (await send({"op": "state", "session": session}))["ok"]
+        writer.close()
+
+    run_with_server(scenario)
+
+
+def test_sessions_are_capped_and_owned_by_their_connection():
+    async def scenario(server, connect):
+        send, writer = await connect()
+        other_send, other_writer = await connect()
+        first = await send({"op": "new", "size": 3, "first": "X"})
+        assert (await send({"op": "new", "size": 3, "first": "X"}))["ok"]
+        reply = await other_send({"op": "new", "size": 3, "first": "X"})
+        assert reply["error"].startswith("Session limit reached")
+        # Another connection cannot see or close the game
+        assert not (await other_send({"op": "close", "session": first["session"]}))["ok"]
+        assert (await send({"op": "close", "session": first["session"]}))["ok"]
+        assert (await other_send({"op": "new", "size": 3, "first": "X"}))["ok"]
+        # Disconnecting closes the games the connection left open
+        writer.close()
+        await writer.wait_closed()
+        for _ in range(100):
+            if len(server.sessions) == 1:
+                break
+            await asyncio.sleep(0.01)
+        assert len(server.sessions) == 1
+        other_writer.close()
+
+    run_with_server(scenario, max_sessions=2)
+
+
+def test_failed_computer_moves_are_reported():
+    async def scenario(server, connect):
+        send, writer = await connect()
+        state = await send({"op": "new", "size": 3, "first": "X"})
+        session = state["session"]
+        server.executor.shutdown()
+        reply = await send({"op": "move", "session": session, "cell": 4})
+        assert not reply["ok"] and reply["error"].startswith("The computer could not move")
+        # The move is taken back, so the client can retry it
+        state = await send({"op": "state", "session": session})
+        assert state["board"] == [" "] * 9 and state["to_move"] == "X"
+        # A game the computer cannot open is not kept
+        assert not (await send({"op": "new", "size": 3, "first": "O"}))["ok"]
+        assert list(server.sessions) == [session]
+        writer.close()
+
+    run_with_server(scenario)
+
+
+def test_request_too_long():
+    async def scenario(server, connect):
+        send, writer = await connect()
+        reply = await send(b'{"op": "new", "pad": "' + b"x" * MAX_LINE + b'"}')
+        assert reply == {"ok": False, "error": "Request too long."}
+        writer.close()
+
+    run_with_server(scenario)
+
+
+def test_pending_moves_are_bounded():
+    async def scenario(server, connect):
+        clients = [await connect() for _ in range(6)]
+        states = await asyncio.gather(
+            *(send({"op": "new", "strategy": "mcts", "size": 4, "first": "O"}) for send, _ in clients)
+        )
+        assert all(state["ok"] and state["board"].count("O") == 1 for state in states)
+        assert server.pending._value == 1
+        for _, writer in clients:
+            writer.close()
+
+    run_with_server(scenario, max_pending=1)
@@ -0,0 +1,75 @@
+import sys
+import os
+
+# Tambahkan direktori root ke path Python agar bisa import modul board
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from solved_table import (
+    DEFAULT_PATH,
+    DRAW,
+    LOSS,
+    TABLE_SIZE,
+    WIN,
+    build_table,
+    get_solved_move,
+    load_table,
+    position_index,
+    probe_solved,
+    write_table,
+)
+from moves import get_computer_move
+
+
+def test_committed_table_matches_solver():
+    with open(DEFAULT_PATH, "rb") as handle:
+        assert handle.read() == bytes(build_table())
+
+
+def test_position_index_is_unique_per_player():
+    board = ["X", "O", " ", " ", " ", " ", " ", " ", " "]
+    assert position_index(board, "X") != position_index(board, "O")
+    assert position_index([" "] * 9, "X") == 0
+    assert position_index(["O"] * 9, "O") == TABLE_SIZE - 1
+
+
+def test_probe_empty_board_is_draw():
+    assert probe_solved([" "] * 9, "X", 3)[0] == DRAW
+    assert probe_solved([" "] * 9, "O", 3)[0] == DRAW
+
+
+def test_probe_takes_fastest_win():
+    # X can win at once on cell 2, or more slowly elsewhere
+    board = ["X", "X", " ", "O", "O", " ", " ", " ", " "]
+    assert probe_solved(board, "X", 3) == (WIN, 2)
+
+
+def test_probe_blocks_and_reports_loss():
+    # O must block cell 2
+    board = ["X", "X", " ", " ", "O", " ", " ", " ", " "]
+    assert get_solved_move(board, "O", 3) == 2
+    # X has two threats, so O to move is lost
+    board = ["X", "X", " ", "X", "O", " ", " ", " ", "O"]
+    assert probe_solved(board, "O", 3)[0] == LOSS
+
+
+def test_probe_unavailable():
+    assert probe_solved([" "] * 16, "X", 4) is None
+    # X has three stones more than O: this position cannot arise in a game
+    assert probe_solved(["X", "X", "X", " ", " ", " ", " ", " ", " "], "O", 3) is None
+    assert probe_solved([" "] * 9, "X", 3, path="missing/solved_3x3.bin") is None
+
+
+def test_write_and_load_table(tmp_path):
+    path = str(tmp_path / "solved.bin")
+    write_table(path)
+    assert len(load_table(path)) == TABLE_SIZE
+    assert probe_solved([" "] * 9, "X", 3, path) == probe_solved([" "] * 9, "X", 3)
+
+
+def test_computer_minimax_move_uses_table(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("3x3 moves should not be searched")
+
+    monkeypatch.setattr("moves.get_minimax_move", fail)
+    board = ["X", "X", " ", " ", "O", " ", " ", " ", " "]
+    assert get_computer_move(board, "minimax", "O", 3) == 2
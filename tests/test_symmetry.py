@@ -0,0 +1,83 @@
+import sys
+import os
+
+# Tambahkan direktori root ke path Python agar bisa import modul board
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from symmetry import (
+    get_symmetries,
+    get_inverse_symmetries,
+    transform_board,
+    canonical_board,
+    symmetric_hashes,
+    canonical_key,
+    to_canonical_move,
+    from_canonical_move,
+    unique_moves,
+)
+from transposition import zobrist_hash
+
+
+def test_get_symmetries():
+    symmetries = get_symmetries(3)
+    assert len(symmetries) == 8
+    assert symmetries[0] == tuple(range(9))
+    assert len(set(symmetries)) == 8
+    # Every symmetry keeps the center of an odd board in place
+    assert all(permutation[4] == 4 for permutation in symmetries)
+    # Corners only map onto corners
+    assert all(
+        permutation[0] in [0, 2, 6, 8] for permutation in symmetries
+    )
+
+
+def test_inverse_symmetries():
+    for size in [3, 4]:
+        for permutation, inverse in zip(get_symmetries(size), get_inverse_symmetries(size)):
+            assert all(inverse[permutation[cell]] == cell for cell in range(size * size))
+
+
+def test_canonical_board_matches_for_rotations():
+    board = ["X", " ", " ",
+             " ", "O", " ",
+             " ", " ", " "]
+    canonical, _ = canonical_board(board, 3)
+    for permutation in get_symmetries(3):
+        rotated = transform_board(board, permutation)
+        assert canonical_board(rotated, 3)[0] == canonical
+
+
+def test_symmetric_hashes_and_canonical_key():
+    board = [" "] * 16
+    board[1] = "X"
+    board[6] = "O"
+    hashes = symmetric_hashes(board, 4)
+    assert hashes[0] == zobrist_hash(board, 4)
+    for index, permutation in enumerate(get_symmetries(4)):
+        assert hashes[index] == zobrist_hash(transform_board(board, permutation), 4)
+
+    key, index = canonical_key(hashes)
+    rotated = transform_board(board, get_symmetries(4)[1])
+    assert canonical_key(symmetric_hashes(rotated, 4))[0] == key
+
+    # Moves map onto the canonical board and back again
+    move = 11
+    canonical_move = to_canonical_move(move, index, 4)
+    assert from_canonical_move(canonical_move, index, 4) == move
+
+
+def test_unique_moves():
+    # Empty 3x3 board: one corner, one edge and the center
+    assert unique_moves([" "] * 9, 3) == [0, 1, 4]
+
+    # Corner taken: the main diagonal is the only symmetry left
+    board = ["X", " ", " ",
+             " ", " ", " ",
+             " ", " ", " "]
+    assert unique_moves(board, 3) == [1, 2, 4, 5, 8]
+
+    # No symmetry: every empty cell is kept
+    board = ["X", "O", " ",
+             " ", " ", " ",
+             " ", " ", " "]
+    assert unique_moves(board, 3) == [2, 3, 4, 5, 6, 7, 8]
@@ -0,0 +1,100 @@
+import sys
+import os
+
+# Tambahkan direktori root ke path Python agar bisa import modul board
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import json
+import pytest
+import moves
+from move_cache import MoveCache
+from tournament import (
+    game_seed,
+    schedule,
+    percentile,
+    play_tournament_game,
+    run_tournament,
+    main,
+)
+
+
+def test_game_seed_is_deterministic():
+    assert game_seed(0, "random", "worst", 3, 5) == game_seed(0, "random", "worst", 3, 5)
+    assert game_seed(0, "random", "worst", 3, 5) != game_seed(0, "random", "worst", 3, 6)
+    assert game_seed(0, "random", "worst", 3, 5) != game_seed(1, "random", "worst", 3, 5)
+
+
+def test_schedule():
+    games = schedule(["random", "strategic", "worst"], [3, 4], 2, 0, None)
+    assert len(games) == 3 * 2 * 2  # Pairs x sizes x games
+    assert {(first, second) for first, second, *_ in games} == {
+        ("random", "strategic"), ("random", "worst"), ("strategic", "worst")
+    }
+
+
+def test_percentile():
+    values = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    assert percentile(values, 0.5) == 5
+    assert percentile(values, 0.9) == 9
+    assert percentile(values, 0.99) == 10
+    assert percentile([], 0.5) == 0.0
+
+
+def test_play_tournament_game_is_reproducible():
+    game = ("random", "worst", 3, 0, 1234, None)
+    assert play_tournament_game(game)[:4] == play_tournament_game(game)[:4]
+    first, second, size, score, move_times = play_tournament_game(game)
+    assert score in [0, 0.5, 1]
+    assert {strategy for strategy, _ in move_times} <= {"random", "worst"}
+
+
+def test_run_tournament_in_process():
+    summary = run_tournament(["random", "strategic"], [3], 6, processes=1, seed=3)
+    assert summary["games"] == 6
+    row = summary["pairings"][0]
+    assert row["wins"] + row["draws"] + row["losses"] == 6
+    assert row["win_rate"] + row["draw_rate"] + row["loss_rate"] == pytest.approx(1)
+    assert set(summary["latency"]) == {"random", "strategic"}
+    assert summary["latency"]["random"]["p50_ms"] <= summary["latency"]["random"]["max_ms"]
+
+
+def test_tournament_games_replay_in_any_order(monkeypatch):
+    played = []
+    get_computer_move = moves.get_computer_move
+
+    def recording_move(*args, **kwargs):
+        move = get_computer_move(*args, **kwargs)
+        played.append(move)
+        return move
+
+    monkeypatch.setattr(moves, "get_computer_move", recording_move)
+
+    def play(games):
+        monkeypatch.setattr(moves, "move_cache", MoveCache())  # As in a fresh process
+        sequences = {}
+        for game in games:
+            played.clear()
+            play_tournament_game(game)
+            sequences[game[:4]] = list(played)
+        return sequences
+
+    # Minimax keeps its search state within a game, which must not leak into other games
+    games = schedule(["random", "minimax"], [4], 4, 0, None)
+    assert play(games) == play(games[::-1])
+
+
+def test_run_tournament_pool_matches_in_process():
+    in_process = run_tournament(["random", "worst"], [3], 8, processes=1, seed=7)
+    pooled = run_tournament(["random", "worst"], [3], 8, processes=2, seed=7)
+    assert pooled["pairings"] == in_process["pairings"]
+
+
+def test_main_writes_json(tmp_path, capsys):
+    path = tmp_path / "summary.json"
+    main(["--strategies", "random", "strategic", "--games", "2", "--processes", "1",
+          "--json", str(path)])
+    assert "games/s" in capsys.readouterr().out
+    assert json.loads(path.read_text())["games"] == 2
+
+    with pytest.raises(SystemExit):
+        main(["--strategies", "random"])
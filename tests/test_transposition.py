@@ -0,0 +1,96 @@
+import sys
+import os
+
+# Tambahkan direktori root ke path Python agar bisa import modul board
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pytest
+from transposition import (
+    EXACT,
+    LOWER,
+    UPPER,
+    TranspositionTable,
+    get_zobrist_table,
+    zobrist_hash,
+)
+from ai_strategies import get_minimax_move
+
+
+def test_zobrist_hash_is_order_independent():
+    board1 = [" "] * 9
+    board1[0] = "X"
+    board1[4] = "O"
+    board2 = [" "] * 9
+    board2[4] = "O"
+    board2[0] = "X"
+    assert zobrist_hash(board1, 3) == zobrist_hash(board2, 3)
+    assert zobrist_hash([" "] * 9, 3) == 0
+
+    table = get_zobrist_table(3)
+    assert zobrist_hash(board1, 3) == table["X"][0] ^ table["O"][4]
+
+
+def test_zobrist_table_is_stable():
+    # Keys depend only on the board size so hashes match across processes
+    assert get_zobrist_table(4) is get_zobrist_table(4)
+    assert get_zobrist_table(3)["X"] != get_zobrist_table(3)["O"]
+    assert len(get_zobrist_table(4)["X"]) == 16
+
+
+def test_transposition_table_probe_and_store():
+    table = TranspositionTable(capacity=8)
+    assert table.probe(42) is None
+    table.store(42, 3, 10, EXACT, 4)
+    assert table.probe(42) == (42, 3, 10, EXACT, 4)
+    assert table.hits == 1
+    assert table.misses == 1
+    assert table.hit_rate() == 0.5
+
+
+def test_transposition_table_replacement():
+    table = TranspositionTable(capacity=8)
+    table.store(1, 5, 10, LOWER)
+    # Colliding shallower result does not evict the deeper one
+    table.store(9, 2, -10, UPPER)
+    assert table.probe(1) is not None
+    assert table.probe(9) is None
+    # Deeper or equal result replaces it
+    table.store(9, 5, 0, EXACT)
+    assert table.probe(9) == (9, 5, 0, EXACT, None)
+    assert table.probe(1) is None
+
+    table.clear()
+    assert table.probe(9) is None
+    assert table.hits == 0
+
+    with pytest.raises(ValueError):
+        TranspositionTable(capacity=0)
+
+
+def test_transposition_table_new_search_ages_entries():
+    table = TranspositionTable(capacity=8)
+    table.store(1, 5, 10, LOWER, 2)
+    table.new_search()
+    # An entry from an earlier search stays readable...
+    assert table.probe(1) == (1, 5, 10, LOWER, 2)
+    # ...but a colliding shallower result of this search replaces it
+    table.store(9, 1, 0, EXACT)
+    assert table.probe(9) == (9, 1, 0, EXACT, None)
+    assert table.probe(1) is None
+    # Within one search depth-preferred replacement applies again
+    table.store(1, 0, 0, UPPER)
+    assert table.probe(9) is not None
+
+    table.clear()
+    assert table.generation == 0
+
+
+def test_get_minimax_move_uses_table():
+    table = TranspositionTable()
+    board = ["X", " ", " ",
+             " ", " ", " ",
+             " ", " ", " "]
+    move = get_minimax_move(board, "O", 3, table=table)
+    assert move in [1, 3, 4, 5]
+    assert table.stores > 0
+    assert table.hits > 0
@@ -0,0 +1,187 @@
+"""
+Headless self-play tournament between computer strategies.
+
+Usage: python tournament.py [--strategies NAME ...] [--sizes N ...] [--games N]
+                            [--processes N] [--seed N] [--time-limit SECONDS]
+                            [--json PATH]
+
+Every pair of strategies plays `--games` games on every board size. X always
+moves first and the two strategies take turns playing X. Games are spread over
+a process pool, and each one seeds the random module from the tournament seed
+and its own coordinates, so a game's result does not depend on which worker
+plays it or in what order. (With --time-limit, how deep a search gets depends on
+machine load, so only untimed tournaments replay move for move.)
+"""
+import argparse
+import itertools
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from moves import play_headless_game
+
+STRATEGIES = ["random", "strategic", "minimax", "mcts", "worst"]
+
+
+def game_seed(seed, first, second, size, index):
+    """Derives the deterministic seed of one game from the tournament seed and the game's coordinates."""
+    return random.Random(f"{seed}:{first}:{second}:{size}:{index}").getrandbits(32)
+
+
+def play_tournament_game(game):
+    """
+    Plays one scheduled game and returns its result.
+
+    `game` is a (first, second, size, index, seed, time_limit) tuple; `first` plays X in
+    even-numbered games and O in odd ones. Returns (first, second, size, score, move_times),
+    where score is 1, 0.5 or 0 from the first strategy's point of view and move_times lists
+    (strategy, seconds) for every move.
+    """
+    first, second, size, index, seed, time_limit = game
+    random.seed(seed)
+    if index % 2 == 0:
+        strategies = {"X": first, "O": second}
+    else:
+        strategies = {"X": second, "O": first}
+    winner, move_times = play_headless_game(strategies, size, "X", time_limit)
+    if winner is None:
+        score = 0.5
+    else:
+        score = 1 if strategies[winner] == first else 0
+    return first, second, size, score, [(strategies[player], seconds) for player, seconds in move_times]
+
+
+def schedule(strategies, sizes, games, seed, time_limit):
+    """Returns the list of games for every pair of strategies on every board size."""
+    return [
+        (first, second, size, index, game_seed(seed, first, second, size, index), time_limit)
+        for size in sizes
+        for first, second in itertools.combinations(strategies, 2)
+        for index in range(games)
+    ]
+
+
+def percentile(values, fraction):
+    """Returns the value below which the given fraction of the sorted values fall (nearest rank)."""
+    if not values:
+        return 0.0
+    rank = max(int(round(fraction * len(values))) - 1, 0)
+    return values[min(rank, len(values) - 1)]
+
+
+def summarize(results, elapsed):
+    """Aggregates game results into per-pairing rates and per-strategy move latency percentiles."""
+    pairings = {}
+    latencies = {}
+    moves = 0
+    for first, second, size, score, move_times in results:
+        stats = pairings.setdefault(
+            (first, second, size), {"games": 0, "wins": 0, "draws": 0, "losses": 0}
+        )
+        stats["games"] += 1
+        if score == 1:
+            stats["wins"] += 1
+        elif score == 0:
+            stats["losses"] += 1
+        else:
+            stats["draws"] += 1
+        for strategy, seconds in move_times:
+            latencies.setdefault(strategy, []).append(seconds)
+        moves += len(move_times)
+
+    summary = {"games": len(results), "moves": moves, "elapsed": elapsed}
+    summary["games_per_second"] = len(results) / elapsed if elapsed else 0.0
+    summary["pairings"] = [
+        {
+            "first": first,
+            "second": second,
+            "size": size,
+            **stats,
+            "win_rate": stats["wins"] / stats["games"],
+            "draw_rate": stats["draws"] / stats["games"],
+            "loss_rate": stats["losses"] / stats["games"],
+        }
+        for (first, second, size), stats in sorted(pairings.items())
+    ]
+    summary["latency"] = {}
+    for strategy, values in sorted(latencies.items()):
+        values.sort()
+        summary["latency"][strategy] = {
+            "moves": len(values),
+            "p50_ms": percentile(values, 0.50) * 1000,
+            "p90_ms": percentile(values, 0.90) * 1000,
+            "p99_ms": percentile(values, 0.99) * 1000,
+            "max_ms": values[-1] * 1000,
+        }
+    return summary
+
+
+def run_tournament(strategies, sizes, games, processes=None, seed=0, time_limit=None):
+    """
+    Plays the whole tournament and returns its summary.
+
+    With `processes` set to 1 the games run in this process; otherwise they are spread
+    over a process pool of that many workers (all cores when None).
+    """
+    scheduled = schedule(strategies, sizes, games, seed, time_limit)
+    start = time.perf_counter()
+    if processes == 1:
+        results = [play_tournament_game(game) for game in scheduled]
+    else:
+        workers = processes or os.cpu_count() or 1
+        chunk = max(len(scheduled) // (4 * workers), 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(play_tournament_game, scheduled, chunksize=chunk))
+    return summarize(results, time.perf_counter() - start)
+
+
+def print_summary(summary):
+    """Prints the tournament summary as tables."""
+    print(f"{'first':>10} {'second':>10} {'size':>4} {'games':>6} {'win':>6} {'draw':>6} {'loss':>6}")
+    for row in summary["pairings"]:
+        print(
+            f"{row['first']:>10} {row['second']:>10} {row['size']:>4} {row['games']:>6} "
+            f"{row['win_rate']:>6.1%} {row['draw_rate']:>6.1%} {row['loss_rate']:>6.1%}"
+        )
+    print()
+    print(f"{'strategy':>10} {'moves':>7} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for strategy, row in summary["latency"].items():
+        print(
+            f"{strategy:>10} {row['moves']:>7} {row['p50_ms']:>8.2f} {row['p90_ms']:>8.2f} "
+            f"{row['p99_ms']:>8.2f} {row['max_ms']:>8.2f}"
+        )
+    print()
+    print(
+        f"{summary['games']} games, {summary['moves']} moves in {summary['elapsed']:.2f}s "
+        f"({summary['games_per_second']:.1f} games/s)"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play computer strategies against each other.")
+    parser.add_argument("--strategies", nargs="+", choices=STRATEGIES, default=STRATEGIES)
+    parser.add_argument("--sizes", nargs="+", type=int, default=[3])
+    parser.add_argument("--games", type=int, default=100, help="games per pairing and size")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--time-limit", type=float, default=None, help="per-move budget in seconds")
+    parser.add_argument("--json", help="also write the summary to this JSON file")
+    args = parser.parse_args(argv)
+    if len(args.strategies) < 2:
+        parser.error("at least two strategies are needed")
+    if any(size < 3 for size in args.sizes):
+        parser.error("board sizes must be at least 3")
+
+    summary = run_tournament(
+        args.strategies, args.sizes, args.games, args.processes, args.seed, args.time_limit
+    )
+    print_summary(summary)
+    if args.json:
+        with open(args.json, "w") as handle:
+            json.dump(summary, handle, indent=2)
+
+
+if __name__ == "__main__":
+    main()
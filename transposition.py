@@ -0,0 +1,112 @@
+import random
+
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+DEFAULT_CAPACITY = 1 << 16
+
+_ZOBRIST = {}
+
+
+def get_zobrist_table(size):
+    """
+    Returns the Zobrist keys for a board of the given size.
+
+    The table maps "X" and "O" to one random 64-bit key per cell, and "turn" to a
+    key per (player to move, searching player) pair. Keys are drawn from a generator
+    seeded with the board size so hashes are identical across runs and processes.
+    """
+    table = _ZOBRIST.get(size)
+    if table is None:
+        rng = random.Random(size)
+        table = {
+            "X": tuple(rng.getrandbits(64) for _ in range(size * size)),
+            "O": tuple(rng.getrandbits(64) for _ in range(size * size)),
+            "turn": {
+                (mover, player): rng.getrandbits(64)
+                for mover in ("X", "O")
+                for player in ("X", "O")
+            },
+        }
+        _ZOBRIST[size] = table
+    return table
+
+
+def zobrist_hash(board, size):
+    """Computes the Zobrist hash of the stones on a list board."""
+    table = get_zobrist_table(size)
+    key = 0
+    for cell, player in enumerate(board):
+        if player != " ":
+            key ^= table[player][cell]
+    return key
+
+
+class TranspositionTable:
+    """
+    Fixed-size table of search results keyed by Zobrist hash.
+
+    Each slot holds a `(key, depth, score, flag, move)` tuple, where `depth` is the
+    remaining search depth the score was computed with and `flag` tells whether the
+    score is EXACT, a LOWER bound or an UPPER bound. Positions share a slot when
+    their keys collide modulo the capacity; the slot is overwritten when it holds
+    the same position or a result searched no deeper than the new one
+    (depth-preferred replacement), or a result stored before the last call to
+    new_search(), so a table kept from move to move does not fill up with deep
+    results from positions the game has left behind.
+    """
+
+    __slots__ = ("capacity", "slots", "ages", "generation", "hits", "misses", "stores")
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        if capacity < 1:
+            raise ValueError("Transposition table capacity must be at least 1.")
+        self.capacity = capacity
+        self.slots = [None] * capacity
+        self.ages = [0] * capacity  # The generation each slot was stored in
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    def probe(self, key):
+        """Returns the stored entry for the key, or None if the position is not cached."""
+        entry = self.slots[key % self.capacity]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return None
+
+    def store(self, key, depth, score, flag, move=None):
+        """Stores a search result, keeping a deeper result for a colliding position."""
+        index = key % self.capacity
+        entry = self.slots[index]
+        if (
+            entry is None
+            or entry[0] == key
+            or depth >= entry[1]
+            or self.ages[index] != self.generation
+        ):
+            self.slots[index] = (key, depth, score, flag, move)
+            self.ages[index] = self.generation
+            self.stores += 1
+
+    def new_search(self):
+        """Starts a new generation; entries from earlier ones stay readable but give way to new ones."""
+        self.generation += 1
+
+    def clear(self):
+        """Drops every entry and resets the counters."""
+        self.slots = [None] * self.capacity
+        self.ages = [0] * self.capacity
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    def hit_rate(self):
+        """Returns the fraction of probes that found their position."""
+        probes = self.hits + self.misses
+        return self.hits / probes if probes else 0.0